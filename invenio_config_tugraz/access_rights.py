@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Registry of the access rights in ``restrictions/access_right``.
+
+The CSVs are parsed and validated once, at application startup, into an
+immutable registry. It's available to templates as ``tugraz_access_rights``
+and to services via :func:`access_rights`:
+
+.. code-block:: python
+
+    access_rights().open.name
+    access_rights()["embargoed"].icon
+    [right.id for right in access_rights().limit]
+"""
+
+import csv
+from collections.abc import Iterator, Mapping
+from functools import cache
+from importlib.resources import files
+from types import MappingProxyType
+from typing import NamedTuple
+
+ACCESS_RIGHTS_CSV = "restrictions/access_right/access_right.csv"
+ACCESS_RIGHTS_LIMIT_CSV = "restrictions/access_right/access_right_limit.csv"
+
+COLUMNS = ("access_right", "access_right_name", "icon", "notes")
+REQUIRED_COLUMNS = ("access_right", "access_right_name")
+
+
+class AccessRight(NamedTuple):
+    """An access right."""
+
+    id: str
+    name: str
+    icon: str = ""
+    notes: str = ""
+
+
+class AccessRightsError(ValueError):
+    """Invalid access rights file."""
+
+
+def parse_access_rights(path: str, text: str) -> tuple[AccessRight, ...]:
+    """Parse and validate the rows of an access rights CSV.
+
+    Whitespace around values is stripped, missing optional values at the end
+    of a row (e.g. ``notes``) are empty.
+    """
+    reader = csv.DictReader(
+        text.splitlines(),
+        restkey="unexpected",
+        restval="",
+        skipinitialspace=True,
+    )
+    if tuple(reader.fieldnames or ()) != COLUMNS:
+        msg = f"{path}: expected the columns {COLUMNS}, got {reader.fieldnames}"
+        raise AccessRightsError(msg)
+
+    rights = {}
+    for row in reader:
+        line = f"{path}:{reader.line_num}"
+        if "unexpected" in row:
+            msg = f"{line}: more values than columns"
+            raise AccessRightsError(msg)
+
+        values = {column: (row[column] or "").strip() for column in COLUMNS}
+        if missing := [column for column in REQUIRED_COLUMNS if not values[column]]:
+            msg = f"{line}: missing {', '.join(missing)}"
+            raise AccessRightsError(msg)
+
+        right = AccessRight(*values.values())
+        if not right.id.isidentifier():
+            msg = f"{line}: invalid access right id {right.id!r}"
+            raise AccessRightsError(msg)
+        if right.id in rights:
+            msg = f"{line}: duplicate access right {right.id!r}"
+            raise AccessRightsError(msg)
+        rights[right.id] = right
+
+    return tuple(rights.values())
+
+
+class AccessRights(Mapping[str, AccessRight]):
+    """Immutable registry of the access rights, by id."""
+
+    def __init__(
+        self,
+        rights: tuple[AccessRight, ...],
+        limit: tuple[AccessRight, ...] = (),
+    ) -> None:
+        """Construct, `limit` being the rights selectable in limited contexts."""
+        self._rights = MappingProxyType({right.id: right for right in rights})
+        if unknown := [right.id for right in limit if right not in rights]:
+            msg = f"limited access rights differ from the access rights: {unknown}"
+            raise AccessRightsError(msg)
+        self.limit = limit
+
+    def __getitem__(self, id_: str) -> AccessRight:
+        """Return the access right with the id."""
+        return self._rights[id_]
+
+    def __getattr__(self, id_: str) -> AccessRight:
+        """Return the access right with the id, enum style."""
+        if id_.startswith("_"):
+            raise AttributeError(id_)
+        try:
+            return self._rights[id_]
+        except KeyError:
+            raise AttributeError(id_) from None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the ids, in file order."""
+        return iter(self._rights)
+
+    def __len__(self) -> int:
+        """Return the number of access rights."""
+        return len(self._rights)
+
+
+@cache
+def access_rights() -> AccessRights:
+    """Return the registry, parsed at the first call."""
+    package = files(__package__)
+    return AccessRights(
+        parse_access_rights(
+            ACCESS_RIGHTS_CSV,
+            package.joinpath(ACCESS_RIGHTS_CSV).read_text(encoding="utf-8"),
+        ),
+        parse_access_rights(
+            ACCESS_RIGHTS_LIMIT_CSV,
+            package.joinpath(ACCESS_RIGHTS_LIMIT_CSV).read_text(encoding="utf-8"),
+        ),
+    )
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Create DOI registration queue table."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2e8f4b6a1c73"
+down_revision = "7a1c3e5b9d20"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+    op.create_table(
+        "tugraz_doi_registration",
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.Column("updated", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("doi", sa.String(length=255), nullable=False),
+        sa.Column("recid", sa.String(length=255), nullable=False),
+        sa.Column("parent", sa.Boolean(), nullable=False),
+        sa.Column("status", sa.CHAR(1), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_tugraz_doi_registration")),
+        sa.UniqueConstraint("doi", name=op.f("uq_tugraz_doi_registration_doi")),
+    )
+    op.create_index(
+        op.f("ix_tugraz_doi_registration_status"),
+        "tugraz_doi_registration",
+        ["status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database."""
+    op.drop_index(
+        op.f("ix_tugraz_doi_registration_status"),
+        table_name="tugraz_doi_registration",
+    )
+    op.drop_table("tugraz_doi_registration")
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Create curation queue table."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4d7a2c9e6b31"
+down_revision = "9b2e6d4a8f15"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+    op.create_table(
+        "tugraz_curation_queue",
+        sa.Column(
+            "request_id",
+            sqlalchemy_utils.types.uuid.UUIDType(),
+            nullable=False,
+        ),
+        sa.Column("number", sa.String(length=50), nullable=True),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("topic", sa.String(length=64), nullable=True),
+        sa.Column("created_by", sa.String(length=64), nullable=True),
+        sa.Column("assignee", sa.String(length=64), nullable=True),
+        sa.Column("created", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "request_id",
+            name=op.f("pk_tugraz_curation_queue"),
+        ),
+    )
+    op.create_index(
+        "ix_tugraz_curation_queue_status_created",
+        "tugraz_curation_queue",
+        ["status", "created"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tugraz_curation_queue_assignee_created",
+        "tugraz_curation_queue",
+        ["assignee", "created"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database."""
+    op.drop_index(
+        "ix_tugraz_curation_queue_assignee_created",
+        table_name="tugraz_curation_queue",
+    )
+    op.drop_index(
+        "ix_tugraz_curation_queue_status_created",
+        table_name="tugraz_curation_queue",
+    )
+    op.drop_table("tugraz_curation_queue")
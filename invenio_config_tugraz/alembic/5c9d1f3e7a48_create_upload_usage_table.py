@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Create upload usage table."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5c9d1f3e7a48"
+down_revision = "2e8f4b6a1c73"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+    op.create_table(
+        "tugraz_upload_usage",
+        sa.Column("owner_type", sa.String(length=8), nullable=False),
+        sa.Column("owner_id", sa.String(length=64), nullable=False),
+        sa.Column("files", sa.Integer(), nullable=False),
+        sa.Column("bytes", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "owner_type",
+            "owner_id",
+            name=op.f("pk_tugraz_upload_usage"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database."""
+    op.drop_table("tugraz_upload_usage")
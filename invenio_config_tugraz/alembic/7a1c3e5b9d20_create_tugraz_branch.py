@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Create invenio-config-tugraz branch."""
+
+# revision identifiers, used by Alembic.
+revision = "7a1c3e5b9d20"
+down_revision = None
+branch_labels = ("invenio_config_tugraz",)
+depends_on = "dbdbc1b19cf2"
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+
+
+def downgrade() -> None:
+    """Downgrade database."""
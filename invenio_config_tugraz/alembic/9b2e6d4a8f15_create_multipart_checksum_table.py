@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Create multipart checksum table."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b2e6d4a8f15"
+down_revision = "5c9d1f3e7a48"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+    op.create_table(
+        "tugraz_multipart_checksum",
+        sa.Column("file_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=False),
+        sa.Column("part", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("checksum", sa.String(length=32), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "file_id",
+            "part",
+            name=op.f("pk_tugraz_multipart_checksum"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database."""
+    op.drop_table("tugraz_multipart_checksum")
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Command line interface of TU Graz Repo."""
+
+from pathlib import Path
+
+import click
+from flask.cli import with_appcontext
+from invenio_db import db
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.records.api import RDMRecord
+from invenio_requests.records.models import RequestMetadata
+from sqlalchemy import text
+
+from .datacite import export_datacite
+from .doi import mint_doi, queue_doi_registration, register_doi_batch
+from .models import DOIRegistrationStatus
+from .oai import oai_search, record_sets
+from .quota import reconcile_usage
+from .requests.queue import curation_queue, rebuild_curation_queue
+from .requests.timeline import compact_timeline
+from .utils import search_after_pages
+
+
+@click.group()
+def tugraz() -> None:
+    """TU Graz repository commands."""
+
+
+@tugraz.command("db-pool")
+@with_appcontext
+def db_pool() -> None:
+    """Show the live state of the database connections.
+
+    The connections per state are read from the database, thus cover all web
+    and celery workers. The pools of the web workers are exposed by the
+    ``db-pool-metrics`` route, see ``CONFIG_TUGRAZ_DB_POOL_METRICS``.
+    """
+    with db.engine.connect() as connection:
+        max_connections = connection.execute(text("SHOW max_connections")).scalar()
+        states = connection.execute(
+            text(
+                "SELECT coalesce(state, 'background'), count(*) "
+                "FROM pg_stat_activity WHERE datname = current_database() "
+                "GROUP BY 1 ORDER BY 2 DESC",
+            ),
+        ).all()
+
+        click.echo(f"max_connections: {max_connections}")
+        click.echo(f"connections to this database: {sum(n for _, n in states)}")
+        for state, count in states:
+            click.echo(f"  {state}: {count}")
+
+
+@tugraz.command("oai-sets")
+@click.option("--batch-size", default=500, show_default=True)
+@with_appcontext
+def oai_sets(batch_size: int) -> None:
+    """Precompute the OAI set membership of all records.
+
+    Fills the cache of the OAI-PMH fast path, so that the first full harvest
+    after a deployment or after changing sets doesn't percolate every page.
+    """
+    count = 0
+    for response in search_after_pages(oai_search(), size=batch_size):
+        hits = response["hits"]["hits"]
+        record_sets([hit["_source"] for hit in hits])
+        count += len(hits)
+    click.echo(f"cached the sets of {count} records")
+
+
+@tugraz.command("datacite-export")
+@click.argument("output", type=click.Path(dir_okay=False, path_type=Path))
+@click.option("--batch-size", default=500, show_default=True)
+@click.option("--processes", default=2, show_default=True)
+@click.option("--resume", is_flag=True, help="Continue an interrupted export.")
+@with_appcontext
+def datacite_export(
+    output: Path,
+    batch_size: int,
+    processes: int,
+    *,
+    resume: bool,
+) -> None:
+    """Export all published records as gzipped DataCite XML to OUTPUT."""
+    checkpoint = export_datacite(output, batch_size, processes, resume=resume)
+    click.echo(f"exported {checkpoint.count} records to {output}")
+    for id_ in checkpoint.failed:
+        click.secho(f"  failed to serialize {id_}", fg="red")
+    for id_ in checkpoint.skipped:
+        click.secho(f"  skipped {id_}, it has no DOI", fg="yellow")
+
+
+@tugraz.command("doi-queue")
+@click.argument("recids", nargs=-1, required=True)
+@click.option("--mint", is_flag=True, help="Create DOIs for records without one.")
+@click.option("--parent", is_flag=True, help="Queue the concept DOIs instead.")
+@with_appcontext
+def doi_queue(recids: tuple[str, ...], *, mint: bool, parent: bool) -> None:
+    """Queue the DataCite DOIs of published records for registration."""
+    for recid in recids:
+        record = RDMRecord.pid.resolve(recid)
+        pids = record.parent.pids if parent else record.pids
+        doi = pids.get("doi", {})
+        if doi.get("provider") == "datacite":
+            identifier = doi["identifier"]
+        elif mint and not doi and not parent:
+            identifier = mint_doi(record)
+            current_rdm_records_service.indexer.index(record)
+        else:
+            click.secho(f"{recid} has no DataCite DOI", fg="yellow")
+            continue
+
+        queue_doi_registration(recid, identifier, parent=parent)
+        click.echo(f"queued {identifier}")
+
+    db.session.commit()
+
+
+@tugraz.command("doi-register")
+@click.option("--batch-size", default=100, show_default=True)
+@with_appcontext
+def doi_register(batch_size: int) -> None:
+    """Register the queued DOIs with DataCite."""
+    while statuses := register_doi_batch(batch_size):
+        click.echo(", ".join(f"{s.name.lower()}: {n}" for s, n in statuses.items()))
+        if set(statuses) == {DOIRegistrationStatus.QUEUED}:
+            click.secho("no progress, DataCite seems unavailable", fg="red")
+            break
+
+
+@tugraz.command("upload-usage")
+@click.option("--fix", is_flag=True, help="Correct the drifted counters.")
+@with_appcontext
+def upload_usage(*, fix: bool) -> None:
+    """Compare the upload usage counters with the drafts' files."""
+    drifts = reconcile_usage(fix=fix)
+    for (owner_type, owner_id), (counted, actual) in sorted(drifts.items()):
+        click.echo(
+            f"{owner_type} {owner_id}: counted {counted.files} files/{counted.bytes} bytes, "
+            f"actual {actual.files} files/{actual.bytes} bytes",
+        )
+    click.echo(f"{len(drifts)} counters {'fixed' if fix else 'drifted'}")
+
+
+@tugraz.command("curation-queue")
+@click.option("--rebuild", is_flag=True, help="Fill the queue from the requests.")
+@with_appcontext
+def curation_queue_(*, rebuild: bool) -> None:
+    """Show the length of the curation queue, or rebuild it."""
+    if rebuild:
+        click.echo(f"{rebuild_curation_queue()} open curation requests queued")
+        return
+    total, _entries = curation_queue(size=0)
+    click.echo(f"{total} open curation requests queued")
+
+
+@tugraz.command("timeline-compact")
+@click.argument("request_ids", nargs=-1)
+@click.option(
+    "--all",
+    "all_",
+    is_flag=True,
+    help="Compact the timelines of all requests.",
+)
+@with_appcontext
+def timeline_compact(request_ids: tuple[str, ...], *, all_: bool) -> None:
+    """Fold the consecutive automatic comments in request timelines."""
+    if all_:
+        request_ids = [str(id_) for (id_,) in db.session.query(RequestMetadata.id)]
+    folded = sum(compact_timeline(request_id) for request_id in request_ids)
+    click.echo(f"{folded} comments folded in {len(request_ids)} timelines")
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2025 Graz University of Technology.
+# Copyright (C) 2025-2026 Graz University of Technology.
 #
 # invenio-config-tugraz is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
@@ -8,15 +8,419 @@
 
 """Override specific components for TU Graz Repo."""
 
+from functools import partial
+
+from flask import current_app
+from flask_principal import Identity
+from invenio_cache import current_cache
 from invenio_curations.services.components import CurationComponent
+from invenio_db.uow import ModelCommitOp
+from invenio_drafts_resources.services.records.components import ServiceComponent
+from invenio_rdm_records.records.api import RDMDraft, RDMRecord
 from invenio_rdm_records.services.components import (
     DefaultRecordsComponents as RDMDefaultRecordsComponents,
 )
+from invenio_rdm_records.services.components import (
+    ParentPIDsComponent,
+    PIDsComponent,
+)
+from invenio_rdm_records.services.pids.tasks import register_or_update_pid
+from invenio_records_resources.records.api import FileRecord
+from invenio_records_resources.services.files.components import (
+    FileMultipartContentComponent,
+    FileServiceComponent,
+)
+from invenio_records_resources.services.files.config import FileServiceConfig
+from invenio_records_resources.services.files.tasks import (
+    recompute_multipart_checksum_task,
+)
+from invenio_records_resources.services.files.transfer import MULTIPART_TRANSFER_TYPE
+from invenio_records_resources.services.uow import Operation, TaskOp, UnitOfWork
+from invenio_search.engine import dsl
+
+from .doi import queue_doi_registration
+from .permissions.identities import prefetch_parent_needs
+from .multipart import (
+    HashingStream,
+    combined_checksum,
+    delete_part_checksums,
+    store_part_checksum,
+)
+from .quota import add_draft_usage, check_quota, release_draft_usage
+from .tasks import (
+    post_commit_cache_key,
+    run_post_commit_side_effects,
+    schedule_doi_registration,
+)
+from .utils import with_hits_hook
+
+
+class PostCommitSideEffectsOp(Operation):
+    """Queue a record's side effects once the transaction has been committed.
+
+    Side effects of the same record are deduplicated: as long as a task for the
+    record is waiting in the queue, further commits don't queue another one.
+    The task is delayed by ``CONFIG_TUGRAZ_POST_COMMIT_WINDOW`` seconds, so that
+    bursts of draft updates are batched into one run.
+    """
+
+    def __init__(self, recid: str) -> None:
+        """Construct."""
+        self.recid = recid
+
+    def on_post_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Send the celery task, unless one is already queued for the record."""
+        window = current_app.config["CONFIG_TUGRAZ_POST_COMMIT_WINDOW"]
+
+        # `add` only succeeds if the key doesn't exist yet, which makes it
+        # the deduplication primitive across workers
+        queued = current_cache.add(
+            post_commit_cache_key(self.recid),
+            value=True,
+            timeout=window * 2,
+        )
+        if queued:
+            run_post_commit_side_effects.apply_async(
+                args=[self.recid],
+                countdown=window,
+            )
+
+
+class PostCommitSideEffectsComponent(ServiceComponent):
+    """Move non-critical side effects of records out of the request.
+
+    Side effects are configured via ``CONFIG_TUGRAZ_POST_COMMIT_SIDE_EFFECTS``
+    and run in a celery task after the database transaction was committed.
+    """
+
+    def _register(self, record: RDMDraft | RDMRecord | None) -> None:
+        if record is None or not current_app.config.get(
+            "CONFIG_TUGRAZ_POST_COMMIT_SIDE_EFFECTS",
+        ):
+            return
+
+        self.uow.register(PostCommitSideEffectsOp(record.pid.pid_value))
+
+    def update_draft(
+        self,
+        identity: Identity,  # noqa: ARG002
+        data: dict | None = None,  # noqa: ARG002
+        record: RDMDraft | None = None,
+        **kwargs: dict,  # noqa: ARG002
+    ) -> None:
+        """Queue side effects of the updated draft."""
+        self._register(record)
+
+    def publish(
+        self,
+        identity: Identity,  # noqa: ARG002
+        draft: RDMDraft | None = None,  # noqa: ARG002
+        record: RDMRecord | None = None,
+        **kwargs: dict,  # noqa: ARG002
+    ) -> None:
+        """Queue side effects of the published record."""
+        self._register(record)
+
+
+class BulkDOIRegistrationOp(Operation):
+    """Start the bulk DOI registration once the transaction has been committed.
+
+    Like ``PostCommitSideEffectsOp``, only one task is queued at a time; it
+    is delayed by ``CONFIG_TUGRAZ_BULK_DOI_WINDOW`` seconds so that it finds
+    the DOIs of many publishes in the queue.
+    """
+
+    def on_post_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Send the celery task, unless one is already queued."""
+        schedule_doi_registration(current_app.config["CONFIG_TUGRAZ_BULK_DOI_WINDOW"])
+
+
+class _HeldTaskOps:
+    """Unit of work which holds back the tasks registered with it."""
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        """Construct."""
+        self.uow = uow
+        self.tasks = []
+
+    def register(self, op: Operation) -> None:
+        """Hold back tasks, register other operations."""
+        if isinstance(op, TaskOp):
+            self.tasks.append(op)
+        else:
+            self.uow.register(op)
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate to the unit of work."""
+        return getattr(self.uow, name)
+
+
+class BulkDOIRegistrationMixin:
+    """Queue the DataCite DOIs of published records for bulk registration.
+
+    The PIDs components register a ``register_or_update_pid`` task per PID
+    they publish. With ``CONFIG_TUGRAZ_BULK_DOI_REGISTRATION``, those tasks
+    are held back: DataCite DOIs are queued instead, the other PIDs get their
+    task as usual.
+    """
+
+    parent = False
+
+    def publish(
+        self,
+        identity: Identity,
+        draft: RDMDraft | None = None,
+        record: RDMRecord | None = None,
+        **kwargs: dict,
+    ) -> None:
+        """Queue the DOIs instead of registering them one by one."""
+        if record is None or not current_app.config.get(
+            "CONFIG_TUGRAZ_BULK_DOI_REGISTRATION",
+        ):
+            super().publish(identity, draft=draft, record=record, **kwargs)
+            return
 
-TUGRAZ_RDM_RECORDS_SERVICE_COMPONENTS = RDMDefaultRecordsComponents + [
+        uow = self.uow
+        self.uow = held = _HeldTaskOps(uow)
+        try:
+            super().publish(identity, draft=draft, record=record, **kwargs)
+        finally:
+            self.uow = uow
+        if not held.tasks:
+            return
+
+        queued = False
+        pids = record.parent.pids if self.parent else record.pids
+        for scheme, pid in pids.items():
+            if scheme == "doi" and pid.get("provider") == "datacite":
+                queue_doi_registration(
+                    record["id"],
+                    pid["identifier"],
+                    parent=self.parent,
+                )
+                queued = True
+            else:
+                uow.register(
+                    TaskOp(
+                        register_or_update_pid,
+                        recid=record["id"],
+                        scheme=scheme,
+                        parent=self.parent,
+                    ),
+                )
+
+        if queued:
+            uow.register(BulkDOIRegistrationOp())
+
+
+class BulkDOIPIDsComponent(BulkDOIRegistrationMixin, PIDsComponent):
+    """PIDs component queueing the record's DataCite DOI."""
+
+
+class BulkDOIParentPIDsComponent(BulkDOIRegistrationMixin, ParentPIDsComponent):
+    """Parent PIDs component queueing the parent's DataCite DOI."""
+
+    parent = True
+
+
+class UploadUsageComponent(FileServiceComponent):
+    """Count the files committed to drafts, and check the upload quota."""
+
+    def init_files(
+        self,
+        identity: Identity,  # noqa: ARG002
+        id_: str,  # noqa: ARG002
+        record: RDMDraft,
+        data: list[dict],
+    ) -> None:
+        """Check the quota, with the sizes the upload announces."""
+        size = sum(file.get("size") or 0 for file in data)
+        check_quota(record, len(data), size)
+
+    def commit_file(
+        self,
+        identity: Identity,  # noqa: ARG002
+        id_: str,  # noqa: ARG002
+        file_key: str,
+        record: RDMDraft,
+    ) -> None:
+        """Add the committed file to the usage."""
+        file_record = record.files[file_key]
+        if file_record.has_content:
+            add_draft_usage(record, 1, file_record.object_version.file.size)
+
+    def delete_file(
+        self,
+        identity: Identity,  # noqa: ARG002
+        id_: str,  # noqa: ARG002
+        file_key: str,  # noqa: ARG002
+        record: RDMDraft,
+        deleted_file: FileRecord,
+    ) -> None:
+        """Subtract the deleted file from the usage."""
+        if deleted_file is not None and deleted_file.has_content:
+            add_draft_usage(record, -1, -deleted_file.object_version.file.size)
+
+    def delete_all_files(
+        self,
+        identity: Identity,
+        id_: str,
+        record: RDMDraft,
+        results: list[FileRecord],
+    ) -> None:
+        """Subtract the deleted files from the usage."""
+        for deleted_file in results:
+            self.delete_file(identity, id_, deleted_file.key, record, deleted_file)
+
+
+class MultipartChecksumComponent(FileMultipartContentComponent):
+    """Hash the parts of multipart uploads as they arrive.
+
+    Replaces ``FileMultipartContentComponent``. At commit, the part checksums
+    become the file's checksum, so that it isn't computed by reading the
+    whole file again.
+    """
+
+    def set_multipart_file_content(  # noqa: PLR0913, PLR0917
+        self,
+        identity: Identity,
+        id_: str,
+        file_key: str,
+        part: int,
+        stream: object,
+        content_length: int,
+        record: RDMDraft,
+    ) -> None:
+        """Write the part, and store its checksum."""
+        hashing_stream = HashingStream(stream)
+        super().set_multipart_file_content(
+            identity,
+            id_,
+            file_key,
+            part,
+            hashing_stream,
+            content_length,
+            record,
+        )
+        if hashing_stream.bytes_read == content_length:
+            file_instance = record.files[file_key].object_version.file
+            store_part_checksum(
+                file_instance.id,
+                int(part),
+                hashing_stream.md5.hexdigest(),
+            )
+
+    def commit_file(
+        self,
+        identity: Identity,  # noqa: ARG002
+        id_: str,  # noqa: ARG002
+        file_key: str,
+        record: RDMDraft,
+    ) -> None:
+        """Set the file's checksum from the part checksums."""
+        file_record = record.files.get(file_key)
+        if (
+            file_record is None
+            or file_record.transfer.transfer_type != MULTIPART_TRANSFER_TYPE
+        ):
+            return
+
+        file_instance = file_record.object_version.file
+        metadata = file_record.transfer["multipart_metadata"]
+        checksum = combined_checksum(
+            file_instance.id,
+            int(metadata["parts"]),
+            metadata["part_size"],
+        )
+        delete_part_checksums(file_instance.id)
+        if checksum is None or file_instance.checksum:
+            return
+
+        file_instance.checksum = checksum
+        self.uow.register(ModelCommitOp(file_instance))
+        if checksum.startswith("multipart:") and current_app.config.get(
+            "CONFIG_TUGRAZ_MULTIPART_FULL_CHECKSUM",
+        ):
+            self.uow.register(
+                TaskOp(recompute_multipart_checksum_task, str(file_instance.id)),
+            )
+
+
+class UploadUsageRecordComponent(ServiceComponent):
+    """Release the usage of drafts once they are published or discarded."""
+
+    def publish(
+        self,
+        identity: Identity,  # noqa: ARG002
+        draft: RDMDraft | None = None,
+        record: RDMRecord | None = None,  # noqa: ARG002
+        **kwargs: dict,  # noqa: ARG002
+    ) -> None:
+        """Release the usage of the published draft."""
+        if draft is not None:
+            release_draft_usage(draft)
+
+    def delete_draft(
+        self,
+        identity: Identity,  # noqa: ARG002
+        draft: RDMDraft | None = None,
+        record: RDMRecord | None = None,  # noqa: ARG002
+        **kwargs: dict,  # noqa: ARG002
+    ) -> None:
+        """Release the usage of the discarded draft."""
+        if draft is not None:
+            release_draft_usage(draft)
+
+
+class ParentNeedsPrefetchComponent(ServiceComponent):
+    """Load the needs which the parents of a search's hits grant the identity.
+
+    With one query per page, instead of one per hit as the permissions of the
+    hits are checked, see ``.permissions.identities``.
+    """
+
+    def search(
+        self,
+        identity: Identity,
+        search: dsl.Search,
+        params: dict,  # noqa: ARG002
+        **kwargs: dict,  # noqa: ARG002
+    ) -> dsl.Search:
+        """Load them along with the response."""
+        return with_hits_hook(search, partial(prefetch_parent_needs, identity))
+
+    search_drafts = search
+
+
+TUGRAZ_RDM_RECORDS_SERVICE_COMPONENTS = [
+    *(
+        {
+            PIDsComponent: BulkDOIPIDsComponent,
+            ParentPIDsComponent: BulkDOIParentPIDsComponent,
+        }.get(component, component)
+        for component in RDMDefaultRecordsComponents
+    ),
     CurationComponent,
+    PostCommitSideEffectsComponent,
+    UploadUsageRecordComponent,
+    ParentNeedsPrefetchComponent,
 ]
 """TU Graz default RDM record components.
 
 To use: append in invenio.cfg TUGRAZ_RDM_RECORDS_SERVICE_COMPONENTS to other needed components.
 """
+
+TUGRAZ_RDM_DRAFT_FILES_SERVICE_COMPONENTS = [
+    # first, to set the checksum before the transfer is committed
+    MultipartChecksumComponent,
+    *(
+        component
+        for component in FileServiceConfig.components
+        if component is not FileMultipartContentComponent
+    ),
+    UploadUsageComponent,
+]
+"""TU Graz draft files components.
+
+To use: set RDM_DRAFT_FILES_SERVICE_COMPONENTS to it in invenio.cfg.
+"""
@@ -9,6 +9,8 @@
 """invenio module that adds tugraz configs."""
 
 from invenio_i18n import gettext as _
+from werkzeug.local import LocalProxy
+from werkzeug.utils import import_string
 
 CONFIG_TUGRAZ_SHIBBOLETH = False
 """Set True if SAML is configured"""
@@ -38,6 +40,7 @@ CONFIG_TUGRAZ_ROUTES = {
     "accessibility": "/accessibility",
     "file-formats": "/file-formats",
     "curations": "/curations",
+    "db-pool-metrics": "/metrics/db-pool",
 }
 """Defined routes for TUG."""
 
@@ -70,6 +73,20 @@ APP_DEFAULT_SECURE_HEADERS = {
     "strict_transport_security_preload": False,
 }
 
+CONFIG_TUGRAZ_PRECOMPUTED_SECURE_HEADERS = True
+"""Serialize ``APP_DEFAULT_SECURE_HEADERS`` once, rather than per response.
+
+CSP nonces (``content_security_policy_nonce_in``) are still per request.
+"""
+
+CONFIG_TUGRAZ_SECURE_HEADERS_PER_MIMETYPE = {}
+"""Headers added or overridden per response content type.
+
+CONFIG_TUGRAZ_SECURE_HEADERS_PER_MIMETYPE = {
+    "application/json": {"Content-Security-Policy": "default-src 'none'"},
+}
+"""
+
 # Invenio-I18N
 # ============
 # See https://invenio-i18n.readthedocs.io/en/latest/configuration.html
@@ -79,6 +96,20 @@ BABEL_DEFAULT_TIMEZONE = "Europe/Vienna"
 # Other supported languages (do not include BABEL_DEFAULT_LOCALE in list).
 I18N_LANGUAGES = [("de", _("German"))]
 
+CONFIG_TUGRAZ_PRELOAD_TRANSLATIONS = True
+"""Load the translation catalogs of all languages when the app is created.
+
+Otherwise they are loaded on the first request needing them, per worker.
+"""
+
+CONFIG_TUGRAZ_PRELOAD_GC_FREEZE = False
+"""Freeze the garbage collector after the translations were preloaded.
+
+Enable when running gunicorn with ``--preload``, so that workers share the
+memory pages of everything loaded at startup (copy-on-write) instead of
+copying them as soon as the garbage collector touches the objects.
+"""
+
 # Invenio-Mail
 # ===========
 # See https://invenio-mail.readthedocs.io/en/latest/configuration.html
@@ -99,6 +130,38 @@ MAIL_SUPPRESS_SEND = True
 Set this to False when sending actual emails.
 """
 
+CONFIG_TUGRAZ_MAIL_POOL_SIZE = 0
+"""Number of SMTP connections kept open per process, 0 to disable the pool.
+
+If set, messages are sent over pooled, persistent connections instead of
+opening a new connection per message, e.g. 4. Only worthwhile if the SMTP
+server keeps idle connections open for a while.
+"""
+
+CONFIG_TUGRAZ_MAIL_POOL_RETRIES = 3
+"""Retries of a message after the SMTP connection broke down."""
+
+CONFIG_TUGRAZ_MAIL_POOL_BACKOFF = 0.5
+"""Seconds to wait before the first retry, doubled on each further retry."""
+
+CONFIG_TUGRAZ_NOTIFICATIONS_DIGEST_WINDOW = 15 * 60
+"""Seconds notifications are collected per recipient before sent as a digest.
+
+Only applies when ``NOTIFICATIONS_BACKENDS`` is set to
+``TUGRAZ_NOTIFICATIONS_BACKENDS``.
+"""
+
+CONFIG_TUGRAZ_NOTIFICATIONS_DIGEST_MAX_ATTEMPTS = 5
+"""Failed deliveries of a digest, e.g. as the mail server is down, before it is dropped.
+
+Digests refused for good by the mail server (5xx replies) are dropped at once.
+"""
+
+CONFIG_TUGRAZ_NOTIFICATIONS_DIGEST_SUBJECT = _(
+    "TU Graz Repository: summary of your notifications",
+)
+"""Email subject of notification digests containing more than one entry."""
+
 # CORS - Cross-origin resource sharing
 # ===========
 # Uncomment to enable the CORS
@@ -253,6 +316,35 @@ to be configured with your DataCite data center symbol.
 This is only required if you want your records to be harvestable in DataCite XML format.
 """
 
+CONFIG_TUGRAZ_BULK_DOI_REGISTRATION = False
+"""Queue the DataCite DOIs of published records for bulk registration.
+
+Meant for mass publishing, e.g. migrations: instead of a celery task per
+record, ``BulkDOIRegistrationMixin`` queues the DOIs in the database and
+``register_queued_dois`` registers them in concurrent batches.
+"""
+
+CONFIG_TUGRAZ_BULK_DOI_BATCH_SIZE = 100
+"""DOIs registered per batch, and per database transaction."""
+
+CONFIG_TUGRAZ_BULK_DOI_CONCURRENCY = 8
+"""Maximum of concurrent requests to the DataCite API."""
+
+CONFIG_TUGRAZ_BULK_DOI_RETRIES = 3
+"""Retries of transient DataCite errors within a batch, with backoff."""
+
+CONFIG_TUGRAZ_BULK_DOI_MAX_ATTEMPTS = 5
+"""Batches a DOI is attempted in before it is marked as failed."""
+
+CONFIG_TUGRAZ_BULK_DOI_WINDOW = 30
+"""Seconds to wait after a publish before the queued DOIs are registered."""
+
+CONFIG_TUGRAZ_BULK_DOI_RETRY_DELAY = 10 * 60
+"""Seconds to wait before DOIs are tried again, after a batch made no progress."""
+
+CONFIG_TUGRAZ_DATACITE_API_URL = None
+"""DataCite REST API, defaults to the test or production API per ``DATACITE_TEST_MODE``."""
+
 # Invenio-app-rdm
 # =========================
 # See https://github.com/inveniosoftware/invenio-app-rdm/blob/master/invenio_app_rdm/config.py
@@ -289,6 +381,28 @@ APP_RDM_DEPOSIT_FORM_QUOTA = {
 }
 """Deposit file upload quota """
 
+CONFIG_TUGRAZ_UPLOAD_USER_QUOTA = None
+"""Bytes a user may have uploaded to all their drafts, unlimited if None.
+
+Checked by ``UploadUsageComponent`` together with ``APP_RDM_DEPOSIT_FORM_QUOTA``.
+"""
+
+CONFIG_TUGRAZ_MULTIPART_FULL_CHECKSUM = False
+"""Compute the whole file MD5 of multipart uploads in the background.
+
+``MultipartChecksumComponent`` sets the combined checksum of the parts at
+commit, ``multipart:<md5 of the parts' md5s>-<parts>-<part size>``. It's
+hashed from the parts as they are written, so it doesn't verify what ended
+up in the storage, and it can't be compared to the ``md5:`` checksum of the
+same file uploaded in one part.
+
+If enabled, a celery task replaces it by the file's ``md5:`` checksum, like
+invenio-records-resources does without the component. Disabled by default,
+as that task reads the whole file again, which is the very cost the
+component saves. Enable it if checksums are compared across files, e.g. for
+fixity checks or deduplication.
+"""
+
 SQLALCHEMY_ECHO = False
 """Enable to see all SQL queries."""
 
@@ -349,8 +463,59 @@ reopened regularly.
     )
 
 See https://docs.sqlalchemy.org/en/latest/core/engines.html.
+
+Instead of aligning ``pool_size`` and ``max_overflow`` by hand, set
+``CONFIG_TUGRAZ_DB_MAX_CONNECTIONS`` or use
+:func:`invenio_config_tugraz.db.compute_pool_options`.
+"""
+
+CONFIG_TUGRAZ_DB_MAX_CONNECTIONS = None
+"""Database ``max_connections`` budget shared by all web and celery workers.
+
+When set, ``pool_size`` and ``max_overflow`` of ``SQLALCHEMY_ENGINE_OPTIONS``
+are computed from it and the worker topology, unless set explicitly.
+"""
+
+CONFIG_TUGRAZ_DB_RESERVED_CONNECTIONS = 5
+"""Connections of the budget kept free, e.g. for migrations and admin sessions."""
+
+CONFIG_TUGRAZ_DB_WEB_PROCESSES = None
+"""Number of web worker processes, detected from uWSGI/gunicorn if not set."""
+
+CONFIG_TUGRAZ_DB_WEB_THREADS = None
+"""Threads per web worker process, detected from uWSGI/gunicorn if not set."""
+
+CONFIG_TUGRAZ_DB_POOL_METRICS = False
+"""Collect connection pool metrics and expose them for Prometheus.
+
+Metrics are collected per process, each scrape of the ``db-pool-metrics``
+route answers with the metrics of the worker handling it (labeled by pid).
+The route requires ``CONFIG_TUGRAZ_METRICS_TOKEN``.
+
+Checkout wait times and overflows are only measured by the ``TimedQueuePool``
+set up via ``CONFIG_TUGRAZ_DB_MAX_CONNECTIONS`` (or ``compute_pool_options``),
+and left out with other pools.
+"""
+
+CONFIG_TUGRAZ_METRICS_TOKEN = None
+"""Bearer token required to read the metrics routes.
+
+Unless it's set, the metrics routes deny all requests.
 """
 
+CONFIG_TUGRAZ_SQL_TRACKER = False
+"""Count the SQL queries and database time of each request.
+
+Adds a ``Server-Timing`` header to each response and logs requests exceeding
+the query budget or repeating a statement, see ``sql_tracker``.
+"""
+
+CONFIG_TUGRAZ_SQL_TRACKER_QUERY_BUDGET = 50
+"""Requests executing more queries are logged with their endpoint."""
+
+CONFIG_TUGRAZ_SQL_TRACKER_REPEAT_THRESHOLD = 10
+"""Statements executed more often per request are logged as N+1 suspects."""
+
 # Redis (cache)
 # ========
 # Cache or Redis configurations
@@ -360,6 +525,30 @@ RATELIMIT_AUTHENTICATED_USER = "25000 per hour;1000 per minute"
 RATELIMIT_GUEST_USER = "5000 per hour;500 per minute"
 """Increase defaults for guest users."""
 
+CONFIG_TUGRAZ_RATELIMIT_TUGRAZ_AUTHENTICATED_USER = "50000 per hour;2000 per minute"
+"""Limit for users with the ``tugraz_authenticated`` role."""
+
+CONFIG_TUGRAZ_RATELIMIT_CAMPUS_GUEST = "25000 per hour;1000 per minute"
+"""Limit for guests within ``CONFIG_TUGRAZ_IP_NETWORK``, e.g. harvesters."""
+
+RATELIMIT_APPLICATION = LocalProxy(
+    lambda: import_string("invenio_config_tugraz.limiter.tiered_rate_limit"),
+)
+"""Rate limit per tier, see ``invenio_config_tugraz.limiter``.
+
+A proxy, so that the limiter is only imported once the limit is evaluated.
+"""
+
+RATELIMIT_KEY_FUNC = "invenio_config_tugraz.limiter.tiered_rate_limit_key"
+"""Separate rate limit buckets per tier."""
+
+RATELIMIT_STRATEGY = "sliding-window-counter"
+"""Rate limiting strategy.
+
+With ``RATELIMIT_STORAGE_URI = "tugraz+redis://..."``, most hits are served
+from tokens leased into process memory, see ``LeasingRedisStorage``.
+"""
+
 SESSION_COOKIE_SAMESITE = "Strict"
 """Sets cookie with the samesite flag to 'Strict' by default."""
 
@@ -379,5 +568,54 @@ OAISERVER_ADMIN_EMAILS = [
 It **must** include one or more instances.
 """
 
+CONFIG_TUGRAZ_OAI_FAST_PATH = True
+"""Answer ListRecords and ListIdentifiers via the OAI-PMH fast path.
+
+Resumption tokens use ``search_after`` cursors, set membership and payloads
+are cached per record revision, see ``invenio_config_tugraz.oai``.
+"""
+
+CONFIG_TUGRAZ_OAI_CACHED_FORMATS = ["oai_dc", "oai_datacite", "oai_datacite4"]
+"""Metadata formats whose payloads are cached per record revision."""
+
+CONFIG_TUGRAZ_OAI_CACHE_TIMEOUT = 7 * 24 * 60 * 60
+"""Seconds the payloads and set memberships stay cached."""
+
+CONFIG_TUGRAZ_OAI_TIEBREAKER = "uuid"
+"""Unique field sorting records with the same update time."""
+
+CONFIG_TUGRAZ_REQUESTS_FACETS_CACHE_TIMEOUT = 5 * 60
+"""Seconds the aggregations of a requests search stay cached.
+
+Transitions of requests invalidate them, this bounds the delay until other
+changes, e.g. a request's reindexing, are counted.
+"""
+
 CURATIONS_ENABLE_REQUEST_COMMENTS = True
 """Enable/Disable curations automatic comments creation for the repository."""
+
+CONFIG_TUGRAZ_REQUESTS_TIMELINE_COMPACTION_WINDOW = 60
+"""Seconds to wait before the automatic comments of a request are folded.
+
+The comments of all draft saves within this window are folded in one run.
+"""
+
+CONFIG_TUGRAZ_REQUESTS_TIMELINE_SNAPSHOT_TIMEOUT = 7 * 24 * 60 * 60
+"""Seconds the timeline snapshot of a request stays in Redis after its last rebuild."""
+
+CONFIG_TUGRAZ_POST_COMMIT_SIDE_EFFECTS = []
+"""Non-critical side effects of records, run after the transaction commit.
+
+Each entry is a callable (or its import string) taking the record's id. They
+are run by ``PostCommitSideEffectsComponent`` in a celery task, so that
+publishing and draft updates don't wait for them.
+
+INVENIO_CONFIG_TUGRAZ_POST_COMMIT_SIDE_EFFECTS =
+    ["my_site.side_effects:refresh_custom_fields"]
+"""
+
+CONFIG_TUGRAZ_POST_COMMIT_WINDOW = 10
+"""Seconds to wait before the side effects of a record are run.
+
+Commits of the same record within this window are batched into one run.
+"""
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Streaming export of all records as DataCite XML.
+
+The records are read page by page with ``search_after``, serialized in a
+process pool and appended to one gzip file as they come, so memory stays
+constant however large the catalogue is. Each page is written as its own
+gzip member (concatenated members decompress as one stream), followed by a
+checkpoint, so an interrupted export resumes after the last complete page.
+Records without a DOI are skipped, and listed after the export.
+
+.. code-block:: console
+
+    $ invenio tugraz datacite-export datacite.xml.gz --processes 4
+    $ invenio tugraz datacite-export datacite.xml.gz --resume
+"""
+
+import gzip
+import json
+import multiprocessing
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Self
+
+from datacite import schema45
+from flask import Flask, current_app
+from invenio_app.factory import create_api
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.resources.serializers import DataCite45XMLSerializer
+from invenio_search import RecordsSearch
+from lxml import etree
+
+from .utils import search_after_pages
+
+HEADER = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n'
+    b'<resources xmlns="http://datacite.org/schema/kernel-4">\n'
+)
+FOOTER = b"</resources>\n"
+
+_worker_app: Flask | None = None
+
+
+def has_doi(source: dict) -> bool:
+    """Whether the record's search document has a DOI."""
+    return bool(source.get("pids", {}).get("doi", {}).get("identifier"))
+
+
+def serialize_datacite(source: dict) -> bytes:
+    """Serialize a record's search document as DataCite XML ``<resource>``."""
+    data = DataCite45XMLSerializer().dump_obj(source)
+    return etree.tostring(schema45.dump_etree(data), encoding="UTF-8") + b"\n"
+
+
+def _init_worker() -> None:
+    global _worker_app  # noqa: PLW0603
+    _worker_app = create_api()
+    _worker_app.app_context().push()
+
+
+def _serialize_or_none(source: dict) -> bytes | None:
+    try:
+        return serialize_datacite(source)
+    except Exception:
+        current_app.logger.exception("serializing %s failed", source.get("id"))
+        return None
+
+
+@contextmanager
+def _mapper(processes: int) -> Iterator[Callable]:
+    if processes <= 1:
+        yield lambda func, items: list(map(func, items))
+        return
+
+    # spawned workers create their own app, not sharing db or search connections
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes, initializer=_init_worker) as pool:
+        yield lambda func, items: pool.map(func, items, chunksize=16)
+
+
+@dataclass
+class Checkpoint:
+    """Progress of an export, stored next to its output."""
+
+    path: Path
+    offset: int = 0
+    count: int = 0
+    failed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    """Ids of the records without a DOI."""
+    search_after: list | None = None
+
+    @classmethod
+    def for_output(cls, output: Path, *, resume: bool) -> Self:
+        """Load the output's checkpoint when resuming, or start anew."""
+        path = output.with_name(f"{output.name}.checkpoint")
+        if resume and path.exists():
+            return cls(path=path, **json.loads(path.read_text()))
+        return cls(path=path)
+
+    def save(self) -> None:
+        """Store the checkpoint atomically."""
+        data = {k: v for k, v in asdict(self).items() if k != "path"}
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        tmp.write_text(json.dumps(data))
+        tmp.replace(self.path)
+
+
+def write_member(stream: IO[bytes], data: bytes) -> None:
+    """Append a complete gzip member and flush it to disk."""
+    with gzip.GzipFile(fileobj=stream, mode="wb") as member:
+        member.write(data)
+    stream.flush()
+
+
+def datacite_search() -> RecordsSearch:
+    """Return the search of all published records, in a stable order."""
+    index = current_rdm_records_service.record_cls.index.search_alias
+    return (
+        RecordsSearch(index=index)
+        .filter("term", is_published=True)
+        .filter("term", deletion_status="P")
+        .sort({"created": "asc"}, {"uuid": "asc"})
+    )
+
+
+def export_datacite(
+    output: Path,
+    batch_size: int = 500,
+    processes: int = 2,
+    *,
+    resume: bool = False,
+) -> Checkpoint:
+    """Export all published records as one gzipped DataCite XML document."""
+    checkpoint = Checkpoint.for_output(output, resume=resume)
+
+    with output.open("r+b" if checkpoint.offset else "wb") as stream:
+        # drop whatever was written after the last checkpoint
+        stream.truncate(checkpoint.offset)
+        stream.seek(checkpoint.offset)
+        if not checkpoint.offset:
+            write_member(stream, HEADER)
+
+        with _mapper(processes) as map_:
+            pages = search_after_pages(
+                datacite_search(),
+                size=batch_size,
+                after=checkpoint.search_after,
+            )
+            for response in pages:
+                hits = response["hits"]["hits"]
+                if not hits:
+                    break
+
+                sources = [hit["_source"] for hit in hits]
+                skipped = [source["id"] for source in sources if not has_doi(source)]
+                if skipped:
+                    current_app.logger.warning(
+                        "skipping records without DOI: %s",
+                        ", ".join(skipped),
+                    )
+                sources = [source for source in sources if has_doi(source)]
+                resources = map_(_serialize_or_none, sources)
+                write_member(stream, b"".join(r for r in resources if r))
+
+                checkpoint.count += len(sources)
+                checkpoint.skipped += skipped
+                checkpoint.failed += [
+                    source["id"]
+                    for source, resource in zip(sources, resources, strict=True)
+                    if resource is None
+                ]
+                checkpoint.search_after = hits[-1]["sort"]
+                checkpoint.offset = stream.tell()
+                checkpoint.save()
+
+        write_member(stream, FOOTER)
+
+    checkpoint.path.unlink(missing_ok=True)
+    return checkpoint
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Database connection pool sizing and instrumentation.
+
+Every process (web worker or celery worker) has its own connection pool.
+The sum of all pools must stay below the database's ``max_connections``,
+while each pool should be large enough for the threads of its process.
+:func:`compute_pool_options` derives ``pool_size`` and ``max_overflow`` from
+this budget and the deployment's worker topology.
+
+To use, either set ``CONFIG_TUGRAZ_DB_MAX_CONNECTIONS`` (applied when this
+extension is initialized before invenio-db), or compute the options in
+invenio.cfg directly:
+
+.. code-block:: python
+
+    from invenio_config_tugraz.db import compute_pool_options
+
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_pre_ping": False,
+        "pool_recycle": 3600,
+        "pool_timeout": 10,
+        **compute_pool_options(max_connections=200, celery_concurrency=8),
+    }
+
+With ``CONFIG_TUGRAZ_DB_POOL_METRICS`` set, pool events are counted per
+process and exposed in the Prometheus text format, see :class:`PoolMetrics`.
+"""
+
+import os
+import shlex
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.pool import ConnectionPoolEntry, Pool, PoolProxiedConnection, QueuePool
+
+SLOW_CHECKOUT_SECONDS = 1
+"""Checkouts waiting longer than this for a connection are logged."""
+
+QUANTILES = (0.5, 0.9, 0.99)
+"""Quantiles reported for the latency metrics."""
+
+
+class PoolMetrics:
+    """Per-process counters and latency samples of the connection pools."""
+
+    counters = ("checkouts", "checkins", "overflows", "invalidations")
+
+    def __init__(self, samples: int = 1024) -> None:
+        """Construct, keeping the latest `samples` latencies."""
+        self._lock = threading.Lock()
+        self.samples = samples
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all metrics."""
+        with self._lock:
+            self.counts = dict.fromkeys(self.counters, 0)
+            self.latencies = {
+                "checkout_wait": deque(maxlen=self.samples),
+                "hold": deque(maxlen=self.samples),
+            }
+            self.sums = dict.fromkeys(self.latencies, 0.0)
+            self.observations = dict.fromkeys(self.latencies, 0)
+
+    def count(self, name: str) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self.counts[name] += 1
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a latency sample."""
+        with self._lock:
+            self.latencies[name].append(seconds)
+            self.sums[name] += seconds
+            self.observations[name] += 1
+
+    def quantiles(self, name: str) -> dict[float, float]:
+        """Return the quantiles of the latest latency samples."""
+        with self._lock:
+            samples = sorted(self.latencies[name])
+        if not samples:
+            return dict.fromkeys(QUANTILES, 0.0)
+        return {
+            q: samples[min(len(samples) - 1, int(q * len(samples)))] for q in QUANTILES
+        }
+
+    def to_prometheus(self, pool: Pool | None = None) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Overflows and checkout waits are only measured by ``TimedQueuePool``,
+        they are left out for other pools rather than reported as zero.
+        """
+        timed = isinstance(pool, TimedQueuePool)
+        labels = f'pid="{os.getpid()}"'
+        lines = []
+        for name in self.counters:
+            if name == "overflows" and not timed:
+                continue
+            metric = f"tugraz_db_pool_{name}_total"
+            lines += [
+                f"# TYPE {metric} counter",
+                f"{metric}{{{labels}}} {self.counts[name]}",
+            ]
+
+        for name in self.latencies:
+            if name == "checkout_wait" and not timed:
+                continue
+            metric = f"tugraz_db_pool_{name}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            lines += [
+                f'{metric}{{{labels},quantile="{q}"}} {value:.6f}'
+                for q, value in self.quantiles(name).items()
+            ]
+            lines.append(f"{metric}_sum{{{labels}}} {self.sums[name]:.6f}")
+            lines.append(f"{metric}_count{{{labels}}} {self.observations[name]}")
+
+        if isinstance(pool, QueuePool):
+            gauges = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(0, pool.overflow()),
+            }
+            for name, value in gauges.items():
+                metric = f"tugraz_db_pool_{name}"
+                lines += [f"# TYPE {metric} gauge", f"{metric}{{{labels}}} {value}"]
+
+        return "\n".join(lines) + "\n"
+
+
+pool_metrics = PoolMetrics()
+"""Metrics of this process, filled when ``CONFIG_TUGRAZ_DB_POOL_METRICS`` is set."""
+
+
+def _on_checkout(
+    dbapi_connection: object,  # noqa: ARG001
+    connection_record: ConnectionPoolEntry,
+    connection_proxy: PoolProxiedConnection,  # noqa: ARG001
+) -> None:
+    connection_record.info["tugraz_checkout"] = time.perf_counter()
+    pool_metrics.count("checkouts")
+
+
+def _on_checkin(
+    dbapi_connection: object,  # noqa: ARG001
+    connection_record: ConnectionPoolEntry,
+) -> None:
+    pool_metrics.count("checkins")
+    if (start := connection_record.info.pop("tugraz_checkout", None)) is not None:
+        pool_metrics.observe("hold", time.perf_counter() - start)
+
+
+def _on_invalidate(
+    dbapi_connection: object,  # noqa: ARG001
+    connection_record: ConnectionPoolEntry,  # noqa: ARG001
+    exception: BaseException | None,  # noqa: ARG001
+) -> None:
+    pool_metrics.count("invalidations")
+
+
+def init_pool_metrics(app: Flask) -> None:
+    """Attach the metrics' listeners to all connection pools of the process."""
+    if not app.config.get("CONFIG_TUGRAZ_DB_POOL_METRICS"):
+        return
+
+    for name, listener in (
+        ("checkout", _on_checkout),
+        ("checkin", _on_checkin),
+        ("invalidate", _on_invalidate),
+    ):
+        if not event.contains(Pool, name, listener):
+            event.listen(Pool, name, listener)
+
+
+class TimedQueuePool(QueuePool):
+    """Queue pool measuring how long checkouts wait for a free connection."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        overflowed = self.overflow() > 0
+        try:
+            return super()._do_get()
+        finally:
+            wait = time.perf_counter() - start
+            pool_metrics.observe("checkout_wait", wait)
+            # only the transitions, the current overflow is in the snapshot
+            if not overflowed and self.overflow() > 0:
+                pool_metrics.count("overflows")
+            if wait > SLOW_CHECKOUT_SECONDS and has_app_context():
+                current_app.logger.warning(
+                    "waited %.2fs for a database connection (%s)",
+                    wait,
+                    self.status(),
+                )
+
+
+@dataclass(frozen=True)
+class WorkerTopology:
+    """Processes and threads of a deployment sharing one database."""
+
+    web_processes: int = 1
+    web_threads: int = 1
+    celery_processes: int = 0
+
+
+def _gunicorn_threads() -> int | None:
+    args = shlex.split(os.environ.get("GUNICORN_CMD_ARGS", ""))
+    for index, arg in enumerate(args):
+        if arg.startswith("--threads="):
+            return int(arg.split("=", 1)[1])
+        if arg == "--threads" and index + 1 < len(args):
+            return int(args[index + 1])
+    return None
+
+
+def detect_topology(
+    web_processes: int | None = None,
+    web_threads: int | None = None,
+    celery_concurrency: int | None = None,
+) -> WorkerTopology:
+    """Detect the worker topology, explicitly given values take precedence.
+
+    Web workers are read from uWSGI (when running in it) or gunicorn's
+    ``WEB_CONCURRENCY`` and ``GUNICORN_CMD_ARGS`` environment variables.
+    """
+    try:
+        import uwsgi  # noqa: PLC0415
+
+        web_processes = web_processes or uwsgi.numproc
+        web_threads = web_threads or int(uwsgi.opt.get("threads", 1))
+    except ImportError:
+        pass
+
+    if web_processes is None and os.environ.get("WEB_CONCURRENCY"):
+        web_processes = int(os.environ["WEB_CONCURRENCY"])
+    if web_threads is None:
+        web_threads = _gunicorn_threads()
+
+    return WorkerTopology(
+        web_processes=web_processes or 1,
+        web_threads=web_threads or 1,
+        celery_processes=celery_concurrency or 0,
+    )
+
+
+def compute_pool_options(
+    max_connections: int,
+    reserved_connections: int = 5,
+    topology: WorkerTopology | None = None,
+    **topology_kwargs: int | None,
+) -> dict:
+    """Compute the pool options of the current process.
+
+    :param max_connections: the database's ``max_connections`` budget
+    :param reserved_connections: connections kept free for e.g. migrations
+        and admin sessions
+    :param topology: the worker topology, detected if not given
+    :param topology_kwargs: passed to :func:`detect_topology`
+    """
+    topology = topology or detect_topology(**topology_kwargs)
+    processes = topology.web_processes + topology.celery_processes
+    budget = max(1, (max_connections - reserved_connections) // processes)
+
+    # celery's prefork workers execute one task at a time per process
+    is_celery = "celery" in Path(sys.argv[0]).name
+    threads = 1 if is_celery else topology.web_threads
+
+    pool_size = min(threads, budget)
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": budget - pool_size,
+    }
+
+
+def init_pool_sizing(app: Flask) -> None:
+    """Apply the computed pool options to ``SQLALCHEMY_ENGINE_OPTIONS``."""
+    max_connections = app.config.get("CONFIG_TUGRAZ_DB_MAX_CONNECTIONS")
+    if not max_connections:
+        return
+
+    if "sqlalchemy" in app.extensions:
+        app.logger.warning(
+            "database engine already created, compute the pool options in "
+            "invenio.cfg with `compute_pool_options` instead",
+        )
+        return
+
+    options = compute_pool_options(
+        max_connections,
+        reserved_connections=app.config.get("CONFIG_TUGRAZ_DB_RESERVED_CONNECTIONS", 5),
+        web_processes=app.config.get("CONFIG_TUGRAZ_DB_WEB_PROCESSES"),
+        web_threads=app.config.get("CONFIG_TUGRAZ_DB_WEB_THREADS"),
+        celery_concurrency=app.config.get("CELERY_WORKER_CONCURRENCY"),
+    )
+    engine_options = dict(app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    for key, value in options.items():
+        engine_options.setdefault(key, value)
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options
+
+    app.logger.info(
+        "database pool sized to pool_size=%s, max_overflow=%s",
+        engine_options["pool_size"],
+        engine_options["max_overflow"],
+    )
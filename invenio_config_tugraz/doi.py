@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Bulk registration of DOIs with DataCite.
+
+When ``CONFIG_TUGRAZ_BULK_DOI_REGISTRATION`` is enabled, publishing doesn't
+register the DataCite DOIs one by one in a celery task per record. They are
+queued in the ``tugraz_doi_registration`` table instead, in the transaction
+of the publish, and registered in batches by :func:`register_doi_batch`:
+the batch is sent to DataCite concurrently over a bounded pool of HTTP
+connections, transient failures are retried as a batch with backoff, and the
+progress of each DOI is recorded in the table.
+"""
+
+import asyncio
+from collections import Counter
+from typing import NamedTuple
+
+import httpx
+from flask import current_app
+from invenio_access.permissions import system_identity
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.records.api import RDMRecord
+from invenio_rdm_records.resources.serializers import DataCite45JSONSerializer
+from invenio_rdm_records.utils import ChainObject
+
+from .models import DOIRegistration, DOIRegistrationStatus
+
+DATACITE_API_URL = "https://api.datacite.org/"
+DATACITE_TEST_API_URL = "https://api.test.datacite.org/"
+
+TRANSIENT_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class DOIPayload(NamedTuple):
+    """DataCite attributes of a DOI."""
+
+    doi: str
+    attributes: dict
+
+
+class Outcome(NamedTuple):
+    """Outcome of the registration of a DOI."""
+
+    registered: bool
+    error: str | None = None
+    retry: bool = False
+
+
+class DataCiteBulkClient:
+    """Registers DOIs concurrently, with at most `concurrency` open requests.
+
+    ``PUT /dois/<doi>`` creates or updates the DOI, so retries are safe.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str,
+        username: str,
+        password: str,
+        *,
+        concurrency: int = 8,
+        retries: int = 3,
+        backoff: float = 1.0,
+        timeout: float = 30.0,
+    ) -> None:
+        """Construct."""
+        self.url = url
+        self.auth = (username, password)
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+    async def put(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        payload: DOIPayload,
+    ) -> Outcome:
+        """Send the attributes of one DOI."""
+        body = {
+            "data": {
+                "id": payload.doi,
+                "type": "dois",
+                "attributes": {**payload.attributes, "doi": payload.doi},
+            },
+        }
+        async with semaphore:
+            try:
+                response = await client.put(f"dois/{payload.doi}", json=body)
+            except httpx.TransportError as error:
+                return Outcome(registered=False, error=repr(error), retry=True)
+
+        if response.is_success:
+            return Outcome(registered=True)
+        return Outcome(
+            registered=False,
+            error=f"{response.status_code}: {response.text}",
+            retry=response.status_code in TRANSIENT_STATUS_CODES,
+        )
+
+    async def register(self, payloads: list[DOIPayload]) -> dict[str, Outcome]:
+        """Register the DOIs, retrying transient failures as a batch."""
+        limits = httpx.Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency,
+        )
+        semaphore = asyncio.Semaphore(self.concurrency)
+        outcomes = {}
+
+        async with httpx.AsyncClient(
+            base_url=self.url,
+            auth=self.auth,
+            timeout=self.timeout,
+            limits=limits,
+            headers={"Content-Type": "application/vnd.api+json"},
+        ) as client:
+            pending = payloads
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+
+                results = await asyncio.gather(
+                    *(self.put(client, semaphore, payload) for payload in pending),
+                )
+                outcomes.update(
+                    (payload.doi, outcome)
+                    for payload, outcome in zip(pending, results, strict=True)
+                )
+                pending = [
+                    payload
+                    for payload, outcome in zip(pending, results, strict=True)
+                    if outcome.retry
+                ]
+                if not pending:
+                    break
+
+        return outcomes
+
+    def register_all(self, payloads: list[DOIPayload]) -> dict[str, Outcome]:
+        """Register the DOIs from synchronous code."""
+        return asyncio.run(self.register(payloads))
+
+
+def datacite_bulk_client() -> DataCiteBulkClient:
+    """Return the client configured by the application."""
+    config = current_app.config
+    url = config.get("CONFIG_TUGRAZ_DATACITE_API_URL") or (
+        DATACITE_TEST_API_URL
+        if config.get("DATACITE_TEST_MODE", True)
+        else DATACITE_API_URL
+    )
+    return DataCiteBulkClient(
+        url,
+        config.get("DATACITE_USERNAME", ""),
+        config.get("DATACITE_PASSWORD", ""),
+        concurrency=config["CONFIG_TUGRAZ_BULK_DOI_CONCURRENCY"],
+        retries=config["CONFIG_TUGRAZ_BULK_DOI_RETRIES"],
+    )
+
+
+def queue_doi_registration(recid: str, doi: str, *, parent: bool = False) -> None:
+    """Queue the registration of a DOI, or queue it anew."""
+    registration = DOIRegistration.query.filter_by(doi=doi).one_or_none()
+    if registration is None:
+        registration = DOIRegistration(doi=doi, recid=recid, parent=parent)
+    registration.recid = recid
+    registration.status = DOIRegistrationStatus.QUEUED
+    registration.attempts = 0
+    registration.error = None
+    db.session.add(registration)
+
+
+def mint_doi(record: RDMRecord) -> str:
+    """Create a DataCite DOI of a record which has none.
+
+    The DOI is generated after ``DATACITE_FORMAT``, like RDM does on publish.
+    """
+    pid_manager = current_rdm_records_service.pids.pid_manager
+    provider = pid_manager._get_provider("doi", "datacite")  # noqa: SLF001
+    pid = provider.create(record)
+    record.pids = {
+        **record.pids,
+        "doi": {
+            "identifier": pid.pid_value,
+            "provider": provider.name,
+            "client": provider.client.name,
+        },
+    }
+    record.commit()
+    return pid.pid_value
+
+
+def doi_payload(registration: DOIRegistration) -> DOIPayload | None:
+    """Build the DataCite attributes of a queued DOI, as RDM does on publish.
+
+    Returns None if there is nothing to register, i.e. the record is
+    restricted and its DOI was never registered.
+    """
+    record = RDMRecord.pid.resolve(registration.recid, registered_only=False)
+    pid_record = record
+    if registration.parent:
+        if not record.versions.is_latest:
+            record = RDMRecord.get_record(record.versions.latest_id)
+        pid_record = ChainObject(
+            record.parent,
+            record,
+            aliases={"_parent": record.parent, "_child": record},
+        )
+
+    pid = PersistentIdentifier.get("doi", registration.doi)
+    if record["access"]["record"] == "restricted":
+        if not pid.is_registered():
+            return None
+        return DOIPayload(registration.doi, {"event": "hide"})
+
+    links = current_rdm_records_service.links_item_tpl.expand(system_identity, record)
+    link_prefix = "parent" if registration.parent else "self"
+    url = links.get(f"{link_prefix}_doi_html") or links[f"{link_prefix}_html"]
+
+    if relations := getattr(pid_record, "relations", None):
+        relations.dereference()
+
+    attributes = DataCite45JSONSerializer().dump_obj(pid_record)
+    return DOIPayload(registration.doi, {**attributes, "url": url, "event": "publish"})
+
+
+def _record_outcome(registration: DOIRegistration, outcome: Outcome) -> None:
+    registration.attempts += 1
+    registration.error = outcome.error
+    if outcome.registered:
+        registration.status = DOIRegistrationStatus.REGISTERED
+        pid = PersistentIdentifier.get("doi", registration.doi)
+        if pid.is_new() or pid.is_reserved():
+            pid.register()
+        elif pid.is_deleted():
+            pid.sync_status(PIDStatus.REGISTERED)
+    elif not outcome.retry or registration.attempts >= current_app.config.get(
+        "CONFIG_TUGRAZ_BULK_DOI_MAX_ATTEMPTS",
+    ):
+        registration.status = DOIRegistrationStatus.FAILED
+
+
+def register_doi_batch(
+    batch_size: int = 100,
+    client: DataCiteBulkClient | None = None,
+) -> Counter:
+    """Register one batch of queued DOIs, returns the count per new status.
+
+    The batch's rows are locked, so that concurrent runs take other batches.
+    """
+    client = client or datacite_bulk_client()
+    registrations = (
+        DOIRegistration.query.filter_by(status=DOIRegistrationStatus.QUEUED)
+        .order_by(DOIRegistration.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+    payloads = {}
+    for registration in registrations:
+        try:
+            payload = doi_payload(registration)
+        except Exception as error:
+            current_app.logger.exception("serializing %s failed", registration.doi)
+            # e.g. a record being reindexed, retried up to the maximum of attempts
+            _record_outcome(
+                registration,
+                Outcome(registered=False, error=repr(error), retry=True),
+            )
+            continue
+
+        if payload is None:
+            registration.status = DOIRegistrationStatus.SKIPPED
+        else:
+            payloads[registration.doi] = payload
+
+    if payloads:
+        by_doi = {registration.doi: registration for registration in registrations}
+        for doi, outcome in client.register_all(list(payloads.values())).items():
+            _record_outcome(by_doi[doi], outcome)
+
+    db.session.commit()
+    return Counter(registration.status for registration in registrations)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Precompiled email parts.
+
+Apart from the optional confirmation link, the welcome email only depends on
+the locale. Its static parts are therefore rendered once per language and
+cached, so that registering users in bulk doesn't run ``url_for`` and the
+translation lookups over and over again.
+"""
+
+from flask import Flask, current_app
+from invenio_i18n import force_locale, get_locale
+from invenio_i18n.proxies import current_i18n
+
+WELCOME_EMAIL_TEMPLATE = "invenio_config_tugraz/email/welcome.txt"
+"""Template holding the static blocks of the welcome email."""
+
+
+def render_welcome_email(locale: str) -> dict[str, str]:
+    """Render all blocks of the welcome email for the given locale."""
+    template = current_app.jinja_env.get_template(WELCOME_EMAIL_TEMPLATE)
+
+    with force_locale(locale):
+        context = template.new_context({})
+        return {
+            name: "".join(block(context)) for name, block in template.blocks.items()
+        }
+
+
+def welcome_email(block: str) -> str:
+    """Return a precompiled block of the welcome email in the current locale.
+
+    Registered as the ``tugraz_welcome_email`` template global.
+    """
+    cache = current_app.extensions["invenio-config-tugraz"].welcome_email_cache
+    locale = str(get_locale())
+    if locale not in cache:
+        cache[locale] = render_welcome_email(locale)
+    return cache[locale][block]
+
+
+def precompile_welcome_email(app: Flask) -> None:
+    """Render the welcome email's static parts for all configured languages.
+
+    The links point to UI views, hence nothing is done for applications (e.g.
+    the REST API) that don't serve them; those render lazily on first use.
+    """
+    if "invenio_app_rdm.help_search" not in app.view_functions:
+        return
+
+    cache = app.extensions["invenio-config-tugraz"].welcome_email_cache
+    with app.test_request_context():
+        for locale in current_i18n.get_locales():
+            cache[str(locale)] = render_welcome_email(str(locale))
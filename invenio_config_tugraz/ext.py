@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2020-2024 Graz University of Technology.
+# Copyright (C) 2020-2026 Graz University of Technology.
 #
 # invenio-config-tugraz is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
@@ -11,7 +11,16 @@
 from flask import Flask
 
 from . import config
+from .access_rights import access_rights
 from .custom_fields import ip_network, single_ip
+from .db import init_pool_metrics, init_pool_sizing
+from .emails import precompile_welcome_email, welcome_email
+from .headers import init_secure_headers
+from .i18n import preload_translations
+from .mail import init_mail_pool
+from .oai import init_oai_fast_path
+from .permissions.identities import install_flush_listener
+from .sql_tracker import init_sql_tracker
 
 
 class InvenioConfigTugraz:
@@ -19,13 +28,20 @@ class InvenioConfigTugraz:
 
     def __init__(self, app: Flask = None) -> None:
         """Extension initialization."""
+        self.welcome_email_cache = {}
         if app:
             self.init_app(app)
 
     def init_app(self, app: Flask) -> None:
         """Flask application initialization."""
         self.init_config(app)
+        init_pool_sizing(app)
+        init_pool_metrics(app)
+        init_sql_tracker(app)
+        install_flush_listener()
         self.add_custom_fields(app)
+        app.add_template_global(welcome_email, "tugraz_welcome_email")
+        app.add_template_global(access_rights(), "tugraz_access_rights")
         app.extensions["invenio-config-tugraz"] = self
 
     def init_config(self, app: Flask) -> None:
@@ -44,6 +60,11 @@ class InvenioConfigTugraz:
 def finalize_app(app: Flask) -> None:
     """Finalize app."""
     rank_blueprint_higher(app)
+    init_secure_headers(app)
+    init_mail_pool(app)
+    init_oai_fast_path(app)
+    preload_translations(app)
+    precompile_welcome_email(app)
 
 
 def rank_blueprint_higher(app: Flask) -> None:
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2025 Graz University of Technology.
+# Copyright (C) 2025-2026 Graz University of Technology.
 #
 # invenio-config-tugraz is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
@@ -9,6 +9,8 @@
 """Override specific facets for TU Graz Repo."""
 
 from invenio_curations.services import facets
+from invenio_i18n import lazy_gettext as _
+from invenio_records_resources.services.records.facets import DateFacet
 
 TUGRAZ_REQUESTS_FACETS = {
     "type": {
@@ -23,8 +25,22 @@ TUGRAZ_REQUESTS_FACETS = {
             "field": "status",
         },
     },
+    "created": {
+        "facet": DateFacet(
+            field="created",
+            label=_("Created"),
+            interval="month",
+            format="yyyy-MM",
+        ),
+        "ui": {
+            "field": "created",
+        },
+    },
 }
 """TU Graz requests facets.
 
+The aggregations are cached when ``REQUESTS_SERVICE_COMPONENTS`` is
+``TUGRAZ_REQUESTS_SERVICE_COMPONENTS``, see ``invenio_config_tugraz.requests.facets``.
+
 To use: override in invenio.cfg. REQUESTS_FACETS = TUGRAZ_REQUESTS_FACETS.
 """
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Precomputed security headers.
+
+Flask-Talisman (set up by invenio-app from ``APP_DEFAULT_SECURE_HEADERS``)
+builds the security headers, the content security policy included, anew on
+every response. :class:`SecureHeaders` replaces its after request hook: the
+headers are serialized once per view options, content type and scheme, and
+then copied onto each response.
+
+Per-request CSP nonces (``content_security_policy_nonce_in``) are spliced
+into the serialized policy, without building the rest of it again.
+"""
+
+from collections import OrderedDict
+from typing import NamedTuple
+
+from flask import Flask, Response, current_app, request
+from flask_talisman import ALLOW_FROM, Talisman
+from werkzeug.datastructures import Headers
+
+NONCE_PLACEHOLDER = "\0nonce\0"
+"""Marks where the nonce goes in the serialized policy."""
+
+
+class HeaderBundle(NamedTuple):
+    """Serialized security headers of one kind of response."""
+
+    headers: tuple[tuple[str, str], ...]
+    names: frozenset[str]
+    csp_header: str | None = None
+    csp_parts: tuple[str, ...] = ()
+    csp_without_nonce: str = ""
+
+
+def _structured_policy(policy: str | dict) -> str:
+    if isinstance(policy, str):
+        return policy
+    return ", ".join(f"{section}={content}" for section, content in policy.items())
+
+
+def _policy(policy: str | dict, nonce_in: list[str], nonce: str | None) -> str:
+    if isinstance(policy, str):
+        parts = (part.strip().split(" ") for part in policy.split(";"))
+        policy = OrderedDict((part[0], " ".join(part[1:])) for part in parts)
+
+    policies = []
+    for section, content in policy.items():
+        part = f"{section} {content if isinstance(content, str) else ' '.join(content)}"
+        if nonce is not None and section in nonce_in:
+            part += f" 'nonce-{nonce}'"
+        policies.append(part)
+    return "; ".join(policies)
+
+
+class SecureHeaders:
+    """After request hook attaching precomputed security headers.
+
+    Computes the same headers as Flask-Talisman, with ``mimetype_headers``
+    adding or overriding headers per content type, e.g.:
+
+    .. code-block:: python
+
+        {"application/json": {"Content-Security-Policy": "default-src 'none'"}}
+    """
+
+    def __init__(
+        self,
+        talisman: Talisman,
+        mimetype_headers: dict[str, dict[str, str]] | None = None,
+    ) -> None:
+        """Construct from the application's Talisman instance."""
+        self.talisman = talisman
+        self.mimetype_headers = mimetype_headers or {}
+        self._bundles: dict[tuple, HeaderBundle] = {}
+
+    def precompute(self) -> None:
+        """Serialize the headers of views without own options."""
+        for mimetype in (None, *self.mimetype_headers):
+            for secure in (False, True):
+                self._bundles[None, mimetype, secure] = self.serialize(
+                    {},
+                    mimetype,
+                    secure=secure,
+                )
+
+    def options(self, view_options: dict) -> dict:
+        """Merge the view's options into Talisman's defaults."""
+        talisman = self.talisman
+        return {
+            "frame_options": talisman.frame_options,
+            "frame_options_allow_from": talisman.frame_options_allow_from,
+            "content_security_policy": talisman.content_security_policy,
+            "content_security_policy_nonce_in": (
+                talisman.content_security_policy_nonce_in
+            ),
+            "permissions_policy": talisman.permissions_policy,
+            "document_policy": talisman.document_policy,
+            "feature_policy": talisman.feature_policy,
+            **view_options,
+        }
+
+    def hsts(self) -> str:
+        """Serialize the Strict-Transport-Security header."""
+        talisman = self.talisman
+        value = f"max-age={talisman.strict_transport_security_max_age}"
+        if talisman.strict_transport_security_include_subdomains:
+            value += "; includeSubDomains"
+        if talisman.strict_transport_security_preload:
+            value += "; preload"
+        return value
+
+    def csp(self, options: dict) -> dict[str | None, str]:
+        """Serialize the content security policy, with and without nonce."""
+        policies = {}
+        for nonce in (NONCE_PLACEHOLDER, None):
+            policy = _policy(
+                options["content_security_policy"],
+                options["content_security_policy_nonce_in"],
+                nonce,
+            )
+            report_uri = self.talisman.content_security_policy_report_uri
+            if report_uri and "report-uri" not in policy:
+                policy += f"; report-uri {report_uri}"
+            policies[nonce] = policy
+        return policies
+
+    def policy_headers(self, options: dict) -> dict[str, str]:
+        """Serialize the feature, document and framing policies."""
+        headers = {}
+        if options["feature_policy"]:
+            headers["Feature-Policy"] = _policy(options["feature_policy"], [], None)
+        if options["permissions_policy"]:
+            headers["Permissions-Policy"] = _structured_policy(
+                options["permissions_policy"],
+            )
+        if options["document_policy"]:
+            headers["Document-Policy"] = _structured_policy(options["document_policy"])
+        if frame_options := options["frame_options"]:
+            if frame_options == ALLOW_FROM:
+                frame_options += f" {options['frame_options_allow_from']}"
+            headers["X-Frame-Options"] = frame_options
+        return headers
+
+    def serialize(
+        self,
+        view_options: dict,
+        mimetype: str | None,
+        *,
+        secure: bool,
+    ) -> HeaderBundle:
+        """Serialize the headers of one kind of response."""
+        talisman = self.talisman
+        options = self.options(view_options)
+        headers = self.policy_headers(options)
+
+        if talisman.x_xss_protection:
+            headers["X-XSS-Protection"] = "1; mode=block"
+        if talisman.x_content_type_options:
+            headers["X-Content-Type-Options"] = "nosniff"
+        if talisman.force_file_save:
+            headers["X-Download-Options"] = "noopen"
+        if secure and talisman.strict_transport_security:
+            headers["Strict-Transport-Security"] = self.hsts()
+        headers["Referrer-Policy"] = talisman.referrer_policy
+
+        csp_header, csp = None, {NONCE_PLACEHOLDER: "", None: ""}
+        if options["content_security_policy"]:
+            csp_header = "Content-Security-Policy"
+            if talisman.content_security_policy_report_only:
+                csp_header += "-Report-Only"
+            csp = self.csp(options)
+
+        for name, value in self.mimetype_headers.get(mimetype, {}).items():
+            if name == csp_header:
+                csp = {NONCE_PLACEHOLDER: value, None: value}
+            else:
+                headers[name] = value
+
+        # validated once here, so that they can be attached without validation
+        Headers(headers)
+        names = {name.lower() for name in headers}
+        if csp_header:
+            names.add(csp_header.lower())
+
+        return HeaderBundle(
+            headers=tuple(headers.items()),
+            names=frozenset(names),
+            csp_header=csp_header,
+            csp_parts=tuple(csp[NONCE_PLACEHOLDER].split(NONCE_PLACEHOLDER)),
+            csp_without_nonce=csp[None],
+        )
+
+    def __call__(self, response: Response) -> Response:
+        """Attach the security headers to the response."""
+        view = current_app.view_functions.get(request.endpoint)
+        view_options = getattr(view, "talisman_view_options", None)
+        mimetype = response.mimetype
+        if mimetype not in self.mimetype_headers:
+            mimetype = None
+        secure = (
+            request.is_secure
+            or request.headers.get("X-Forwarded-Proto", "http") == "https"
+        )
+
+        key = (request.endpoint if view_options else None, mimetype, secure)
+        bundle = self._bundles.get(key)
+        if bundle is None:
+            bundle = self._bundles[key] = self.serialize(
+                view_options or {},
+                mimetype,
+                secure=secure,
+            )
+
+        csp = None
+        if bundle.csp_header:
+            nonce = getattr(request, "csp_nonce", None)
+            csp = nonce.join(bundle.csp_parts) if nonce else bundle.csp_without_nonce
+
+        headers = response.headers
+        if bundle.names.isdisjoint(name.lower() for name, _ in headers):
+            headers._list.extend(bundle.headers)  # noqa: SLF001
+            if csp is not None:
+                headers._list.append((bundle.csp_header, csp))  # noqa: SLF001
+        else:
+            for name, value in bundle.headers:
+                headers[name] = value
+            if csp is not None:
+                headers[bundle.csp_header] = csp
+        return response
+
+
+def init_secure_headers(app: Flask) -> None:
+    """Replace Talisman's after request hook by precomputed headers."""
+    if not app.config.get("CONFIG_TUGRAZ_PRECOMPUTED_SECURE_HEADERS"):
+        return
+
+    talisman = getattr(app.extensions.get("invenio-app"), "talisman", None)
+    funcs = app.after_request_funcs.get(None, [])
+    if talisman is None or talisman._set_response_headers not in funcs:  # noqa: SLF001
+        return
+
+    secure_headers = SecureHeaders(
+        talisman,
+        app.config.get("CONFIG_TUGRAZ_SECURE_HEADERS_PER_MIMETYPE"),
+    )
+    secure_headers.precompute()
+    funcs[funcs.index(talisman._set_response_headers)] = secure_headers  # noqa: SLF001
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Preloading of translation catalogs.
+
+invenio-i18n merges the catalogs of all installed packages lazily, on the
+first request needing a locale. Every worker therefore serves its first
+request per language slowly after a deploy. Preloading them while the
+application is created moves that cost to startup; with gunicorn's
+``--preload`` it is paid once in the master and the workers share the
+loaded catalogs.
+"""
+
+import gc
+import time
+
+from flask import Flask
+from flask_babel import get_translations
+from invenio_i18n import force_locale
+from invenio_i18n.proxies import current_i18n
+
+
+def lookup_seconds(app: Flask) -> dict[str, float]:
+    """Return the time of a translation lookup in each configured language.
+
+    The first lookup of a language loads and merges its catalogs, later ones
+    are served from the catalogs cached by the application.
+    """
+    seconds = {}
+    with app.test_request_context():
+        for locale in current_i18n.get_locales():
+            start = time.perf_counter()
+            with force_locale(locale):
+                get_translations().gettext("German")
+            seconds[str(locale)] = time.perf_counter() - start
+    return seconds
+
+
+def preload_translations(app: Flask) -> None:
+    """Load and merge the catalogs of all configured languages, logs the time it took."""
+    if not app.config.get("CONFIG_TUGRAZ_PRELOAD_TRANSLATIONS"):
+        return
+    if "invenio-i18n" not in app.extensions:
+        return
+
+    seconds = lookup_seconds(app)
+    app.logger.info(
+        "preloaded translations of %s in %.3fs",
+        ", ".join(seconds),
+        sum(seconds.values()),
+    )
+
+    if app.config.get("CONFIG_TUGRAZ_PRELOAD_GC_FREEZE"):
+        # move everything loaded so far out of the garbage collector's reach,
+        # so that forked workers don't copy the pages just by collecting
+        gc.freeze()
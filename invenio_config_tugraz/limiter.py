@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tiered rate limits.
+
+Requests are sorted into tiers, each with its own limit and bucket:
+
+- ``tugraz``: identities with the ``tugraz_authenticated`` role
+- ``authenticated``: other signed in users
+- ``campus``: guests from within ``CONFIG_TUGRAZ_IP_NETWORK`` (e.g. harvesters)
+- ``guest``: everyone else
+
+The tier is determined once per request. The network is parsed once per
+configuration value and the membership of client addresses is cached, so
+that evaluating the limits stays cheap.
+
+:class:`LeasingRedisStorage` is a limits storage (``tugraz+redis://``) for
+the sliding window counter strategy, serving most hits from tokens leased
+into process memory rather than with a round trip to Redis.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+
+from flask import current_app, g, request
+from flask_login import current_user
+from limits.storage import RedisStorage
+
+from .permissions.roles import tugraz_authenticated_user
+
+TIER_LIMITS = {
+    "tugraz": "CONFIG_TUGRAZ_RATELIMIT_TUGRAZ_AUTHENTICATED_USER",
+    "authenticated": "RATELIMIT_AUTHENTICATED_USER",
+    "campus": "CONFIG_TUGRAZ_RATELIMIT_CAMPUS_GUEST",
+    "guest": "RATELIMIT_GUEST_USER",
+}
+"""Configuration variable holding the limit of each tier."""
+
+
+@cache
+def _compile_network(network: str) -> IPv4Network | IPv6Network | None:
+    try:
+        return ip_network(network) if network else None
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _in_network(address: str, network: str) -> bool:
+    compiled = _compile_network(network)
+    if compiled is None:
+        return False
+    try:
+        return ip_address(address) in compiled
+    except ValueError:
+        return False
+
+
+def _is_tugraz_authenticated() -> bool:
+    identity = g.get("identity")
+    if identity is not None:
+        return tugraz_authenticated_user in identity.provides
+    return current_user.has_role(tugraz_authenticated_user.value)
+
+
+def rate_limit_tier() -> str:
+    """Return the tier of the current request."""
+    if "tugraz_rate_limit_tier" in g:
+        return g.tugraz_rate_limit_tier
+
+    if current_user and current_user.is_authenticated:
+        tier = "tugraz" if _is_tugraz_authenticated() else "authenticated"
+    elif _in_network(
+        request.remote_addr or "",
+        current_app.config["CONFIG_TUGRAZ_IP_NETWORK"],
+    ):
+        tier = "campus"
+    else:
+        tier = "guest"
+
+    g.tugraz_rate_limit_tier = tier
+    return tier
+
+
+def tiered_rate_limit() -> str:
+    """Return the rate limit of the current request.
+
+    Used as ``RATELIMIT_APPLICATION``. Like invenio-app's default,
+    ``RATELIMIT_PER_ENDPOINT`` and per user limits (``g.user_rate_limit``)
+    take precedence.
+    """
+    config = current_app.config
+    endpoint_limits = config.get("RATELIMIT_PER_ENDPOINT", {})
+    if request.endpoint in endpoint_limits:
+        return endpoint_limits[request.endpoint]
+
+    tier = rate_limit_tier()
+    if tier in {"tugraz", "authenticated"} and "user_rate_limit" in g:
+        return g.user_rate_limit
+    return config[TIER_LIMITS[tier]]
+
+
+def tiered_rate_limit_key() -> str:
+    """Return the bucket of the current request.
+
+    Used as ``RATELIMIT_KEY_FUNC``. Signed in users are counted per account,
+    regardless of user agent and address; guests per user agent and address.
+    """
+    tier = rate_limit_tier()
+    if tier in {"tugraz", "authenticated"}:
+        return f"{tier}:{current_user.get_id()}"
+    return f"{tier}:{request.user_agent}{request.remote_addr}"
+
+
+LEASE_SLIDING_WINDOW_SCRIPT = """
+-- Time is in milliseconds in this script: TTL, expiry...
+
+local limit = tonumber(ARGV[1])
+local expiry = tonumber(ARGV[2]) * 1000
+local amount = tonumber(ARGV[3])
+local batch = tonumber(ARGV[4])
+
+local current_ttl = tonumber(redis.call('pttl', KEYS[2]))
+
+if current_ttl > 0 and current_ttl < expiry then
+    -- Current window expired, shift it to the previous window
+    redis.call('rename', KEYS[2], KEYS[1])
+    redis.call('set', KEYS[2], 0, 'PX', current_ttl + expiry)
+end
+
+local previous_count = tonumber(redis.call('get', KEYS[1])) or 0
+local previous_ttl = math.max(0, tonumber(redis.call('pttl', KEYS[1])) or 0)
+local current_count = tonumber(redis.call('get', KEYS[2])) or 0
+current_ttl = math.max(0, tonumber(redis.call('pttl', KEYS[2])) or 0)
+
+local weighted_count = math.floor(previous_count * previous_ttl / expiry) + current_count
+local granted = math.min(batch, limit - weighted_count)
+
+if granted < amount then
+    granted = 0
+elseif redis.call('exists', KEYS[2]) == 1 then
+    redis.call('incrby', KEYS[2], granted)
+else
+    redis.call('set', KEYS[2], granted, 'PX', expiry * 2)
+    current_ttl = expiry * 2
+end
+
+return {granted, previous_count, previous_ttl, current_count + granted, current_ttl}
+"""
+"""Grant up to `batch` tokens of the sliding window, at least `amount` or none."""
+
+
+@dataclass
+class Lease:
+    """Tokens of a sliding window leased into process memory."""
+
+    tokens: int
+    valid_until: float
+    fetched_at: float
+    previous_count: int
+    previous_ttl: float
+    current_count: int
+    current_ttl: float
+
+
+class LeasingRedisStorage(RedisStorage):
+    """Redis storage leasing batches of sliding window tokens per key.
+
+    A lease is acquired atomically with a Lua script, counting all its tokens
+    in Redis at once, so that the processes together never exceed the limit.
+    Leased tokens are only used until the window shifts and for at most
+    `lease_seconds`. Other strategies than ``sliding-window-counter`` use
+    Redis directly.
+
+    Configure with ``RATELIMIT_STORAGE_URI = "tugraz+redis://host:port/db"``,
+    the lease options can be set via ``RATELIMIT_STORAGE_OPTIONS``.
+    """
+
+    STORAGE_SCHEME = ["tugraz+redis", "tugraz+rediss"]
+
+    def __init__(
+        self,
+        uri: str,
+        lease_size: int = 10,
+        lease_share: float = 0.01,
+        lease_seconds: float = 1.0,
+        **options: float | str | bool,
+    ) -> None:
+        """Construct.
+
+        :param lease_size: maximal tokens leased at once
+        :param lease_share: maximal share of the limit leased at once
+        :param lease_seconds: maximal lifetime of a lease
+        """
+        self.lease_size = lease_size
+        self.lease_share = lease_share
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        self._reset_leases()
+        super().__init__(uri.removeprefix("tugraz+"), **options)
+
+    def _reset_leases(self) -> None:
+        # leases must not be shared with forked processes
+        self._pid = os.getpid()
+        self._leases: dict[str, Lease] = {}
+
+    def initialize_storage(self, uri: str) -> None:
+        """Register the Lua scripts."""
+        super().initialize_storage(uri)
+        self.lua_lease_sliding_window = self.get_connection().register_script(
+            LEASE_SLIDING_WINDOW_SCRIPT,
+        )
+
+    def _valid_lease(self, key: str) -> Lease | None:
+        if self._pid != os.getpid():
+            self._reset_leases()
+        lease = self._leases.get(key)
+        if lease is not None and time.monotonic() < lease.valid_until:
+            return lease
+        return None
+
+    def _lease(self, key: str, limit: int, expiry: int, amount: int) -> Lease:
+        batch = max(amount, min(self.lease_size, int(limit * self.lease_share)))
+        previous_key = self.prefixed_key(self._previous_window_key(key))
+        current_key = self.prefixed_key(self._current_window_key(key))
+        granted, previous_count, previous_ttl, current_count, current_ttl = (
+            self.lua_lease_sliding_window(
+                [previous_key, current_key],
+                [limit, expiry, amount, batch],
+            )
+        )
+
+        now = time.monotonic()
+        until_shift = max(0, current_ttl / 1000 - expiry)
+        lease = Lease(
+            tokens=int(granted),
+            valid_until=now + min(self.lease_seconds, until_shift),
+            fetched_at=now,
+            previous_count=int(previous_count),
+            previous_ttl=previous_ttl / 1000,
+            current_count=int(current_count),
+            current_ttl=current_ttl / 1000,
+        )
+        self._leases[key] = lease
+        return lease
+
+    def acquire_sliding_window_entry(
+        self,
+        key: str,
+        limit: int,
+        expiry: int,
+        amount: int = 1,
+    ) -> bool:
+        """Acquire an entry, from the lease if possible."""
+        if amount > limit:
+            return False
+
+        with self._lock:
+            lease = self._valid_lease(key)
+            if lease is None or lease.tokens < amount:
+                lease = self._lease(key, limit, expiry, amount)
+            if lease.tokens < amount:
+                return False
+            lease.tokens -= amount
+            return True
+
+    def get_sliding_window(
+        self,
+        key: str,
+        expiry: int,
+    ) -> tuple[int, float, int, float]:
+        """Return the window as of the lease, or from Redis without one."""
+        with self._lock:
+            lease = self._valid_lease(key)
+        if lease is None:
+            return super().get_sliding_window(key, expiry)
+
+        elapsed = time.monotonic() - lease.fetched_at
+        return (
+            lease.previous_count,
+            max(0, lease.previous_ttl - elapsed),
+            lease.current_count - lease.tokens,
+            max(0, lease.current_ttl - elapsed),
+        )
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        """Clear the window and drop its lease."""
+        with self._lock:
+            self._leases.pop(key, None)
+        super().clear_sliding_window(key, expiry)
+
+    def reset(self) -> int | None:
+        """Reset all rate limits and drop all leases."""
+        with self._lock:
+            self._leases.clear()
+        return super().reset()
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Pooled SMTP delivery for Flask-Mail.
+
+Flask-Mail opens (and closes) a new SMTP connection for every message it
+sends. With ``CONFIG_TUGRAZ_MAIL_POOL_SIZE`` set, :class:`PooledMail` wraps
+the Flask-Mail state of the application and keeps up to that many SMTP
+connections per process open, so that consecutive messages reuse the same
+connection. Everything sending mails via ``current_app.extensions["mail"]``
+(invenio-mail's tasks, Flask-Security, notification digests) transparently
+uses the pool.
+"""
+
+import os
+import smtplib
+import threading
+import time
+from collections import deque
+from types import TracebackType
+from typing import Self
+
+from flask import Flask
+from flask_mail import Connection, Message
+
+RETRYABLE_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError)
+"""Errors after which the message is retried on a fresh connection."""
+
+
+class SMTPConnectionPool:
+    """Per-process pool of persistent SMTP connections."""
+
+    def __init__(self, mail: object, size: int, idle_check: float = 30) -> None:
+        """Construct.
+
+        :param mail: the Flask-Mail state used to configure new connections
+        :param size: maximal number of idle connections kept open
+        :param idle_check: seconds of idleness after which a connection is
+            checked with a ``NOOP`` before it is handed out again
+        """
+        self.mail = mail
+        self.size = size
+        self.idle_check = idle_check
+        self._metrics = {
+            "connections_opened": 0,
+            "messages_sent": 0,
+            "messages_failed": 0,
+            "retries": 0,
+            "send_seconds": 0.0,
+        }
+        self._lock = threading.Lock()
+        self._reset()
+
+    @property
+    def metrics(self) -> dict[str, float]:
+        """Return the counters, and the sent messages per second of sending time."""
+        with self._lock:
+            metrics = dict(self._metrics)
+        seconds = metrics["send_seconds"]
+        metrics["throughput"] = metrics["messages_sent"] / seconds if seconds else 0.0
+        return metrics
+
+    def count(self, **increments: float) -> None:
+        """Add to the counters."""
+        with self._lock:
+            for name, increment in increments.items():
+                self._metrics[name] += increment
+
+    def _reset(self) -> None:
+        # connections must not be shared with forked processes
+        self._pid = os.getpid()
+        self._idle = deque()
+
+    def acquire(self) -> smtplib.SMTP:
+        """Hand out an open connection, creating one if none is idle."""
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset()
+
+            while self._idle:
+                host, released_at = self._idle.pop()
+                if time.monotonic() - released_at < self.idle_check:
+                    return host
+                if self._is_alive(host):
+                    return host
+
+        return self.connect()
+
+    def release(self, host: smtplib.SMTP, *, broken: bool = False) -> None:
+        """Return the connection into the pool, or close it if not reusable."""
+        with self._lock:
+            if not broken and self._pid == os.getpid() and len(self._idle) < self.size:
+                self._idle.append((host, time.monotonic()))
+                return
+
+        self.close(host)
+
+    def connect(self) -> smtplib.SMTP:
+        """Open a new connection."""
+        host = Connection(self.mail).configure_host()
+        self.count(connections_opened=1)
+        return host
+
+    def close(self, host: smtplib.SMTP) -> None:
+        """Close a connection, ignoring errors of already dead ones."""
+        try:
+            host.quit()
+        except (smtplib.SMTPException, OSError):
+            host.close()
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        for host, _ in idle:
+            self.close(host)
+
+    def _is_alive(self, host: smtplib.SMTP) -> bool:
+        try:
+            return host.noop()[0] == 250  # noqa: PLR2004
+        except (smtplib.SMTPException, OSError):
+            host.close()
+            return False
+
+
+class PooledConnection(Connection):
+    """Flask-Mail connection borrowing its SMTP host from the pool."""
+
+    def __init__(self, mail: "PooledMail") -> None:
+        """Construct."""
+        super().__init__(mail)
+        self.pool = mail.pool
+        self.broken = False
+
+    def __enter__(self) -> Self:
+        """Borrow a connection from the pool."""
+        self.host = None if self.mail.suppress else self.pool.acquire()
+        self.num_emails = 0
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Give the connection back to the pool."""
+        if self.host is not None:
+            self.pool.release(self.host, broken=self.broken or exc_type is not None)
+            self.host = None
+
+    def send(self, message: Message, envelope_from: str | None = None) -> None:
+        """Send the message, retrying with backoff on connection errors."""
+        retries = self.mail.pool_retries
+        start = time.monotonic()
+
+        for attempt in range(retries + 1):
+            try:
+                if self.host is None and not self.mail.suppress:
+                    self.host = self.pool.connect()
+                super().send(message, envelope_from)
+                break
+            except RETRYABLE_ERRORS:
+                if self.host is not None:
+                    self.pool.close(self.host)
+                    self.host = None
+                if attempt == retries:
+                    self.broken = True
+                    self.pool.count(messages_failed=1)
+                    raise
+                self.pool.count(retries=1)
+                time.sleep(self.mail.pool_backoff * 2**attempt)
+
+        self.pool.count(messages_sent=1, send_seconds=time.monotonic() - start)
+
+    def configure_host(self) -> smtplib.SMTP:
+        """Open a new connection, used by Flask-Mail after ``MAIL_MAX_EMAILS``."""
+        return self.pool.connect()
+
+
+class PooledMail:
+    """Flask-Mail state wrapper, sending over pooled connections."""
+
+    def __init__(
+        self,
+        state: object,
+        size: int,
+        retries: int = 3,
+        backoff: float = 0.5,
+    ) -> None:
+        """Construct from the Flask-Mail state, i.e. ``app.extensions["mail"]``."""
+        self.state = state
+        self.pool = SMTPConnectionPool(state, size)
+        self.pool_retries = retries
+        self.pool_backoff = backoff
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate configuration (server, port, ...) to the Flask-Mail state."""
+        return getattr(self.state, name)
+
+    def connect(self) -> PooledConnection:
+        """Borrow a connection of the pool."""
+        return PooledConnection(self)
+
+    def send(self, message: Message) -> None:
+        """Send a single message."""
+        with self.connect() as connection:
+            message.send(connection)
+
+    def send_message(self, *args: object, **kwargs: object) -> None:
+        """Shortcut for send(msg), takes the same arguments as ``Message``."""
+        self.send(Message(*args, **kwargs))
+
+
+def init_mail_pool(app: Flask) -> None:
+    """Replace the application's Flask-Mail state by a pooled one."""
+    size = app.config.get("CONFIG_TUGRAZ_MAIL_POOL_SIZE", 0)
+    state = app.extensions.get("mail")
+    if not size or state is None or isinstance(state, PooledMail):
+        return
+
+    app.extensions["mail"] = PooledMail(
+        state,
+        size=size,
+        retries=app.config.get("CONFIG_TUGRAZ_MAIL_POOL_RETRIES", 3),
+        backoff=app.config.get("CONFIG_TUGRAZ_MAIL_POOL_BACKOFF", 0.5),
+    )
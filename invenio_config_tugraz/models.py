@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Database models of TU Graz Repo."""
+
+from enum import Enum
+
+from invenio_db import db
+from sqlalchemy_utils.types import ChoiceType, UUIDType
+
+
+class DOIRegistrationStatus(Enum):
+    """Progress of a queued DOI registration."""
+
+    QUEUED = "Q"
+    REGISTERED = "R"
+    SKIPPED = "S"
+    FAILED = "F"
+
+
+class DOIRegistration(db.Model, db.Timestamp):
+    """A DOI queued for registration with DataCite."""
+
+    __tablename__ = "tugraz_doi_registration"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    doi = db.Column(db.String(255), nullable=False, unique=True)
+
+    recid = db.Column(db.String(255), nullable=False)
+    """Id of the record whose metadata is registered."""
+
+    parent = db.Column(db.Boolean, nullable=False, default=False)
+    """Whether the DOI is the concept DOI of the record's parent."""
+
+    status = db.Column(
+        ChoiceType(DOIRegistrationStatus, impl=db.CHAR(1)),
+        nullable=False,
+        default=DOIRegistrationStatus.QUEUED,
+        index=True,
+    )
+
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+
+    error = db.Column(db.Text, nullable=True)
+
+
+class UploadUsage(db.Model):
+    """Files and bytes committed to the drafts of a draft or user.
+
+    Maintained incrementally by ``UploadUsageComponent``, so that quota
+    checks don't sum the files of the drafts.
+    """
+
+    __tablename__ = "tugraz_upload_usage"
+
+    owner_type = db.Column(db.String(8), primary_key=True)
+    """Either ``draft`` or ``user``."""
+
+    owner_id = db.Column(db.String(64), primary_key=True)
+
+    files = db.Column(db.Integer, nullable=False, default=0)
+
+    bytes = db.Column(db.BigInteger, nullable=False, default=0)
+
+
+class MultipartChecksum(db.Model):
+    """MD5 of a part of a multipart upload, computed while it's written."""
+
+    __tablename__ = "tugraz_multipart_checksum"
+
+    file_id = db.Column(UUIDType, primary_key=True)
+    """Id of the file instance being uploaded."""
+
+    part = db.Column(db.Integer, primary_key=True, autoincrement=False)
+
+    checksum = db.Column(db.String(32), nullable=False)
+
+
+class CurationQueueEntry(db.Model):
+    """An open curation request, denormalized for the curators' dashboard.
+
+    Maintained by ``CurationQueueComponent`` on every event of the request.
+    """
+
+    __tablename__ = "tugraz_curation_queue"
+
+    __table_args__ = (
+        db.Index("ix_tugraz_curation_queue_status_created", "status", "created"),
+        db.Index("ix_tugraz_curation_queue_assignee_created", "assignee", "created"),
+    )
+
+    request_id = db.Column(UUIDType, primary_key=True)
+
+    number = db.Column(db.String(50), nullable=True)
+
+    status = db.Column(db.String(32), nullable=False)
+
+    topic = db.Column(db.String(64), nullable=True)
+    """Id of the record to curate."""
+
+    created_by = db.Column(db.String(64), nullable=True)
+    """Id of the user who submitted the record."""
+
+    assignee = db.Column(db.String(64), nullable=True)
+    """Id of the first user among the request's reviewers."""
+
+    created = db.Column(db.UTCDateTime, nullable=False)
+    """Creation of the request, the age of the entry is counted from."""
+
+    updated = db.Column(db.UTCDateTime, nullable=False)
+    """Last event of the request."""
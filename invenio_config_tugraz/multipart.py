@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Checksums of multipart uploads, computed as the parts arrive.
+
+Without a checksum at commit, invenio-records-resources computes the MD5 of
+a multipart upload in a celery task, reading the whole file serially again.
+Instead, each part is hashed while it's written, and at commit the part
+checksums are combined into the S3 style multipart checksum
+``multipart:<md5 of the parts' md5s>-<parts>-<part size>``, which needs no
+read of the file. A single part upload gets its plain ``md5:`` checksum.
+"""
+
+import hashlib
+from typing import IO
+from uuid import UUID
+
+from invenio_db import db
+from sqlalchemy import select
+
+from .models import MultipartChecksum
+from .utils import upsert
+
+
+class HashingStream:
+    """Read-through stream computing the MD5 of what was read."""
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        """Construct."""
+        self.stream = stream
+        self.md5 = hashlib.md5(usedforsecurity=False)
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read and hash."""
+        chunk = self.stream.read(size)
+        self.md5.update(chunk)
+        self.bytes_read += len(chunk)
+        return chunk
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate everything else to the stream."""
+        return getattr(self.stream, name)
+
+
+def store_part_checksum(file_id: UUID, part: int, checksum: str) -> None:
+    """Store the checksum of a part, replacing the one of an earlier attempt."""
+    stmt = upsert(
+        MultipartChecksum,
+        [{"file_id": file_id, "part": part, "checksum": checksum}],
+    )
+    db.session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[MultipartChecksum.file_id, MultipartChecksum.part],
+            set_={"checksum": stmt.excluded.checksum},
+        ),
+    )
+
+
+def delete_part_checksums(file_id: UUID) -> None:
+    """Delete the part checksums of an upload."""
+    db.session.execute(
+        MultipartChecksum.__table__.delete().where(
+            MultipartChecksum.file_id == file_id,
+        ),
+    )
+
+
+def combined_checksum(file_id: UUID, parts: int, part_size: int) -> str | None:
+    """Combine the part checksums, None unless every part has one."""
+    checksums = db.session.execute(
+        select(MultipartChecksum.part, MultipartChecksum.checksum)
+        .filter_by(file_id=file_id)
+        .order_by(MultipartChecksum.part),
+    ).all()
+
+    if [part for part, _ in checksums] != list(range(1, parts + 1)):
+        return None
+    if parts == 1:
+        return f"md5:{checksums[0].checksum}"
+
+    digests = b"".join(bytes.fromhex(checksum) for _, checksum in checksums)
+    md5 = hashlib.md5(digests, usedforsecurity=False).hexdigest()
+    return f"multipart:{md5}-{parts}-{part_size}"
@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2025 Graz University of Technology.
+# Copyright (C) 2025-2026 Graz University of Technology.
 #
 # invenio-config-tugraz is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
 # details.
 
-"""Notification builders."""
+"""Notification builders and backends."""
 
+from .backends import TUGRAZ_NOTIFICATIONS_BACKENDS, DigestEmailNotificationBackend
 from .builders import TUGRAZ_NOTIFICATIONS_BUILDERS
 
-__all__ = ("TUGRAZ_NOTIFICATIONS_BUILDERS",)
+__all__ = (
+    "TUGRAZ_NOTIFICATIONS_BACKENDS",
+    "TUGRAZ_NOTIFICATIONS_BUILDERS",
+    "DigestEmailNotificationBackend",
+)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Notification backends with digest support for TU Graz Repo."""
+
+from collections.abc import Iterable
+
+from flask import current_app
+from invenio_curations.config import CURATIONS_NOTIFICATIONS_BUILDERS
+from invenio_notifications.backends import EmailNotificationBackend
+from invenio_notifications.models import Notification, Recipient
+from marshmallow_utils.html import strip_html
+
+from .tasks import queue_digest_entry
+
+
+class DigestEmailNotificationBackend(EmailNotificationBackend):
+    """E-Mail backend coalescing notifications per recipient.
+
+    Notifications of the given types are rendered right away, but instead of
+    being sent they are queued per recipient. All recipients' queues are sent
+    as one digest e-mail each, after ``CONFIG_TUGRAZ_NOTIFICATIONS_DIGEST_WINDOW``
+    seconds, over a single SMTP connection. Other types are sent immediately.
+    """
+
+    def __init__(self, types: Iterable[str] = ()) -> None:
+        """Construct."""
+        self.types = frozenset(types)
+
+    def send(self, notification: Notification, recipient: Recipient) -> None:
+        """Queue the notification, or send it if it isn't to be digested."""
+        if notification.type not in self.types:
+            return super().send(notification, recipient)
+
+        email = self._resolve_email(recipient)
+        if not email:
+            current_app.logger.warning(
+                "Cannot queue notification digest entry: no email address found "
+                "for recipient. Recipient data: %s",
+                recipient.data,
+            )
+            return None
+
+        content = self.render_template(notification, recipient)
+        queue_digest_entry(
+            email,
+            {
+                "subject": content["subject"],
+                "html_body": content["html_body"],
+                "plain_body": strip_html(content["plain_body"]),
+            },
+        )
+        return None
+
+
+TUGRAZ_NOTIFICATIONS_BACKENDS = {
+    DigestEmailNotificationBackend.id: DigestEmailNotificationBackend(
+        types=CURATIONS_NOTIFICATIONS_BUILDERS.keys(),
+    ),
+}
+"""TU Graz notification backends.
+
+Curation notifications are sent as digests, all others are sent right away.
+
+To use: override in invenio.cfg. NOTIFICATIONS_BACKENDS = TUGRAZ_NOTIFICATIONS_BACKENDS
+"""
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Celery tasks and queue handling of notification digests."""
+
+import json
+import smtplib
+
+from celery import shared_task
+from flask import current_app
+from flask_mail import Message
+
+from invenio_config_tugraz.utils import get_redis
+
+DIGEST_RECIPIENTS_KEY = "tugraz:digest:recipients"
+"""Redis set of the recipients having queued digest entries."""
+
+DIGEST_SCHEDULED_KEY = "tugraz:digest:scheduled"
+"""Redis key marking that sending the current window's digests is scheduled."""
+
+DIGEST_ATTEMPTS_KEY = "tugraz:digest:attempts"
+"""Redis hash of the failed deliveries of each recipient's digest."""
+
+PERMANENT_FAILURE = 500
+"""Lowest SMTP reply code refusing a delivery for good."""
+
+
+def digest_entries_key(email: str) -> str:
+    """Redis list holding the queued digest entries of a recipient."""
+    return f"tugraz:digest:entries:{email}"
+
+
+def queue_digest_entry(email: str, entry: dict) -> None:
+    """Append a rendered notification to the digest of a recipient."""
+    redis = get_redis()
+    with redis.pipeline() as pipe:
+        pipe.rpush(digest_entries_key(email), json.dumps(entry))
+        pipe.sadd(DIGEST_RECIPIENTS_KEY, email)
+        pipe.execute()
+
+    schedule_digests()
+
+
+def requeue_digests(digests: dict[str, list[dict]]) -> None:
+    """Put digests back in front of the queue, e.g. after a failed delivery.
+
+    Digests that failed ``CONFIG_TUGRAZ_NOTIFICATIONS_DIGEST_MAX_ATTEMPTS``
+    times are dropped.
+    """
+    redis = get_redis()
+    max_attempts = current_app.config["CONFIG_TUGRAZ_NOTIFICATIONS_DIGEST_MAX_ATTEMPTS"]
+    with redis.pipeline() as pipe:
+        for email in digests:
+            pipe.hincrby(DIGEST_ATTEMPTS_KEY, email, 1)
+        attempts = pipe.execute()
+
+    retry, dropped = {}, []
+    for (email, entries), count in zip(digests.items(), attempts, strict=True):
+        if count < max_attempts:
+            retry[email] = entries
+            continue
+        current_app.logger.error(
+            "dropping the digest to %s after %s failed deliveries",
+            email,
+            count,
+        )
+        dropped.append(email)
+    forget_attempts(dropped)
+    if not retry:
+        return
+
+    with redis.pipeline() as pipe:
+        for email, entries in retry.items():
+            pipe.lpush(digest_entries_key(email), *map(json.dumps, reversed(entries)))
+            pipe.sadd(DIGEST_RECIPIENTS_KEY, email)
+        pipe.execute()
+
+    schedule_digests()
+
+
+def forget_attempts(emails: list[str]) -> None:
+    """Reset the failed deliveries of the recipients' digests."""
+    if emails:
+        get_redis().hdel(DIGEST_ATTEMPTS_KEY, *emails)
+
+
+def schedule_digests() -> None:
+    """Schedule sending the digests of the current window, if not done yet."""
+    window = current_app.config["CONFIG_TUGRAZ_NOTIFICATIONS_DIGEST_WINDOW"]
+    if get_redis().set(DIGEST_SCHEDULED_KEY, 1, nx=True, ex=window * 2):
+        send_notification_digests.apply_async(countdown=window)
+
+
+def pop_digests() -> dict[str, list[dict]]:
+    """Remove all queued digest entries and return them by recipient."""
+    redis = get_redis()
+
+    # entries queued from here on belong to the next window
+    redis.delete(DIGEST_SCHEDULED_KEY)
+
+    digests = {}
+    while email := redis.spop(DIGEST_RECIPIENTS_KEY):
+        email = email.decode() if isinstance(email, bytes) else email
+        with redis.pipeline() as pipe:
+            pipe.lrange(digest_entries_key(email), 0, -1)
+            pipe.delete(digest_entries_key(email))
+            entries, _ = pipe.execute()
+        if entries:
+            digests[email] = [json.loads(entry) for entry in entries]
+
+    return digests
+
+
+def build_digest_message(email: str, entries: list[dict]) -> Message:
+    """Render the digest e-mail of one recipient."""
+    config = current_app.config
+    if len(entries) == 1:
+        subject = entries[0]["subject"]
+        body = entries[0]["plain_body"]
+        html = entries[0]["html_body"]
+    else:
+        subject = str(config["CONFIG_TUGRAZ_NOTIFICATIONS_DIGEST_SUBJECT"])
+        separator = "\n\n" + "-" * 72 + "\n\n"
+        body = separator.join(
+            f"{entry['subject']}\n\n{entry['plain_body']}" for entry in entries
+        )
+        html = "<hr>".join(
+            f"<h3>{entry['subject']}</h3>{entry['html_body']}" for entry in entries
+        )
+
+    return Message(
+        subject=subject,
+        recipients=[email],
+        body=body,
+        html=html,
+        sender=config["MAIL_DEFAULT_SENDER"],
+        reply_to=config.get("MAIL_DEFAULT_REPLY_TO"),
+    )
+
+
+def is_permanent_failure(error: smtplib.SMTPException) -> bool:
+    """Whether the server refused the delivery for good, with a 5xx reply."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= PERMANENT_FAILURE for code, _ in error.recipients.values())
+    return (
+        isinstance(error, smtplib.SMTPResponseException)
+        and error.smtp_code >= PERMANENT_FAILURE
+    )
+
+
+def send_digests(digests: dict[str, list[dict]]) -> dict[str, list[dict]]:
+    """Send the digests of all recipients over one SMTP connection.
+
+    Returns the digests that could not be sent, all of those not sent yet if
+    the connection fails. Digests refused for good are logged and dropped.
+    """
+    failed = {}
+    if not digests:
+        return failed
+
+    unsent = dict(digests)
+    try:
+        with current_app.extensions["mail"].connect() as connection:
+            for email, entries in digests.items():
+                try:
+                    connection.send(build_digest_message(email, entries))
+                except smtplib.SMTPException as error:
+                    if is_permanent_failure(error):
+                        current_app.logger.exception(
+                            "dropping the digest to %s, refused by the server",
+                            email,
+                        )
+                    else:
+                        current_app.logger.exception(
+                            "sending digest to %s failed",
+                            email,
+                        )
+                        failed[email] = entries
+                del unsent[email]
+    except Exception:
+        current_app.logger.exception("sending digests failed")
+        failed.update(unsent)
+    return failed
+
+
+@shared_task(ignore_result=True)
+def send_notification_digests() -> None:
+    """Send the queued notification digests of the current window."""
+    digests = pop_digests()
+    failed = send_digests(digests)
+    forget_attempts([email for email in digests if email not in failed])
+    if failed:
+        requeue_digests(failed)
@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""OAI-PMH fast path for full harvests.
+
+Harvesters (OpenAIRE, BASE, ...) sweep the whole repository with
+``ListRecords``. invenio-oaiserver pages these with scroll contexts held open
+on the search cluster, percolates the sets of every page anew and serializes
+every record anew. With ``CONFIG_TUGRAZ_OAI_FAST_PATH`` set:
+
+- resumption tokens carry an OpenSearch ``search_after`` cursor, no search
+  context is kept open between the harvester's requests
+- the set membership of each record revision is cached, it is percolated
+  only once (or precomputed with ``invenio tugraz oai-sets``)
+- the serialized payloads of ``CONFIG_TUGRAZ_OAI_CACHED_FORMATS`` are cached
+  per record revision
+
+Resumption tokens issued before enabling the fast path are still answered by
+invenio-oaiserver.
+"""
+
+import random
+from collections.abc import Callable, Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+
+from flask import Flask, current_app, make_response
+from flask_login import current_user
+from invenio_cache import current_cache
+from invenio_db import db
+from invenio_oaiserver import response as xml
+from invenio_oaiserver.errors import OAINoRecordsMatchError
+from invenio_oaiserver.models import OAISet
+from invenio_oaiserver.percolator import sets_search_all
+from invenio_oaiserver.proxies import current_oaiserver
+from invenio_oaiserver.response import NS_OAIPMH, header, verb
+from invenio_oaiserver.utils import (
+    about_serializer,
+    datetime_to_datestamp,
+    serializer,
+)
+from invenio_oaiserver.verbs import Verbs, make_request_validator
+from invenio_search.engine import dsl
+from itsdangerous import URLSafeTimedSerializer
+from lxml import etree
+from lxml.etree import SubElement
+from sqlalchemy import func
+from webargs.flaskparser import FlaskParser
+from werkzeug import Response
+from werkzeug.utils import import_string
+
+from .utils import search_after_pages
+
+FAST_VERBS = ("ListRecords", "ListIdentifiers")
+"""Verbs answered by the fast path."""
+
+
+def revision_key(source: dict) -> str | None:
+    """Return the key of the record revision, if the document has one."""
+    if "uuid" not in source or "version_id" not in source:
+        return None
+    return f"{source['uuid']}:{source['version_id']}"
+
+
+def cached_serializer(
+    pid: object,
+    record: dict,
+    serializer: str | Callable,
+    metadata_prefix: str,
+    **kwargs: dict,
+) -> etree._Element:
+    """Serialize the record, cached per revision.
+
+    Only payloads for anonymous harvesters are cached, as the serializers
+    may render records depending on the identity.
+    """
+    if isinstance(serializer, str):
+        serializer = import_string(serializer)
+
+    key = revision_key(record["_source"])
+    if key is None or current_user.is_authenticated:
+        return serializer(pid, record, **kwargs)
+
+    cache_key = f"tugraz:oai:{metadata_prefix}:{key}"
+    if (payload := current_cache.get(cache_key)) is not None:
+        return etree.fromstring(payload)
+
+    element = serializer(pid, record, **kwargs)
+    current_cache.set(
+        cache_key,
+        etree.tostring(element),
+        timeout=current_app.config["CONFIG_TUGRAZ_OAI_CACHE_TIMEOUT"],
+    )
+    return element
+
+
+def _sets_generation() -> str:
+    # changes whenever a set is created, updated or deleted
+    updated, count = db.session.query(
+        func.max(OAISet.updated),
+        func.count(OAISet.id),
+    ).one()
+    return f"{updated.timestamp() if updated else 0}-{count}"
+
+
+def record_sets(sources: list[dict]) -> list[list[str]]:
+    """Return the set specs of each record, percolating only uncached ones."""
+    generation = _sets_generation()
+    keys = [
+        f"tugraz:oai-sets:{generation}:{key}" if (key := revision_key(s)) else None
+        for s in sources
+    ]
+    cached = current_cache.get_many(*[key for key in keys if key])
+    cached = dict(zip([key for key in keys if key], cached, strict=True))
+
+    sets = [cached.get(key) if key else None for key in keys]
+    missing = [index for index, specs in enumerate(sets) if specs is None]
+    if missing:
+        percolated = sets_search_all([sources[index] for index in missing])
+        for index, specs in zip(missing, percolated, strict=True):
+            sets[index] = specs
+        current_cache.set_many(
+            {keys[i]: sets[i] for i in missing if keys[i]},
+            timeout=current_app.config["CONFIG_TUGRAZ_OAI_CACHE_TIMEOUT"],
+        )
+    return sets
+
+
+def cached_record_sets_fetcher(record: dict) -> list[str]:
+    """Fetch a record's sets, usable as ``OAISERVER_RECORD_SETS_FETCHER``."""
+    return record_sets([record])[0]
+
+
+def oai_search() -> dsl.Search:
+    """Return the search of OAI records, in a stable order for ``search_after``."""
+    index = current_app.config["OAISERVER_RECORD_INDEX"]
+    return current_oaiserver.search_cls(index=index).sort(
+        {current_oaiserver.last_update_key: "asc"},
+        {current_app.config["CONFIG_TUGRAZ_OAI_TIEBREAKER"]: "asc"},
+    )
+
+
+def harvest_args(kwargs: dict) -> dict:
+    """Return the arguments of the harvest, including those of its resumption token.
+
+    A resumption request only carries the token, the ``set``, ``from`` and
+    ``until`` of the harvest's first request are in the token's ``kwargs``.
+    """
+    return {**kwargs, **kwargs.get("resumptionToken", {}).get("kwargs", {})}
+
+
+class SearchAfterPagination:
+    """Page of OAI records addressed by a ``search_after`` cursor."""
+
+    def __init__(self, **kwargs: dict) -> None:
+        """Search the page following the resumption token's cursor."""
+        config = current_app.config
+        token = kwargs.get("resumptionToken", {})
+        kwargs = harvest_args(kwargs)
+        self.page = token.get("page", 1)
+        self.per_page = config["OAISERVER_PAGE_SIZE"]
+
+        search = oai_search()
+        if "set" in kwargs:
+            search = search.query(
+                current_oaiserver.set_records_query_fetcher(kwargs["set"]),
+            )
+        time_range = {}
+        if "from_" in kwargs:
+            time_range["gte"] = kwargs["from_"]
+        if "until" in kwargs:
+            time_range["lte"] = kwargs["until"]
+        if time_range:
+            search = search.filter(
+                "range",
+                **{current_oaiserver.last_update_key: time_range},
+            )
+
+        # the total is only counted for the first page, then passed on; in
+        # full, as the search engine stops counting at 10000 hits by default
+        search = search.extra(track_total_hits="total" not in token)
+        response = next(
+            search_after_pages(
+                search,
+                size=self.per_page,
+                after=token.get("search_after"),
+            ),
+        )
+        self.hits = response["hits"]["hits"]
+        self.total = (
+            token["total"] if "total" in token else response["hits"]["total"]["value"]
+        )
+        if self.total == 0:
+            raise OAINoRecordsMatchError
+
+    @property
+    def has_next(self) -> bool:
+        """Return True if there is a next page."""
+        return len(self.hits) == self.per_page and (
+            self.page * self.per_page < self.total
+        )
+
+    @property
+    def next_num(self) -> int | None:
+        """Return the next page number."""
+        return self.page + 1 if self.has_next else None
+
+    @property
+    def search_after(self) -> list:
+        """Return the cursor of the next page."""
+        return self.hits[-1]["sort"]
+
+    @property
+    def items(self) -> Iterator[dict]:
+        """Return the records of the page."""
+        last_update_key = current_oaiserver.last_update_key
+        for hit in self.hits:
+            yield {
+                "id": hit["_id"],
+                "json": hit,
+                "updated": datetime.strptime(  # noqa: DTZ007
+                    hit["_source"][last_update_key][:19],
+                    "%Y-%m-%dT%H:%M:%S",
+                ),
+            }
+
+
+def serialize_token(pagination: SearchAfterPagination, **kwargs: dict) -> str | None:
+    """Return the resumption token of the next page, including its cursor.
+
+    The format is invenio-oaiserver's, so that its validation accepts it.
+    """
+    if not pagination.has_next:
+        return None
+
+    token_builder = URLSafeTimedSerializer(
+        current_app.config["SECRET_KEY"],
+        salt=kwargs["verb"],
+    )
+    return token_builder.dumps(
+        {
+            "seed": random.random(),  # noqa: S311
+            "page": pagination.next_num,
+            "kwargs": getattr(Verbs, kwargs["verb"])(partial=False).dump(
+                harvest_args(kwargs),
+            ),
+            "search_after": pagination.search_after,
+            "total": pagination.total,
+        },
+    )
+
+
+def resumption_token(
+    parent: etree._Element,
+    pagination: SearchAfterPagination,
+    **kwargs: dict,
+) -> None:
+    """Attach the resumption token element to a parent."""
+    if pagination.page == 1 and not pagination.has_next:
+        return
+
+    e_token = SubElement(parent, etree.QName(NS_OAIPMH, "resumptionToken"))
+    expiration_date = datetime.now(UTC) + timedelta(
+        seconds=current_app.config["OAISERVER_RESUMPTION_TOKEN_EXPIRE_TIME"],
+    )
+    e_token.set("expirationDate", datetime_to_datestamp(expiration_date))
+    e_token.set("cursor", str((pagination.page - 1) * pagination.per_page))
+    e_token.set("completeListSize", str(pagination.total))
+    if token := serialize_token(pagination, **kwargs):
+        e_token.text = token
+
+
+def _records(
+    parent: etree._Element,
+    records: list[dict],
+    metadata_prefix: str | None,
+) -> None:
+    sets = record_sets([record["json"]["_source"] for record in records])
+    record_dumper = serializer(metadata_prefix) if metadata_prefix else None
+    about_dumper = about_serializer(metadata_prefix) if metadata_prefix else None
+
+    for record, specs in zip(records, sets, strict=True):
+        pid = current_oaiserver.oaiid_fetcher(record["id"], record["json"]["_source"])
+        if record_dumper is None:
+            header(parent, pid.pid_value, record["updated"], sets=specs)
+            continue
+
+        e_record = SubElement(parent, etree.QName(NS_OAIPMH, "record"))
+        header(e_record, pid.pid_value, record["updated"], sets=specs)
+        e_metadata = SubElement(e_record, etree.QName(NS_OAIPMH, "metadata"))
+        e_metadata.append(record_dumper(pid, record["json"]))
+        if about_dumper and (payload := about_dumper(pid, record["json"])) is not None:
+            e_about = SubElement(e_record, etree.QName(NS_OAIPMH, "about"))
+            e_about.append(payload)
+
+
+def listrecords(**kwargs: dict) -> etree._Element:
+    """Create the response of ListRecords and ListIdentifiers."""
+    e_tree, e_list = verb(**kwargs)
+    pagination = SearchAfterPagination(**kwargs)
+
+    metadata_prefix = None
+    if kwargs["verb"] == "ListRecords":
+        metadata_prefix = harvest_args(kwargs)["metadataPrefix"]
+
+    _records(e_list, list(pagination.items), metadata_prefix)
+    resumption_token(e_list, pagination, **kwargs)
+    return e_tree
+
+
+@FlaskParser(location="querystring").use_args(make_request_validator)
+def oai_response(args: dict) -> Response:
+    """OAI-PMH endpoint answering full harvests via the fast path."""
+    token = args.get("resumptionToken")
+    if args["verb"] in FAST_VERBS and (not token or "search_after" in token):
+        e_tree = listrecords(**args)
+    else:
+        e_tree = getattr(xml, args["verb"].lower())(**args)
+
+    response = make_response(
+        etree.tostring(
+            e_tree,
+            pretty_print=True,
+            xml_declaration=True,
+            encoding="UTF-8",
+        ),
+    )
+    response.headers["Content-Type"] = "text/xml"
+    return response
+
+
+def cache_metadata_formats(formats: dict, prefixes: Iterable[str]) -> dict:
+    """Return the metadata formats with the given prefixes' serializers cached."""
+    formats = {prefix: dict(fmt) for prefix, fmt in formats.items()}
+    for prefix in prefixes:
+        if prefix not in formats:
+            continue
+        name, kwargs = formats[prefix]["serializer"], {}
+        if isinstance(name, tuple):
+            name, kwargs = name
+        if name == "invenio_config_tugraz.oai:cached_serializer":
+            continue
+        formats[prefix]["serializer"] = (
+            "invenio_config_tugraz.oai:cached_serializer",
+            {**kwargs, "serializer": name, "metadata_prefix": prefix},
+        )
+    return formats
+
+
+def init_oai_fast_path(app: Flask) -> None:
+    """Route full harvests through the fast path and cache payloads."""
+    if not app.config.get("CONFIG_TUGRAZ_OAI_FAST_PATH"):
+        return
+    if "invenio_oaiserver.response" not in app.view_functions:
+        return
+
+    app.config["OAISERVER_METADATA_FORMATS"] = cache_metadata_formats(
+        app.config["OAISERVER_METADATA_FORMATS"],
+        app.config["CONFIG_TUGRAZ_OAI_CACHED_FORMATS"],
+    )
+    app.config["OAISERVER_RECORD_SETS_FETCHER"] = cached_record_sets_fetcher
+    app.view_functions["invenio_oaiserver.response"] = oai_response
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Request-scoped memo of the curation states of records.
+
+The curation generators of invenio-curations search for the curation
+request of a record each time they are evaluated: accepting a community
+submission searches twice (``IfCurationRequestBasedExists``, then
+``IfCurationRequestAccepted``), and a list of requests searches once per
+row. Here, the curation requests of many records are loaded in one search,
+and kept in ``flask.g`` for the rest of the request.
+
+The requests search loads the states of all record topics on a result page
+(``PermissionsPrefetchComponent``), and the memo is cleared after each
+commit of a requests change (``PermissionMemosComponent``).
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from flask import g
+from invenio_access.permissions import system_identity
+from invenio_curations.requests.curation import CurationRequest
+from invenio_requests.proxies import current_requests_service
+from invenio_search.engine import dsl
+
+MEMO = "tugraz_curation_states"
+
+
+class CurationState(NamedTuple):
+    """Curation state of a record."""
+
+    exists: bool
+    """Whether the record has a curation request."""
+
+    accepted: bool
+    """Whether a curation request of the record has been accepted and closed."""
+
+
+def topic_key(reference: dict) -> tuple[str, str]:
+    """Return the key of a topic reference, e.g. ``("record", "abcd-1234")``."""
+    key, value = next(iter(reference.items()))
+    return key, str(value)
+
+
+def _memo() -> dict[tuple[str, str], CurationState]:
+    return g.setdefault(MEMO, {})
+
+
+def load_curation_states(references: Iterable[dict]) -> None:
+    """Load the curation states of the topics missing from the memo, in one search."""
+    memo = _memo()
+    missing = {topic_key(reference) for reference in references} - memo.keys()
+    if not missing:
+        return
+
+    values = defaultdict(list)
+    for key, value in missing:
+        values[key].append(value)
+    topics = dsl.Q(
+        "bool",
+        should=[dsl.Q("terms", **{f"topic.{key}": ids}) for key, ids in values.items()],
+        minimum_should_match=1,
+    )
+    search = current_requests_service._search(  # noqa: SLF001
+        "scan",
+        system_identity,
+        {},
+        None,
+        extra_filter=dsl.Q("term", type=CurationRequest.type_id) & topics,
+    ).source(["topic", "status", "is_open"])
+
+    requests = defaultdict(list)
+    for hit in search.scan():
+        source = hit.to_dict()
+        requests[topic_key(source["topic"])].append(source)
+
+    for key in missing:
+        memo[key] = CurationState(
+            exists=bool(requests[key]),
+            accepted=any(
+                request["status"] == "accepted" and not request["is_open"]
+                for request in requests[key]
+            ),
+        )
+
+
+def curation_state(reference: dict) -> CurationState:
+    """Return the curation state of a topic, loading it if not memoized."""
+    load_curation_states([reference])
+    return _memo()[topic_key(reference)]
+
+
+def clear_curation_states() -> None:
+    """Forget the memoized curation states."""
+    g.pop(MEMO, None)
+
+
+def prefetch_curation_states(hits: list[dict]) -> None:
+    """Load the curation states of the record topics of requests search hits."""
+    load_curation_states(
+        {"record": topic["record"]}
+        for hit in hits
+        if "record" in (topic := hit.get("_source", {}).get("topic") or {})
+    )
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2020-2024 Graz University of Technology.
+# Copyright (C) 2020-2026 Graz University of Technology.
 #
 # invenio-config-tugraz is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
@@ -45,7 +45,10 @@ method specifies those from the actor's point-of-view in search scenarios.
 
 """
 
+import operator
+from functools import reduce
 from ipaddress import ip_address, ip_network
+from itertools import chain
 from typing import Any
 
 from flask import current_app, request
@@ -54,10 +57,31 @@ from invenio_access.permissions import any_user
 from invenio_communities.communities.records.api import Community
 from invenio_communities.generators import CommunityRoleNeed
 from invenio_communities.proxies import current_roles
+from invenio_curations.services.generators import (
+    IfCurationRecordBasedExists,
+    IfCurationRequestAccepted,
+    IfCurationRequestBasedExists,
+    IfRequestTypes,
+    TopicPermission,
+)
+from invenio_pidstore.errors import PIDDoesNotExistError
+from invenio_rdm_records.records.api import RDMDraft
+from invenio_rdm_records.services.generators import (
+    AccessGrant,
+    IfRequestType,
+    RecordCommunitiesAction,
+    RecordOwners,
+)
 from invenio_records_permissions.generators import Generator
+from invenio_requests.customizations import RequestType
+from invenio_requests.records.api import Request
+from invenio_requests.resolvers.registry import ResolverRegistry
 from invenio_search.engine import dsl
 
+from .curations import curation_state
+from .identities import checked_parent_needs
 from .roles import tugraz_authenticated_user
+from .topics import topic_permissions, topic_record
 
 
 class RecordSingleIP(Generator):
@@ -229,3 +253,202 @@ class TUGrazAuthenticatedButNotCommunityMembers(Generator):
             return []
         community_id = str(record.id)
         return [CommunityRoleNeed(community_id, r.name) for r in current_roles]
+
+
+def flatten_request_type_conditions(
+    generators: list[Generator],
+    request_type: type[RequestType] | None,
+) -> list[Generator]:
+    """Resolve the request type conditions of the generators for a request type.
+
+    ``IfRequestTypes`` and ``IfRequestType`` are replaced by the generators of
+    the branch they take for requests of `request_type` (``None`` standing for
+    no request), recursively. The other generators are kept.
+    """
+    flattened = []
+    for generator in generators:
+        if isinstance(generator, IfRequestTypes):
+            matches = request_type is not None and any(
+                issubclass(request_type, cls) for cls in generator.request_types
+            )
+        elif isinstance(generator, IfRequestType):
+            matches = request_type is not None and issubclass(
+                request_type,
+                generator.request_type,
+            )
+        else:
+            flattened.append(generator)
+            continue
+
+        branch = generator.then_ if matches else generator.else_
+        flattened += flatten_request_type_conditions(branch, request_type)
+    return flattened
+
+
+class RequestTypeDispatch(Generator):
+    """Dispatch the generators of a requests permission by request type.
+
+    The request type conditions among the generators are resolved once per
+    request type, and kept in a table keyed by the type's id, so that
+    evaluating the permission of a request is a lookup instead of checking
+    the conditions for each request of a search result.
+
+    Like ``IfRequestTypes``, the conditions don't take part in query filters.
+    """
+
+    def __init__(self, generators: list[Generator]) -> None:
+        """Construct."""
+        self.generators = generators
+        self._dispatch: dict[str | None, list[Generator]] = {}
+        super().__init__()
+
+    def generators_for(self, request_type: type[RequestType] | None) -> list[Generator]:
+        """Return the flattened generators for requests of the type."""
+        type_id = request_type.type_id if request_type is not None else None
+        try:
+            return self._dispatch[type_id]
+        except KeyError:
+            generators = flatten_request_type_conditions(self.generators, request_type)
+            self._dispatch[type_id] = generators
+            return generators
+
+    def _generators(self, request: Request | None) -> list[Generator]:
+        request_type = type(request.type) if request is not None else None
+        return self.generators_for(request_type)
+
+    def needs(self, request: Request | None = None, **kwargs: dict) -> set[Need]:
+        """Set of Needs granting permission."""
+        needs = [g.needs(request=request, **kwargs) for g in self._generators(request)]
+        return set(chain.from_iterable(needs))
+
+    def excludes(self, request: Request | None = None, **kwargs: dict) -> set[Need]:
+        """Set of Needs denying permission."""
+        excludes = [
+            g.excludes(request=request, **kwargs) for g in self._generators(request)
+        ]
+        return set(chain.from_iterable(excludes))
+
+    def query_filter(self, **kwargs: dict) -> Any:  # noqa: ANN401
+        """Combine the query filters of the generators."""
+        queries = [g.query_filter(**kwargs) for g in self.generators]
+        queries = [q for q in queries if q]
+        return reduce(operator.or_, queries) if queries else None
+
+
+class TUGrazIfCurationRequestBasedExists(IfCurationRequestBasedExists):
+    """Check if the topic of the request has a curation request, from the memo.
+
+    The topic's reference is used as is, instead of resolving the topic.
+    """
+
+    def _condition(self, request: Request | None = None, **__: dict) -> bool:
+        """Check if a curation request exists for the request's topic."""
+        if request is None:
+            return False
+        return curation_state(request.topic.reference_dict).exists
+
+
+class TUGrazIfCurationRequestAccepted(IfCurationRequestAccepted):
+    """Check if the curation of the request's topic was accepted, from the memo."""
+
+    def _condition(self, request: Request | None = None, **__: dict) -> bool:
+        """Check if the curation request of the request's topic was accepted."""
+        if request is None:
+            return False
+        return curation_state(request.topic.reference_dict).accepted
+
+
+class TUGrazIfCurationRecordBasedExists(IfCurationRecordBasedExists):
+    """Check if the record has a curation request, from the memo."""
+
+    def _condition(self, record: RDMDraft | None = None, **__: dict) -> bool:
+        """Check if a curation request exists for the record."""
+        if record is None:
+            return False
+        return curation_state(ResolverRegistry.reference_entity(record)).exists
+
+
+class TUGrazTopicPermission(TopicPermission):
+    """``TopicPermission`` evaluated once per record topic and request.
+
+    The needs and excludes of the topic's permission only depend on the
+    record, so they are computed together and kept in a request-scoped memo,
+    shared by all identities checked during the request.
+    """
+
+    def _evaluate(self, request: Request, **kwargs: dict) -> tuple[set, set]:
+        entity = self._get_entity(request)
+        pid_value = entity.reference_dict.get("record")
+        memo = topic_permissions()
+        key = (self.permission_name, pid_value)
+        if pid_value is not None and key in memo:
+            return memo[key]
+
+        record = topic_record(pid_value) if pid_value is not None else None
+        if record is None:
+            try:
+                record = entity.resolve()
+            except PIDDoesNotExistError:
+                # like `TopicPermission`, deleted topics grant nothing
+                return set(), set()
+
+        service_config = entity.get_resolver().get_service().config
+        context = {
+            **kwargs,
+            "record": record,
+            "permission_policy": service_config.permission_policy_cls,
+        }
+        generators = self._get_permission(entity)
+        outcome = (
+            set(chain.from_iterable(g.needs(**context) for g in generators)),
+            set(chain.from_iterable(g.excludes(**context) for g in generators)),
+        )
+        if pid_value is not None:
+            memo[key] = outcome
+        return outcome
+
+    def needs(self, request: Request | None = None, **kwargs: dict) -> set[Need]:
+        """Set of Needs granting permission."""
+        if request is None:
+            return set()
+        return self._evaluate(request, **kwargs)[0]
+
+    def excludes(self, request: Request | None = None, **kwargs: dict) -> set[Need]:
+        """Set of Needs denying permission."""
+        if request is None:
+            return set()
+        return self._evaluate(request, **kwargs)[1]
+
+
+class TUGrazRecordOwners(RecordOwners):
+    """``RecordOwners`` answering with the memoized needs of the checked identity."""
+
+    def needs(self, record: RDMDraft | None = None, **kwargs: dict) -> list[Need]:
+        """Return the enabling needs."""
+        if (needs := checked_parent_needs(record)) is None:
+            return super().needs(record=record, **kwargs)
+        return list(needs.owners)
+
+
+class TUGrazAccessGrant(AccessGrant):
+    """``AccessGrant`` answering with the memoized needs of the checked identity."""
+
+    def needs(self, record: RDMDraft | None = None, **kwargs: dict) -> set[Need]:
+        """Return the enabling needs."""
+        if (needs := checked_parent_needs(record)) is None:
+            return super().needs(record=record, **kwargs)
+        return set(needs.grants.get(self._permission, set()))
+
+
+class TUGrazRecordCommunitiesAction(RecordCommunitiesAction):
+    """``RecordCommunitiesAction`` answering with the memoized needs of the checked identity.
+
+    Only for the ``curate`` action, the memo holds the curated communities.
+    """
+
+    def needs(self, record: RDMDraft | None = None, **kwargs: dict) -> set[Need]:
+        """Set of Needs granting permission."""
+        needs = checked_parent_needs(record)
+        if needs is None or self._action != "curate":
+            return super().needs(record=record, **kwargs)
+        return set(needs.curators)
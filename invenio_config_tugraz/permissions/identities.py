@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Request-scoped memo of the needs which parents grant the checked identity.
+
+``can_manage`` of the records policy, and thereby ``can_curate``,
+``can_review`` and ``can_preview``, loads the parent of each record, to list
+its owner, access grants and communities as needs. Instead, the needs of the
+checked identity are looked up for the record's parent id, loading the access
+of the parents missing from the memo with a query each:
+
+- the parents' owners and grants
+- the parents' communities which the identity curates, if any
+
+For a search, the parents of a page of hits are loaded in one go, once the
+response arrived (``ParentNeedsPrefetchComponent``), rather than one by one
+as the hits are checked.
+
+The ``TUGraz*`` generators then answer with the needs of the identity
+which the record grants. As the identity isn't passed to generators,
+``TUGrazRDMRecordPermissionPolicy.allows`` sets it for the check
+(:func:`checking`); elsewhere, the generators load the parents as usual.
+
+A parent's entries are dropped whenever it, or its communities, are flushed
+to the database (:func:`install_flush_listener`), so that e.g. a grant is taken
+into account by the next check of the same request.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import NamedTuple
+
+from flask import g, has_app_context
+from flask_principal import Identity, Need, UserNeed
+from invenio_communities.generators import CommunityRoleNeed
+from invenio_communities.proxies import current_roles
+from invenio_db import db
+from invenio_rdm_records.records.api import RDMParent
+from invenio_rdm_records.records.models import RDMParentCommunity
+from invenio_rdm_records.records.systemfields.access.grants import Grant
+from invenio_records.api import Record
+from sqlalchemy import event
+from sqlalchemy.orm import Session, UOWTransaction
+
+MEMO = "tugraz_parent_needs"
+
+GRANT_SUBJECT_TYPES = {"id": "user", "role": "role", "system_role": "system_role"}
+"""Need methods of an identity, by the grant subject types they stand for."""
+
+_checked_identity: ContextVar[Identity | None] = ContextVar(
+    "tugraz_checked_identity",
+    default=None,
+)
+
+
+class IdentitySubjects(NamedTuple):
+    """What a parent may grant an identity."""
+
+    user_id: int | None
+
+    subjects: set[tuple[str, str]]
+    """The grant subjects the identity stands for."""
+
+    curator_roles: dict[str, set[str]]
+    """The roles the identity holds in each community it curates."""
+
+
+class ParentNeeds(NamedTuple):
+    """The needs of an identity which a parent grants."""
+
+    owners: list[Need]
+
+    grants: dict[str, set[Need]]
+    """The granted needs, by permission."""
+
+    curators: set[Need]
+
+
+@contextmanager
+def checking(identity: Identity) -> Iterator[None]:
+    """Let the generators answer for the identity, while checking a permission."""
+    token = _checked_identity.set(identity)
+    try:
+        yield
+    finally:
+        _checked_identity.reset(token)
+
+
+def _user_id(identity: Identity) -> int | None:
+    return next(
+        (
+            need.value
+            for need in identity.provides
+            if need.method == "id" and isinstance(need.value, int)
+        ),
+        None,
+    )
+
+
+def grant_subjects(identity: Identity) -> set[tuple[str, str]]:
+    """Return the grant subjects the identity stands for, like ``AccessGrant``."""
+    return {
+        (GRANT_SUBJECT_TYPES[need.method], str(need.value))
+        for need in identity.provides
+        if need.method in GRANT_SUBJECT_TYPES
+    }
+
+
+def _curator_roles(identity: Identity) -> dict[str, set[str]]:
+    community_needs = [need for need in identity.provides if need.method == "community"]
+    roles = defaultdict(set)
+    if not community_needs:
+        return roles
+
+    curate = {role.name for role in current_roles.can("curate")}
+    for need in community_needs:
+        if need.role in curate:
+            roles[need.value].add(need.role)
+    return roles
+
+
+def identity_subjects(identity: Identity) -> IdentitySubjects:
+    """Return what a parent may grant the identity."""
+    return IdentitySubjects(
+        user_id=_user_id(identity),
+        subjects=grant_subjects(identity),
+        curator_roles=_curator_roles(identity),
+    )
+
+
+def parent_needs(
+    identity: IdentitySubjects,
+    access: dict,
+    communities: set[str],
+) -> ParentNeeds:
+    """Return the needs of the identity which a parent's access grants."""
+    owner = access.get("owned_by", {}).get("user")
+    owners = []
+    if identity.user_id is not None and str(owner) == str(identity.user_id):
+        owners = [UserNeed(identity.user_id)]
+
+    grants = defaultdict(set)
+    for dump in access.get("grants", []):
+        subject = dump["subject"]
+        if (subject["type"], str(subject["id"])) not in identity.subjects:
+            continue
+        grant = Grant(
+            subject=None,
+            origin=dump.get("origin"),
+            permission=dump["permission"],
+            subject_type=subject["type"],
+            subject_id=str(subject["id"]),
+        )
+        grants[grant.permission].add(grant.to_need())
+
+    return ParentNeeds(
+        owners=owners,
+        grants=grants,
+        curators={
+            CommunityRoleNeed(community_id, role)
+            for community_id in communities
+            for role in identity.curator_roles.get(community_id, set())
+        },
+    )
+
+
+def _memo(identity: Identity) -> dict[str, ParentNeeds]:
+    return g.setdefault(MEMO, {}).setdefault(identity.id, {})
+
+
+def _curated_communities(
+    parent_ids: set[str],
+    communities: set[str],
+) -> dict[str, set[str]]:
+    parents = defaultdict(set)
+    if not communities:
+        return parents
+
+    rows = db.session.query(
+        RDMParentCommunity.record_id,
+        RDMParentCommunity.community_id,
+    ).filter(
+        RDMParentCommunity.record_id.in_(parent_ids),
+        RDMParentCommunity.community_id.in_(communities),
+    )
+    for parent_id, community_id in rows:
+        parents[str(parent_id)].add(str(community_id))
+    return parents
+
+
+def load_parent_needs(identity: Identity, parent_ids: Iterable[str]) -> None:
+    """Load the needs of the parents missing from the memo, for the identity."""
+    memo = _memo(identity)
+    missing = {str(id_) for id_ in parent_ids} - memo.keys()
+    if not missing:
+        return
+
+    subjects = identity_subjects(identity)
+    model = RDMParent.model_cls
+    rows = db.session.query(model.id, model.json).filter(model.id.in_(missing))
+    communities = _curated_communities(missing, set(subjects.curator_roles))
+    for parent_id, json in rows:
+        memo[str(parent_id)] = parent_needs(
+            subjects,
+            (json or {}).get("access", {}),
+            communities[str(parent_id)],
+        )
+
+
+def prefetch_parent_needs(identity: Identity, hits: list[dict]) -> None:
+    """Load the needs of the raw hits' parents, for the identity."""
+    parent_ids = {
+        parent_id
+        for hit in hits
+        if (parent_id := hit.get("_source", {}).get("parent", {}).get("id"))
+    }
+    if parent_ids:
+        load_parent_needs(identity, parent_ids)
+
+
+def checked_parent_needs(record: Record | None) -> ParentNeeds | None:
+    """Return the needs of the checked identity which the record's parent grants.
+
+    ``None`` outside of :func:`checking`, or when the parent id isn't at hand
+    without loading the parent.
+    """
+    identity = _checked_identity.get()
+    model = getattr(record, "model", None)
+    parent_id = getattr(model, "parent_id", None)
+    if identity is None or parent_id is None:
+        return None
+
+    load_parent_needs(identity, [parent_id])
+    return _memo(identity).get(str(parent_id))
+
+
+def forget_parents(parent_ids: set[str]) -> None:
+    """Drop the memoized needs of the parents, for all identities."""
+    for memo in g.get(MEMO, {}).values():
+        for parent_id in parent_ids & memo.keys():
+            del memo[parent_id]
+
+
+def clear_parent_needs() -> None:
+    """Forget the memoized needs."""
+    g.pop(MEMO, None)
+
+
+def _forget_flushed_parents(session: Session, _: UOWTransaction) -> None:
+    if not has_app_context() or MEMO not in g:
+        return
+
+    parent_ids = set()
+    for instance in session.new | session.dirty | session.deleted:
+        if isinstance(instance, RDMParent.model_cls):
+            parent_ids.add(str(instance.id))
+        elif isinstance(instance, RDMParentCommunity):
+            parent_ids.add(str(instance.record_id))
+    forget_parents(parent_ids)
+
+
+def install_flush_listener() -> None:
+    """Drop the memoized needs of parents as they are written, idempotent."""
+    if not event.contains(Session, "after_flush", _forget_flushed_parents):
+        event.listen(Session, "after_flush", _forget_flushed_parents)
@@ -29,6 +29,7 @@ is verified at the moment it is undertaken.
 
 from typing import Final
 
+from flask_principal import Identity
 from invenio_administration.generators import Administration
 from invenio_communities.generators import (
     AllowedMemberTypes,
@@ -52,11 +53,7 @@ from invenio_communities.permissions import (  # at time of writing, BasePermiss
 from invenio_curations.requests.curation import CurationRequest
 from invenio_curations.services.generators import (
     CurationModerators,
-    IfCurationRecordBasedExists,
-    IfCurationRequestAccepted,
-    IfCurationRequestBasedExists,
     IfRequestTypes,
-    TopicPermission,
 )
 from invenio_rdm_records.requests import CommunitySubmission
 from invenio_rdm_records.services.generators import (
@@ -97,9 +94,18 @@ from invenio_users_resources.services.permissions import UserManager
 from .generators import (
     AllowedFromIPNetwork,
     RecordSingleIP,
+    RequestTypeDispatch,
+    TUGrazAccessGrant,
     TUGrazAuthenticatedButNotCommunityMembers,
     TUGrazAuthenticatedUser,
+    TUGrazIfCurationRecordBasedExists,
+    TUGrazIfCurationRequestAccepted,
+    TUGrazIfCurationRequestBasedExists,
+    TUGrazRecordCommunitiesAction,
+    TUGrazRecordOwners,
+    TUGrazTopicPermission,
 )
+from .identities import checking
 
 
 class TUGrazRDMRecordPermissionPolicy(RecordPermissionPolicy):
@@ -111,6 +117,11 @@ class TUGrazRDMRecordPermissionPolicy(RecordPermissionPolicy):
         "object-read": "read_files",
     }
 
+    def allows(self, identity: Identity) -> bool:
+        """Check the permission, letting the generators answer for the identity."""
+        with checking(identity):
+            return super().allows(identity)
+
     # permission meant for global curators of the instance
     # (for now applies to internal notes field only
     # to be replaced with an adequate permission when it is defined)
@@ -119,10 +130,11 @@ class TUGrazRDMRecordPermissionPolicy(RecordPermissionPolicy):
     #
     # General permission-groups, to be used below
     #
+    # answered with the memoized needs of the checked identity, see `.identities`
     can_manage = [
-        RecordOwners(),
-        RecordCommunitiesAction("curate"),
-        AccessGrant("manage"),
+        TUGrazRecordOwners(),
+        TUGrazRecordCommunitiesAction("curate"),
+        TUGrazAccessGrant("manage"),
         SystemProcess(),
     ]
     can_curate = can_manage + [AccessGrant("edit"), SecretLinks("edit")]
@@ -133,7 +145,7 @@ class TUGrazRDMRecordPermissionPolicy(RecordPermissionPolicy):
         SecretLinks("preview"),
         SubmissionReviewer(),
         UserManager,
-        IfCurationRecordBasedExists(then_=[CurationModerators()], else_=[]),
+        TUGrazIfCurationRecordBasedExists(then_=[CurationModerators()], else_=[]),
     ]
     can_view = can_preview + [
         AccessGrant("view"),
@@ -535,20 +547,25 @@ class TUGrazRDMRequestsPermissionPolicy(RDMRequestsPermissionPolicy):
     """Customized requests permission policy for TU Graz repository's needs.
 
     Note: For now it is 100% percent copied from invenio-curations.
+
+    The actions depending on the request type are wrapped in
+    ``RequestTypeDispatch``, which resolves their ``IfRequestTypes`` once per
+    request type rather than for every request.
     """
 
     curation_request_record_review = IfRequestTypes(
         [CurationRequest],
-        then_=[TopicPermission(permission_name="can_review")],
+        then_=[TUGrazTopicPermission(permission_name="can_review")],
         else_=[],
     )
 
     # Only allow community-submission requests to be accepted after the rdm-curation request has been accepted
     # (if curation request exists).
+    # The curation states are looked up in a request-scoped memo, see `.curations`.
     _can_communities_curation_accept: Final = [
-        IfCurationRequestBasedExists(
+        TUGrazIfCurationRequestBasedExists(
             then_=[
-                IfCurationRequestAccepted(
+                TUGrazIfCurationRequestAccepted(
                     then_=RDMRequestsPermissionPolicy.can_action_accept,
                     else_=[],
                 ),
@@ -558,33 +575,46 @@ class TUGrazRDMRequestsPermissionPolicy(RDMRequestsPermissionPolicy):
     ]
 
     can_action_accept: Final = [
-        IfRequestTypes(
-            request_types=[CommunitySubmission],
-            then_=_can_communities_curation_accept,
-            else_=RDMRequestsPermissionPolicy.can_action_accept,
+        RequestTypeDispatch(
+            [
+                IfRequestTypes(
+                    request_types=[CommunitySubmission],
+                    then_=_can_communities_curation_accept,
+                    else_=RDMRequestsPermissionPolicy.can_action_accept,
+                ),
+            ],
         ),
     ]
 
     # Update can read and can comment with new states
     can_read: Final = [
         # Have to explicitly check the request type and circumvent using status, as creator/receiver will add a query filter where one entity must be the user.
-        IfRequestTypes(
-            [CurationRequest],
-            then_=[
-                Creator(),
-                Receiver(),
-                TopicPermission(permission_name="can_review"),
-                SystemProcess(),
+        RequestTypeDispatch(
+            [
+                IfRequestTypes(
+                    [CurationRequest],
+                    then_=[
+                        Creator(),
+                        Receiver(),
+                        TUGrazTopicPermission(permission_name="can_review"),
+                        SystemProcess(),
+                    ],
+                    else_=RDMRequestsPermissionPolicy.can_read,
+                ),
             ],
-            else_=RDMRequestsPermissionPolicy.can_read,
         ),
     ]
     can_create_comment = can_read
     can_reply_comment = can_create_comment
 
     # Update submit to also allow record reviewers/managers for curation requests
-    can_action_submit = RDMRequestsPermissionPolicy.can_action_submit + [
-        curation_request_record_review,
+    can_action_submit = [
+        RequestTypeDispatch(
+            [
+                *RDMRequestsPermissionPolicy.can_action_submit,
+                curation_request_record_review,
+            ],
+        ),
     ]
 
     # Add new actions
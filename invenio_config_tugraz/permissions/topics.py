@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Request-scoped memo of the topic records of curation requests.
+
+``TopicPermission(permission_name="can_review")`` resolves the topic record
+of a curation request and evaluates the whole ``can_review`` of the records
+policy on it, for each request of a list. Here, the topic records of a
+requests search's page are loaded in one go, and ``TUGrazTopicPermission``
+keeps the outcome per permission and topic in ``flask.g`` for the rest of
+the request. Both are cleared after each commit of a requests change.
+"""
+
+from collections.abc import Iterable
+
+from flask import g
+from flask_principal import Need
+from invenio_curations.requests.curation import CurationRequest
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_rdm_records.records.api import RDMDraft, RDMRecord
+
+RECORDS_MEMO = "tugraz_topic_records"
+PERMISSIONS_MEMO = "tugraz_topic_permissions"
+
+
+def _records() -> dict[str, RDMDraft | RDMRecord]:
+    return g.setdefault(RECORDS_MEMO, {})
+
+
+def topic_permissions() -> dict[tuple[str, str], tuple[set[Need], set[Need]]]:
+    """Return the memo of needs and excludes, by permission name and record id."""
+    return g.setdefault(PERMISSIONS_MEMO, {})
+
+
+def load_topic_records(pid_values: Iterable[str]) -> None:
+    """Load the records missing from the memo, with three queries.
+
+    Like ``RDMRecordProxy``, a published record is loaded rather than its
+    draft. What can't be loaded here is left to the proxy to resolve, or to
+    fail to.
+    """
+    records = _records()
+    missing = set(pid_values) - records.keys()
+    if not missing:
+        return
+
+    pids = PersistentIdentifier.query.filter(
+        PersistentIdentifier.pid_type == "recid",
+        PersistentIdentifier.pid_value.in_(missing),
+    ).all()
+    ids = [pid.object_uuid for pid in pids]
+    models = {
+        record_cls: {
+            model.id: model
+            for model in record_cls.model_cls.query.filter(
+                record_cls.model_cls.id.in_(ids),
+            )
+        }
+        for record_cls in (RDMDraft, RDMRecord)
+    }
+
+    for pid in pids:
+        record_cls = RDMRecord if pid.status == PIDStatus.REGISTERED else RDMDraft
+        model = models[record_cls].get(pid.object_uuid)
+        if model is not None and not model.is_deleted:
+            records[pid.pid_value] = record_cls(model.data, model=model)
+
+
+def topic_record(pid_value: str) -> RDMDraft | RDMRecord | None:
+    """Return the topic record from the memo, loading it if missing."""
+    load_topic_records([pid_value])
+    return _records().get(pid_value)
+
+
+def prefetch_topic_records(hits: list[dict]) -> None:
+    """Load the topic records of the curation requests among search hits."""
+    load_topic_records(
+        topic["record"]
+        for hit in hits
+        if hit.get("_source", {}).get("type") == CurationRequest.type_id
+        and "record" in (topic := hit["_source"].get("topic") or {})
+    )
+
+
+def clear_topic_permissions() -> None:
+    """Forget the memoized topic records and permissions."""
+    g.pop(RECORDS_MEMO, None)
+    g.pop(PERMISSIONS_MEMO, None)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Pytest plugin asserting SQL query budgets.
+
+The plugin is registered via the ``pytest11`` entry point, its fixtures are
+available in any test suite having this package installed:
+
+.. code-block:: python
+
+    def test_record_read_budget(client, record, query_budget):
+        with query_budget(max_queries=25, max_repeats=3):
+            client.get(f"/api/records/{record.id}")
+
+    def test_publish_budget(running_app, draft, query_budget):
+        with query_budget(max_queries=80, max_repeats=5):
+            current_rdm_records_service.publish(system_identity, draft.id)
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
+
+from .sql_tracker import QueryTracker
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., AbstractContextManager[QueryTracker]]:
+    """Fail the test if the wrapped code exceeds its SQL query budget.
+
+    :param max_queries: maximal number of executed statements
+    :param max_repeats: maximal executions of one and the same statement
+    :param max_seconds: maximal time spent in the database
+    """
+
+    @contextmanager
+    def budget(
+        max_queries: int | None = None,
+        max_repeats: int | None = None,
+        max_seconds: float | None = None,
+    ) -> Iterator[QueryTracker]:
+        with QueryTracker() as tracker:
+            yield tracker
+
+        problems = []
+        if max_queries is not None and tracker.count > max_queries:
+            problems.append(f"{tracker.count} queries, budget is {max_queries}")
+        if max_seconds is not None and tracker.seconds > max_seconds:
+            problems.append(f"{tracker.seconds:.3f}s in db, budget is {max_seconds}s")
+        if max_repeats is not None:
+            problems += [
+                f"statement repeated {count} times, budget is {max_repeats}: {stmt}"
+                for stmt, count in tracker.repeated(max_repeats).items()
+            ]
+
+        if problems:
+            pytest.fail("query budget exceeded:\n" + "\n".join(problems))
+
+    return budget
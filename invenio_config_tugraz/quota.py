@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Upload quota accounting.
+
+The files and bytes committed to each draft, and to all drafts of each user,
+are counted in the ``tugraz_upload_usage`` table: incremented when a file is
+committed and decremented when it's deleted or the draft is published or
+discarded. Checking ``APP_RDM_DEPOSIT_FORM_QUOTA`` (and the optional
+``CONFIG_TUGRAZ_UPLOAD_USER_QUOTA``) then reads one row, instead of summing
+the files of the draft's bucket.
+
+Drift, e.g. from files imported into new versions, which bypass the file
+service components, is fixed by ``invenio tugraz upload-usage --fix``.
+"""
+
+from typing import NamedTuple
+
+from flask import current_app
+from invenio_db import db
+from invenio_files_rest.errors import FileSizeError
+from invenio_files_rest.models import FileInstance, ObjectVersion
+from invenio_i18n import gettext as _
+from invenio_rdm_records.records.api import RDMDraft, RDMFileDraft, RDMParent
+from invenio_records_resources.services.errors import FilesCountExceededException
+from sqlalchemy import func, select
+
+from .models import UploadUsage
+from .utils import upsert
+
+DRAFT = "draft"
+USER = "user"
+
+
+class Usage(NamedTuple):
+    """Committed files and bytes."""
+
+    files: int = 0
+    bytes: int = 0
+
+
+def draft_owner(draft: RDMDraft) -> str | None:
+    """Return the id of the user owning the draft."""
+    owned_by = draft.parent.access.owned_by
+    return str(owned_by.owner_id) if owned_by else None
+
+
+def _owners(draft: RDMDraft) -> list[tuple[str, str]]:
+    owners = [(DRAFT, str(draft.id))]
+    if (user := draft_owner(draft)) is not None:
+        owners.append((USER, user))
+    return owners
+
+
+def increment_usage(owners: list[tuple[str, str]], files: int, size: int) -> None:
+    """Add (or with negative values subtract) to the usage of the owners."""
+    stmt = upsert(
+        UploadUsage,
+        [
+            {"owner_type": type_, "owner_id": id_, "files": files, "bytes": size}
+            for type_, id_ in owners
+        ],
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UploadUsage.owner_type, UploadUsage.owner_id],
+        set_={
+            "files": UploadUsage.files + stmt.excluded.files,
+            "bytes": UploadUsage.bytes + stmt.excluded.bytes,
+        },
+    )
+    db.session.execute(stmt)
+
+
+def add_draft_usage(draft: RDMDraft, files: int, size: int) -> None:
+    """Add to the usage of the draft and its owner."""
+    increment_usage(_owners(draft), files, size)
+
+
+def get_usage(owner_type: str, owner_id: str) -> Usage:
+    """Return the usage of a draft or user, from one row."""
+    row = db.session.execute(
+        select(UploadUsage.files, UploadUsage.bytes).filter_by(
+            owner_type=owner_type,
+            owner_id=owner_id,
+        ),
+    ).first()
+    return Usage(*row) if row else Usage()
+
+
+def release_draft_usage(draft: RDMDraft) -> None:
+    """Remove the draft's usage, once it was published or discarded."""
+    usage = get_usage(DRAFT, str(draft.id))
+    if (user := draft_owner(draft)) is not None and usage != Usage():
+        increment_usage([(USER, user)], -usage.files, -usage.bytes)
+    db.session.execute(
+        UploadUsage.__table__.delete().where(
+            UploadUsage.owner_type == DRAFT,
+            UploadUsage.owner_id == str(draft.id),
+        ),
+    )
+
+
+def check_quota(draft: RDMDraft, files: int, size: int) -> None:
+    """Raise if adding files of size bytes would exceed the quota."""
+    quota = current_app.config.get("APP_RDM_DEPOSIT_FORM_QUOTA") or {}
+    usage = get_usage(DRAFT, str(draft.id))
+
+    max_files = quota.get("maxFiles")
+    if max_files and usage.files + files > max_files:
+        raise FilesCountExceededException(
+            max_files=max_files,
+            resulting_files_count=usage.files + files,
+        )
+
+    max_storage = quota.get("maxStorage")
+    if max_storage and usage.bytes + size > max_storage:
+        raise FileSizeError(description=_("Draft quota exceeded."))
+
+    user_quota = current_app.config.get("CONFIG_TUGRAZ_UPLOAD_USER_QUOTA")
+    user = draft_owner(draft)
+    if user_quota and user and get_usage(USER, user).bytes + size > user_quota:
+        raise FileSizeError(description=_("User quota exceeded."))
+
+
+def actual_usage() -> dict[tuple[str, str], Usage]:
+    """Compute the usage of all drafts and users from their files."""
+    draft_model = RDMDraft.model_cls
+    parent_model = RDMParent.model_cls
+    file_model = RDMFileDraft.model_cls
+
+    drafts = (
+        db.session.query(
+            draft_model.id,
+            draft_model.parent_id,
+            func.count(file_model.id),
+            func.sum(FileInstance.size),
+        )
+        .join(file_model, file_model.record_id == draft_model.id)
+        .join(ObjectVersion, file_model.object_version_id == ObjectVersion.version_id)
+        .join(FileInstance, ObjectVersion.file_id == FileInstance.id)
+        .filter(draft_model.is_deleted.is_not(True), FileInstance.writable.is_(False))
+        .group_by(draft_model.id, draft_model.parent_id)
+        .all()
+    )
+
+    parent_ids = {row.parent_id for row in drafts}
+    owners = {
+        parent.id: RDMParent(parent.data, model=parent)
+        for parent in parent_model.query.filter(parent_model.id.in_(parent_ids))
+    }
+
+    usage = {}
+    for draft_id, parent_id, files, size in drafts:
+        usage[DRAFT, str(draft_id)] = Usage(files, int(size or 0))
+        owned_by = owners[parent_id].access.owned_by
+        if owned_by:
+            user = USER, str(owned_by.owner_id)
+            user_usage = usage.get(user, Usage())
+            usage[user] = Usage(
+                user_usage.files + files,
+                user_usage.bytes + int(size or 0),
+            )
+    return usage
+
+
+def reconcile_usage(*, fix: bool = False) -> dict[tuple[str, str], tuple]:
+    """Compare the counters with the actual usage, returns the drifted ones.
+
+    With `fix`, the counters are set to the actual usage.
+    """
+    actual = actual_usage()
+    counted = {
+        (row.owner_type, row.owner_id): Usage(row.files, row.bytes)
+        for row in UploadUsage.query
+    }
+
+    drifts = {
+        owner: (counted.get(owner, Usage()), actual.get(owner, Usage()))
+        for owner in counted.keys() | actual.keys()
+        if counted.get(owner, Usage()) != actual.get(owner, Usage())
+    }
+
+    if fix and drifts:
+        for (owner_type, owner_id), (_counted, usage) in drifts.items():
+            row = db.session.get(UploadUsage, (owner_type, owner_id))
+            if usage == Usage():
+                db.session.delete(row)
+                continue
+            if row is None:
+                row = UploadUsage(owner_type=owner_type, owner_id=owner_id)
+                db.session.add(row)
+            row.files, row.bytes = usage
+        db.session.commit()
+
+    return drifts
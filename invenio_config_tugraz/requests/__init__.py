@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2025 Graz University of Technology.
+# Copyright (C) 2025-2026 Graz University of Technology.
 #
 # invenio-config-tugraz is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
@@ -8,6 +8,14 @@
 
 """Overriden requests configurations."""
 
-from .events import TUGRAZ_REQUESTS_REGISTERED_EVENT_TYPES
+from .events import (
+    TUGRAZ_REQUESTS_EVENTS_SERVICE_COMPONENTS,
+    TUGRAZ_REQUESTS_REGISTERED_EVENT_TYPES,
+)
+from .service import TUGRAZ_REQUESTS_SERVICE_COMPONENTS
 
-__all__ = ("TUGRAZ_REQUESTS_REGISTERED_EVENT_TYPES",)
+__all__ = (
+    "TUGRAZ_REQUESTS_EVENTS_SERVICE_COMPONENTS",
+    "TUGRAZ_REQUESTS_REGISTERED_EVENT_TYPES",
+    "TUGRAZ_REQUESTS_SERVICE_COMPONENTS",
+)
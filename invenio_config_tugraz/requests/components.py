@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Requests and requests events service components."""
+
+from flask import current_app
+from flask_principal import Identity
+from invenio_cache import current_cache
+from invenio_db import db
+from invenio_records_resources.services.records.components import ServiceComponent
+from invenio_records_resources.services.uow import Operation, UnitOfWork
+from invenio_requests.customizations import LogEventType
+from invenio_requests.records.api import RequestEvent
+from invenio_search.engine import dsl
+
+from invenio_config_tugraz.permissions.curations import (
+    clear_curation_states,
+    prefetch_curation_states,
+)
+from invenio_config_tugraz.permissions.identities import clear_parent_needs
+from invenio_config_tugraz.permissions.topics import (
+    clear_topic_permissions,
+    prefetch_topic_records,
+)
+from invenio_config_tugraz.utils import with_hits_hook
+
+from .facets import invalidate_facets, with_cached_facets
+from .queue import refresh_queue_entry
+from .snapshot import append_event, invalidate_snapshot
+from .tasks import compact_request_timeline, timeline_compaction_cache_key
+from .timeline import event_summary, is_automatic_comment
+
+
+class RequestFacetsCacheComponent(ServiceComponent):
+    """Serve the facets of repeated requests searches from the cache."""
+
+    def search(
+        self,
+        identity: Identity,  # noqa: ARG002
+        search: dsl.Search,
+        params: dict,  # noqa: ARG002
+        **kwargs: dict,  # noqa: ARG002
+    ) -> dsl.Search:
+        """Use the cached aggregations of the search."""
+        return with_cached_facets(search)
+
+
+class InvalidateRequestFacetsOp(Operation):
+    """Invalidate the cached facets once the transaction has been committed."""
+
+    def on_post_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Start a new generation of the facets cache."""
+        invalidate_facets()
+
+
+class RequestFacetsInvalidationComponent(ServiceComponent):
+    """Invalidate the cached facets on state transitions of requests.
+
+    Every action changing the status of a request logs a ``LogEventType``.
+    """
+
+    def create(
+        self,
+        identity: Identity,  # noqa: ARG002
+        data: dict | None = None,  # noqa: ARG002
+        event: RequestEvent | None = None,
+        **kwargs: dict,  # noqa: ARG002
+    ) -> None:
+        """Invalidate the facets when the event logs a transition."""
+        if event is not None and event.type.type_id == LogEventType.type_id:
+            self.uow.register(InvalidateRequestFacetsOp())
+
+
+class RefreshCurationQueueOp(Operation):
+    """Refresh the queue entry of a request, once its changes are committed.
+
+    The event is created before the request's new status is committed, so
+    the entry is written in a transaction of its own, right after.
+    """
+
+    def __init__(self, request_id: str) -> None:
+        """Construct."""
+        self.request_id = request_id
+
+    def on_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Write or delete the entry."""
+        refresh_queue_entry(self.request_id)
+        db.session.commit()
+
+
+class CurationQueueComponent(ServiceComponent):
+    """Keep the curation queue in step with the events of the requests."""
+
+    def create(
+        self,
+        identity: Identity,  # noqa: ARG002
+        data: dict | None = None,  # noqa: ARG002
+        event: RequestEvent | None = None,
+        **kwargs: dict,  # noqa: ARG002
+    ) -> None:
+        """Refresh the queue entry of the event's request."""
+        if event is not None:
+            self.uow.register(RefreshCurationQueueOp(event.request_id))
+
+
+class CompactTimelineOp(Operation):
+    """Queue the compaction of a request's timeline after the commit.
+
+    Like ``PostCommitSideEffectsOp``, only one task per request is queued at
+    a time, delayed by ``CONFIG_TUGRAZ_REQUESTS_TIMELINE_COMPACTION_WINDOW``
+    seconds, so that it folds the comments of a burst of draft saves.
+    """
+
+    def __init__(self, request_id: str) -> None:
+        """Construct."""
+        self.request_id = request_id
+
+    def on_post_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Send the celery task, unless one is already queued for the request."""
+        window = current_app.config["CONFIG_TUGRAZ_REQUESTS_TIMELINE_COMPACTION_WINDOW"]
+        queued = current_cache.add(
+            timeline_compaction_cache_key(self.request_id),
+            value=True,
+            timeout=window * 2,
+        )
+        if queued:
+            compact_request_timeline.apply_async(
+                args=[self.request_id],
+                countdown=window,
+            )
+
+
+class CurationTimelineComponent(ServiceComponent):
+    """Fold the automatic comments of invenio-curations in the timelines."""
+
+    def create(
+        self,
+        identity: Identity,  # noqa: ARG002
+        data: dict | None = None,  # noqa: ARG002
+        event: RequestEvent | None = None,
+        **kwargs: dict,  # noqa: ARG002
+    ) -> None:
+        """Queue the compaction when an automatic comment was created."""
+        if event is not None and is_automatic_comment(event_summary(event)):
+            self.uow.register(CompactTimelineOp(str(event.request_id)))
+
+
+class AppendSnapshotOp(Operation):
+    """Append an event to its timeline's snapshot after the commit."""
+
+    def __init__(self, event: RequestEvent) -> None:
+        """Construct."""
+        self.event = event
+
+    def on_post_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Append the event."""
+        append_event(self.event)
+
+
+class InvalidateSnapshotOp(Operation):
+    """Drop a timeline's snapshot after the commit."""
+
+    def __init__(self, request_id: str) -> None:
+        """Construct."""
+        self.request_id = request_id
+
+    def on_post_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Drop the snapshot."""
+        invalidate_snapshot(self.request_id)
+
+
+class TimelineSnapshotComponent(ServiceComponent):
+    """Keep the timeline snapshots in step with the events."""
+
+    def create(
+        self,
+        identity: Identity,  # noqa: ARG002
+        data: dict | None = None,  # noqa: ARG002
+        event: RequestEvent | None = None,
+        **kwargs: dict,  # noqa: ARG002
+    ) -> None:
+        """Append the new event."""
+        if event is not None:
+            self.uow.register(AppendSnapshotOp(event))
+
+    def update_comment(
+        self,
+        identity: Identity,  # noqa: ARG002
+        data: dict | None = None,  # noqa: ARG002
+        event: RequestEvent | None = None,
+        **kwargs: dict,  # noqa: ARG002
+    ) -> None:
+        """Drop the snapshot holding the comment's former content."""
+        if event is not None:
+            self.uow.register(InvalidateSnapshotOp(str(event.request_id)))
+
+    delete_comment = update_comment
+
+
+def prefetch_permissions(hits: list[dict]) -> None:
+    """Load what the requests permissions look up for the hits."""
+    prefetch_curation_states(hits)
+    prefetch_topic_records(hits)
+
+
+class PermissionsPrefetchComponent(ServiceComponent):
+    """Load what the requests permissions look up for the hits of a search.
+
+    That is, the curation states and the curation requests' topic records.
+    """
+
+    def search(
+        self,
+        identity: Identity,  # noqa: ARG002
+        search: dsl.Search,
+        params: dict,  # noqa: ARG002
+        **kwargs: dict,  # noqa: ARG002
+    ) -> dsl.Search:
+        """Load them along with the response."""
+        return with_hits_hook(search, prefetch_permissions)
+
+
+class ClearPermissionMemosOp(Operation):
+    """Clear the request-scoped memos of permissions once the changes are indexed."""
+
+    def on_post_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Clear the memos."""
+        clear_curation_states()
+        clear_topic_permissions()
+        clear_parent_needs()
+
+
+class PermissionMemosComponent(ServiceComponent):
+    """Clear the request-scoped memos of permissions after requests changes.
+
+    Used by the requests service, for new requests, and by the events
+    service, as every action logs an event.
+    """
+
+    def create(
+        self,
+        identity: Identity,  # noqa: ARG002
+        **kwargs: dict,  # noqa: ARG002
+    ) -> None:
+        """Clear the memos after the commit."""
+        self.uow.register(ClearPermissionMemosOp())
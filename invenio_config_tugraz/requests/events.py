@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2025 Graz University of Technology.
+# Copyright (C) 2025-2026 Graz University of Technology.
 #
 # invenio-config-tugraz is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
@@ -13,6 +13,14 @@ from invenio_curations.services.events import CurationCommentEventType
 from invenio_requests.config import REQUESTS_EVENTS_SERVICE_COMPONENTS
 from invenio_requests.customizations import LogEventType
 
+from .components import (
+    CurationQueueComponent,
+    CurationTimelineComponent,
+    PermissionMemosComponent,
+    RequestFacetsInvalidationComponent,
+    TimelineSnapshotComponent,
+)
+
 TUGRAZ_REQUESTS_REGISTERED_EVENT_TYPES = [
     LogEventType(),
     CurationCommentEventType(),
@@ -24,6 +32,11 @@ To use: override in invenio.cfg. REQUESTS_REGISTERED_EVENT_TYPES = TUGRAZ_REQUES
 
 TUGRAZ_REQUESTS_EVENTS_SERVICE_COMPONENTS = REQUESTS_EVENTS_SERVICE_COMPONENTS + [
     CurationEventsComponent,
+    RequestFacetsInvalidationComponent,
+    CurationQueueComponent,
+    CurationTimelineComponent,
+    TimelineSnapshotComponent,
+    PermissionMemosComponent,
 ]
 """TU Graz requests events components.
 
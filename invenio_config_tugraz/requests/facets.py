@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Cache of the requests facet aggregations.
+
+The curation dashboard runs the same requests search over and over, each
+time aggregating the type, status and creation date of all requests the user
+may read. The aggregations only depend on the query, i.e. on the permission
+filter of the user and the search terms, and on the aggregations asked for,
+so they are cached under a hash of both. A repeat view is sent to OpenSearch
+without aggregations and gets the cached ones.
+
+The cache has a generation, which is changed by every state transition of a
+request (each is logged as a ``LogEventType`` event), so that the counts are
+never outdated by more than ``CONFIG_TUGRAZ_REQUESTS_FACETS_CACHE_TIMEOUT``.
+"""
+
+import json
+from hashlib import sha256
+from uuid import uuid4
+
+from flask import current_app
+from invenio_cache import current_cache
+from invenio_search.engine import dsl
+
+GENERATION_KEY = "tugraz:requests-facets:generation"
+
+
+def _generation() -> str:
+    return current_cache.get(GENERATION_KEY) or "0"
+
+
+def invalidate_facets() -> None:
+    """Start a new generation, the cached aggregations are not used anymore."""
+    current_cache.set(GENERATION_KEY, uuid4().hex, timeout=0)
+
+
+def facets_cache_key(body: dict) -> str | None:
+    """Return the cache key of the search body's aggregations, if it has any.
+
+    Post filters, sorting and paging don't change the aggregations.
+    """
+    if not body.get("aggs"):
+        return None
+    relevant = {"query": body.get("query"), "aggs": body["aggs"]}
+    digest = sha256(json.dumps(relevant, sort_keys=True, default=str).encode())
+    return f"tugraz:requests-facets:{_generation()}:{digest.hexdigest()}"
+
+
+def cached_facets_response_cls(
+    aggregated: dsl.Search,
+    cache_key: str,
+    aggregations: dict | None,
+) -> type[dsl.response.Response]:
+    """Create a response class using cached aggregations, or caching them.
+
+    The aggregations are interpreted by the definitions of the `aggregated`
+    search, the search sent without them has none.
+    """
+    response_cls = aggregated._response_class  # noqa: SLF001
+
+    class CachedFacetsResponse(response_cls):
+        """Response with the aggregations from the cache."""
+
+        def __init__(
+            self,
+            search: dsl.Search,
+            response: dict,
+            doc_class: type | None = None,
+        ) -> None:
+            """Construct."""
+            if aggregations is not None:
+                search = aggregated
+                response = {**response, "aggregations": aggregations}
+            elif "aggregations" in response:
+                current_cache.set(
+                    cache_key,
+                    response["aggregations"],
+                    timeout=current_app.config[
+                        "CONFIG_TUGRAZ_REQUESTS_FACETS_CACHE_TIMEOUT"
+                    ],
+                )
+            super().__init__(search, response, doc_class)
+
+    return CachedFacetsResponse
+
+
+def with_cached_facets(search: dsl.Search) -> dsl.Search:
+    """Use cached aggregations for the search, or cache its aggregations."""
+    cache_key = facets_cache_key(search.to_dict())
+    if cache_key is None:
+        return search
+
+    aggregations = current_cache.get(cache_key)
+    response_cls = cached_facets_response_cls(search, cache_key, aggregations)
+    search = search.response_class(response_cls)
+    if aggregations is not None:
+        # the search is cloned by response_class, this leaves the original
+        search.aggs._params = {"aggs": {}}  # noqa: SLF001
+    return search
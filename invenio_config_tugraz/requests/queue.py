@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Queue of the open curation requests, for the curators' dashboard.
+
+Every open curation request has a row in ``tugraz_curation_queue``, with
+its status, assignee and creation date. The row is written after each
+event of the request (a transition, a comment, new reviewers) by
+``CurationQueueComponent``, and deleted when the request is closed. The
+dashboard pages through the table instead of searching the requests index:
+
+.. code-block:: console
+
+    GET /api/tugraz/curation-queue?status=submitted&assignee=me&page=2
+
+``invenio tugraz curation-queue --rebuild`` fills the table from the
+requests, e.g. after it was created.
+"""
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+from invenio_curations.requests.curation import CurationRequest
+from invenio_db import db
+from invenio_requests.records.api import Request
+from invenio_requests.records.models import RequestMetadata
+from sqlalchemy.exc import NoResultFound
+
+from invenio_config_tugraz.models import CurationQueueEntry
+from invenio_config_tugraz.utils import upsert
+
+
+def queue_entry(request: Request, updated: datetime) -> dict | None:
+    """Return the queue entry of the request, None if it isn't queued."""
+    if request.type.type_id != CurationRequest.type_id or not request.is_open:
+        return None
+
+    reviewers = [ref["user"] for ref in request.get("reviewers", []) if "user" in ref]
+    return {
+        "request_id": request.id,
+        "number": request.number,
+        "status": request.status,
+        "topic": request["topic"].get("record"),
+        "created_by": request["created_by"].get("user"),
+        "assignee": reviewers[0] if reviewers else None,
+        "created": request.created,
+        "updated": updated,
+    }
+
+
+def refresh_queue_entry(request_id: str | UUID) -> None:
+    """Write the queue entry of the request, or delete it once closed."""
+    try:
+        request = Request.get_record(request_id)
+    except NoResultFound:
+        entry = None
+    else:
+        entry = queue_entry(request, datetime.now(UTC))
+
+    if entry is None:
+        db.session.execute(
+            CurationQueueEntry.__table__.delete().where(
+                CurationQueueEntry.request_id == request_id,
+            ),
+        )
+        return
+
+    stmt = upsert(CurationQueueEntry, [entry])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CurationQueueEntry.request_id],
+        set_={key: stmt.excluded[key] for key in entry if key != "request_id"},
+    )
+    db.session.execute(stmt)
+
+
+def rebuild_curation_queue() -> int:
+    """Fill the queue anew from the curation requests, returns its length."""
+    models = RequestMetadata.query.filter(
+        RequestMetadata.json["type"].as_string() == CurationRequest.type_id,
+    )
+    entries = [
+        entry
+        for model in models.yield_per(500)
+        if (entry := queue_entry(Request(model.data, model=model), model.updated))
+    ]
+
+    db.session.execute(CurationQueueEntry.__table__.delete())
+    if entries:
+        db.session.execute(CurationQueueEntry.__table__.insert(), entries)
+    db.session.commit()
+    return len(entries)
+
+
+def curation_queue(
+    *,
+    status: str | None = None,
+    assignee: str | None = None,
+    page: int = 1,
+    size: int = 25,
+) -> tuple[int, list[CurationQueueEntry]]:
+    """Return the number of matching entries and one page of them, oldest first.
+
+    `assignee` is a user id, or ``""`` for the unassigned entries.
+    """
+    query = CurationQueueEntry.query
+    if status is not None:
+        query = query.filter_by(status=status)
+    if assignee is not None:
+        query = query.filter_by(assignee=assignee or None)
+
+    total = query.count()
+    entries = (
+        query.order_by(CurationQueueEntry.created, CurationQueueEntry.request_id)
+        .offset((page - 1) * size)
+        .limit(size)
+        .all()
+    )
+    return total, entries
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Override requests service configurations based on TU Graz Repo requirements."""
+
+from invenio_requests.services.requests.components import (
+    EntityReferencesComponent,
+    RequestDataComponent,
+    RequestLockComponent,
+    RequestNumberComponent,
+    RequestPayloadComponent,
+    RequestReviewersComponent,
+)
+
+from .components import (
+    PermissionMemosComponent,
+    PermissionsPrefetchComponent,
+    RequestFacetsCacheComponent,
+)
+
+TUGRAZ_REQUESTS_SERVICE_COMPONENTS = [
+    RequestPayloadComponent,
+    RequestDataComponent,
+    RequestReviewersComponent,
+    EntityReferencesComponent,
+    RequestNumberComponent,
+    RequestLockComponent,
+    RequestFacetsCacheComponent,
+    PermissionsPrefetchComponent,
+    PermissionMemosComponent,
+]
+"""TU Graz requests components.
+
+The defaults of invenio-requests, the facets cache and the request-scoped memos of permissions.
+
+To use: override in invenio.cfg. REQUESTS_SERVICE_COMPONENTS = TUGRAZ_REQUESTS_SERVICE_COMPONENTS
+"""
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Snapshots of request timelines, kept in Redis.
+
+The top-level events of a request are serialized once into a Redis list,
+and each new event is appended to it by ``TimelineSnapshotComponent``;
+updated and deleted comments drop the snapshot. A view of the timeline then
+reads the list, instead of searching and serializing every event.
+
+The permission-sensitive parts are overlaid per viewer:
+
+- the comments of the system are hidden from users who aren't privileged,
+  like ``CurationEventsComponent`` does
+- the ``permissions`` of the viewer on each event, evaluated once per event
+  type and author, which are all they depend on
+
+Next to the list, the number of all events of the request is kept. A
+snapshot whose number differs from the database, e.g. as an append was lost
+or comments were folded, is rebuilt.
+"""
+
+import json
+from uuid import UUID
+
+from flask import current_app
+from flask_principal import Identity
+from invenio_access.permissions import system_identity
+from invenio_curations.proxies import current_curations_service
+from invenio_curations.services.utils import is_identity_privileged
+from invenio_records_resources.services import ServiceSchemaWrapper
+from invenio_requests.customizations import CommentEventType
+from invenio_requests.proxies import current_events_service
+from invenio_requests.records.api import Request, RequestEvent
+from invenio_requests.records.models import RequestEventModel
+
+from invenio_config_tugraz.utils import get_redis
+
+from .timeline import SYSTEM_CREATOR, timeline_events
+
+
+def snapshot_keys(request_id: str | UUID) -> tuple[str, str]:
+    """Redis keys of a timeline's snapshot and of its number of events."""
+    return f"tugraz:timeline:{request_id}", f"tugraz:timeline:{request_id}:count"
+
+
+def serialize_event(event: RequestEvent, request: Request) -> str:
+    """Serialize the event as the events service does, without permissions."""
+    service = current_events_service
+    schema = ServiceSchemaWrapper(service, event.type.marshmallow_schema())
+    projection = schema.dump(
+        event,
+        context={"identity": system_identity, "record": event, "request": request},
+    )
+    projection.pop("permissions", None)
+    projection["links"] = service.links_tpl_factory(
+        service.config.links_item,
+        request=request,
+        request_type=request.type,
+    ).expand(system_identity, event)
+    return json.dumps(projection, default=str)
+
+
+def _event_count(request_id: str | UUID) -> int:
+    return RequestEventModel.query.filter_by(request_id=request_id).count()
+
+
+def load_snapshot(request: Request) -> list[dict]:
+    """Return the serialized top-level events, rebuilding a stale snapshot."""
+    redis = get_redis()
+    key, count_key = snapshot_keys(request.id)
+    count = _event_count(request.id)
+
+    cached_count, entries = redis.pipeline().get(count_key).lrange(key, 0, -1).execute()
+    if cached_count is not None and int(cached_count) == count:
+        return [json.loads(entry) for entry in entries]
+
+    events = timeline_events(request.id)
+    entries = [
+        serialize_event(event, request) for event in events if not event.parent_id
+    ]
+
+    timeout = current_app.config["CONFIG_TUGRAZ_REQUESTS_TIMELINE_SNAPSHOT_TIMEOUT"]
+    pipeline = redis.pipeline().delete(key)
+    if entries:
+        pipeline.rpush(key, *entries).expire(key, timeout)
+    pipeline.set(count_key, len(events), ex=timeout).execute()
+    return [json.loads(entry) for entry in entries]
+
+
+def append_event(event: RequestEvent) -> None:
+    """Append a new event to its timeline's snapshot, if there is one."""
+    redis = get_redis()
+    key, count_key = snapshot_keys(event.request_id)
+    if not redis.exists(count_key):
+        return
+
+    pipeline = redis.pipeline()
+    if not event.parent_id:
+        request = Request.get_record(event.request_id)
+        pipeline.rpush(key, serialize_event(event, request))
+    pipeline.incr(count_key).execute()
+
+
+def invalidate_snapshot(request_id: str | UUID) -> None:
+    """Drop a timeline's snapshot."""
+    get_redis().delete(*snapshot_keys(request_id))
+
+
+def event_permissions(
+    identity: Identity,
+    request: Request,
+    event: RequestEvent,
+) -> dict[str, bool]:
+    """Return the permissions of the identity on the event.
+
+    Like ``RequestEventSchema.get_permissions``.
+    """
+    service = current_events_service
+    is_comment = event.type == CommentEventType
+    return {
+        "can_update_comment": is_comment
+        and service.check_permission(
+            identity,
+            "update_comment",
+            event=event,
+            request=request,
+        ),
+        "can_delete_comment": is_comment
+        and service.check_permission(
+            identity,
+            "delete_comment",
+            event=event,
+            request=request,
+        ),
+        "can_reply_comment": service.check_permission(
+            identity,
+            "reply_comment",
+            event=event,
+            request=request,
+        ),
+    }
+
+
+def timeline_snapshot(identity: Identity, request_id: str | UUID) -> list[dict]:
+    """Return the request's top-level events, as seen by the identity."""
+    request = Request.get_record(request_id)
+    current_events_service.require_permission(identity, "read", request=request)
+
+    sees_system = identity == system_identity or is_identity_privileged(
+        current_curations_service.privileged_roles,
+        identity,
+    )
+    permissions = {}
+    timeline = []
+    for entry in load_snapshot(request):
+        created_by = entry.get("created_by") or {}
+        if not sees_system and created_by.get("user") == SYSTEM_CREATOR["user"]:
+            continue
+
+        overlay_key = (entry["type"], json.dumps(created_by, sort_keys=True))
+        if overlay_key not in permissions:
+            permissions[overlay_key] = event_permissions(
+                identity,
+                request,
+                RequestEvent.get_record(entry["id"]),
+            )
+        timeline.append({**entry, "permissions": permissions[overlay_key]})
+
+    return timeline
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Celery tasks of the requests."""
+
+from celery import shared_task
+from flask import current_app
+from invenio_cache import current_cache
+
+from .timeline import compact_timeline
+
+
+def timeline_compaction_cache_key(request_id: str) -> str:
+    """Cache key marking the compaction of a request's timeline as queued."""
+    return f"tugraz:timeline-compaction:{request_id}"
+
+
+@shared_task(ignore_result=True)
+def compact_request_timeline(request_id: str) -> None:
+    """Fold the consecutive automatic comments of a request's timeline."""
+    current_cache.delete(timeline_compaction_cache_key(request_id))
+
+    if folded := compact_timeline(request_id):
+        current_app.logger.info("folded %s comments of request %s", folded, request_id)
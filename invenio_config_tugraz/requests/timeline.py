@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Compaction and cursor pagination of request timelines.
+
+With ``CURATIONS_ENABLE_REQUEST_COMMENTS``, invenio-curations comments the
+changes of every draft save while the record is in review. In long review
+cycles these automatic comments make up most of the timeline. Consecutive
+ones are folded into the first of them by :func:`compact_timeline`, run in a
+celery task shortly after they were created (``CurationTimelineComponent``).
+Comments keeping a ``reference_draft`` are left alone, invenio-curations
+updates them in place.
+
+:func:`timeline_page` pages through a timeline with ``search_after``, so
+that the cost of a page doesn't grow with the history:
+
+.. code-block:: console
+
+    GET /api/tugraz/requests/<id>/timeline?size=20
+    GET /api/tugraz/requests/<id>/timeline?size=20&after=<next cursor>
+"""
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from uuid import UUID
+
+from flask_principal import Identity
+from invenio_curations.services.events import CurationCommentEventType
+from invenio_records_resources.services.uow import (
+    RecordCommitOp,
+    RecordDeleteOp,
+    RecordIndexOp,
+    UnitOfWork,
+)
+from invenio_requests.proxies import current_events_service, current_requests_service
+from invenio_requests.records.api import Request, RequestEvent
+from invenio_requests.records.models import RequestEventModel
+
+SEPARATOR = "\n<hr>\n"
+"""Between the contents of folded comments."""
+
+SYSTEM_CREATOR = {"user": "system"}
+
+
+def event_summary(event: RequestEvent, *, replied: bool = False) -> dict:
+    """Return what decides whether the event is folded."""
+    return {
+        "id": str(event.id),
+        "type": event.type.type_id,
+        "created_by": event.get("created_by"),
+        "payload": event.get("payload", {}),
+        "replied": replied,
+    }
+
+
+def is_automatic_comment(event: dict) -> bool:
+    """Whether the event is a foldable comment of invenio-curations."""
+    return (
+        event["type"] == CurationCommentEventType.type_id
+        and event["created_by"] == SYSTEM_CREATOR
+        and "reference_draft" not in event["payload"]
+        and not event["replied"]
+    )
+
+
+def automatic_comment_runs(events: list[dict]) -> list[list[dict]]:
+    """Return the runs of two or more consecutive automatic comments.
+
+    `events` are the top-level events of a timeline, oldest first.
+    """
+    runs, run = [], []
+    for event in events:
+        if is_automatic_comment(event):
+            run.append(event)
+            continue
+        if len(run) > 1:
+            runs.append(run)
+        run = []
+    if len(run) > 1:
+        runs.append(run)
+    return runs
+
+
+def timeline_events(request_id: str | UUID) -> list[RequestEvent]:
+    """Return all events of the request, oldest first."""
+    models = (
+        RequestEventModel.query.filter_by(request_id=request_id)
+        .order_by(RequestEventModel.created, RequestEventModel.id)
+        .all()
+    )
+    return [RequestEvent(model.data, model=model) for model in models]
+
+
+def compact_timeline(request_id: str | UUID) -> int:
+    """Fold the runs of automatic comments, returns the number folded away."""
+    events = timeline_events(request_id)
+    replied = {str(event.parent_id) for event in events if event.parent_id}
+    by_id = {str(event.id): event for event in events}
+    runs = automatic_comment_runs(
+        [
+            event_summary(event, replied=str(event.id) in replied)
+            for event in events
+            if not event.parent_id
+        ],
+    )
+    if not runs:
+        return 0
+
+    indexer = current_events_service.indexer
+    with UnitOfWork() as uow:
+        for first, *rest in runs:
+            summary = by_id[first["id"]]
+            summary["payload"]["content"] = SEPARATOR.join(
+                event["payload"].get("content", "") for event in [first, *rest]
+            )
+            uow.register(RecordCommitOp(summary, indexer=indexer))
+            for event in rest:
+                uow.register(RecordDeleteOp(by_id[event["id"]], indexer, force=True))
+
+        # the request's last reply and activity are computed from the events
+        uow.register(
+            RecordIndexOp(
+                Request.get_record(request_id),
+                indexer=current_requests_service.indexer,
+            ),
+        )
+        uow.commit()
+
+    return sum(len(rest) for _first, *rest in runs)
+
+
+def encode_cursor(sort: list) -> str:
+    """Return the cursor continuing after the sort values of a hit."""
+    return urlsafe_b64encode(json.dumps(sort).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    """Return the sort values of a cursor."""
+    return json.loads(urlsafe_b64decode(cursor.encode()))
+
+
+def timeline_page(
+    identity: Identity,
+    request_id: str | UUID,
+    *,
+    after: str | None = None,
+    size: int = 25,
+) -> tuple[list[dict], str | None]:
+    """Return a page of the request's top-level events and the next cursor.
+
+    The events are filtered and projected like by the events service.
+    """
+    service = current_events_service
+    request = Request.get_record(request_id)
+    service.require_permission(identity, "read", request=request)
+
+    params = {"size": size}
+    search = (
+        service._search(  # noqa: SLF001
+            "search",
+            identity,
+            params,
+            None,
+            permission_action="unused",
+        )
+        .filter("term", request_id=str(request.id))
+        .exclude("exists", field="parent_id")
+        .sort({"created": "asc"}, {"id": "asc"})
+    )
+    if after:
+        search = search.extra(search_after=decode_cursor(after))
+    result = search[:size].execute()
+
+    hits = service.result_list(
+        service,
+        identity,
+        result,
+        params,
+        links_item_tpl=service.links_tpl_factory(
+            service.config.links_item,
+            request=request,
+            request_type=request.type,
+        ),
+        request=request,
+    ).hits
+    raw_hits = result.to_dict()["hits"]["hits"]
+    cursor = encode_cursor(raw_hits[-1]["sort"]) if len(raw_hits) == size else None
+    return list(hits), cursor
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Request scoped tracking of SQL queries.
+
+``SQLALCHEMY_ECHO`` logs every statement of every request. The tracker
+instead counts the queries and the time spent in the database per request
+and reports only requests exceeding their budget, or repeating the same
+statement (usually a N+1 pattern, e.g. resolving relations row by row).
+
+Enable with ``CONFIG_TUGRAZ_SQL_TRACKER``. Each response then carries a
+``Server-Timing`` header with the request's database time and query count.
+In tests, use the ``query_budget`` fixture of
+:mod:`invenio_config_tugraz.pytest_plugin`.
+"""
+
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Self
+
+from flask import Flask, Response, current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+
+_active_trackers: ContextVar[tuple["QueryTracker", ...]] = ContextVar(
+    "tugraz_query_trackers",
+    default=(),
+)
+
+
+class QueryTracker:
+    """Collect the SQL statements executed while the tracker is active.
+
+    .. code-block:: python
+
+        with QueryTracker() as tracker:
+            service.read(identity, id_)
+        assert tracker.count < 20
+    """
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = Counter()
+        self._token: Token | None = None
+
+    def __enter__(self) -> Self:
+        """Start tracking."""
+        install_listeners()
+        self._token = _active_trackers.set((*_active_trackers.get(), self))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop tracking."""
+        if self._token is not None:
+            _active_trackers.reset(self._token)
+            self._token = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        """Record an executed statement."""
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Return the statements executed more than `threshold` times."""
+        return {
+            statement: count
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        }
+
+
+def _before_cursor_execute(  # noqa: PLR0913, PLR0917
+    conn: Connection,
+    cursor: object,  # noqa: ARG001
+    statement: str,  # noqa: ARG001
+    parameters: object,  # noqa: ARG001
+    context: object,  # noqa: ARG001
+    executemany: bool,  # noqa: ARG001, FBT001
+) -> None:
+    conn.info.setdefault("tugraz_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(  # noqa: PLR0913, PLR0917
+    conn: Connection,
+    cursor: object,  # noqa: ARG001
+    statement: str,
+    parameters: object,  # noqa: ARG001
+    context: object,  # noqa: ARG001
+    executemany: bool,  # noqa: ARG001, FBT001
+) -> None:
+    elapsed = time.perf_counter() - conn.info["tugraz_query_start"].pop()
+    for tracker in _active_trackers.get():
+        tracker.record(statement, elapsed)
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    # failed statements don't reach `_after_cursor_execute`
+    if context.connection is None or context.cursor is None:
+        return
+    if starts := context.connection.info.get("tugraz_query_start"):
+        starts.pop()
+
+
+def install_listeners() -> None:
+    """Listen to the statements of all engines, idempotent."""
+    for name, listener in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+        ("handle_error", _handle_error),
+    ):
+        if not event.contains(Engine, name, listener):
+            event.listen(Engine, name, listener)
+
+
+def _start_request_tracker() -> None:
+    g.tugraz_query_tracker = QueryTracker().__enter__()
+
+
+def _report_request_tracker(response: Response) -> Response:
+    tracker = g.get("tugraz_query_tracker")
+    if tracker is None:
+        return response
+
+    config = current_app.config
+    response.headers.add(
+        "Server-Timing",
+        f'db;dur={tracker.seconds * 1000:.1f};desc="{tracker.count} queries"',
+    )
+
+    budget = config["CONFIG_TUGRAZ_SQL_TRACKER_QUERY_BUDGET"]
+    if budget and tracker.count > budget:
+        current_app.logger.warning(
+            "%s ran %s queries (budget %s) taking %.1fms",
+            request.endpoint,
+            tracker.count,
+            budget,
+            tracker.seconds * 1000,
+        )
+
+    threshold = config["CONFIG_TUGRAZ_SQL_TRACKER_REPEAT_THRESHOLD"]
+    for statement, count in tracker.repeated(threshold).items():
+        current_app.logger.warning(
+            "%s repeated a statement %s times, possible N+1 query: %s",
+            request.endpoint,
+            count,
+            statement,
+        )
+
+    return response
+
+
+def _stop_request_tracker(exc: BaseException | None) -> None:  # noqa: ARG001
+    if (tracker := g.pop("tugraz_query_tracker", None)) is not None:
+        tracker.__exit__(None, None, None)
+
+
+def init_sql_tracker(app: Flask) -> None:
+    """Track the SQL queries of every request of the application."""
+    if not app.config.get("CONFIG_TUGRAZ_SQL_TRACKER"):
+        return
+
+    app.before_request(_start_request_tracker)
+    app.after_request(_report_request_tracker)
+    app.teardown_request(_stop_request_tracker)
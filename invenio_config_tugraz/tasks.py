@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Celery tasks for TU Graz Repo."""
+
+from celery import shared_task
+from flask import current_app
+from invenio_cache import current_cache
+from werkzeug.utils import import_string
+
+from .doi import register_doi_batch
+from .models import DOIRegistrationStatus
+
+
+def post_commit_cache_key(recid: str) -> str:
+    """Cache key marking a record's side effects as queued."""
+    return f"tugraz:post-commit:{recid}"
+
+
+@shared_task(ignore_result=True)
+def run_post_commit_side_effects(recid: str) -> None:
+    """Run the configured non-critical side effects of a record.
+
+    The queued-marker is removed before the side effects run, so that changes
+    committed while they are running queue a new task instead of being lost.
+    """
+    current_cache.delete(post_commit_cache_key(recid))
+
+    for side_effect in current_app.config["CONFIG_TUGRAZ_POST_COMMIT_SIDE_EFFECTS"]:
+        func = (
+            import_string(side_effect) if isinstance(side_effect, str) else side_effect
+        )
+        try:
+            func(recid)
+        except Exception:
+            # one failing side effect should not prevent the others from running
+            current_app.logger.exception(
+                "post-commit side effect %s failed for record %s",
+                side_effect,
+                recid,
+            )
+
+
+def bulk_doi_cache_key() -> str:
+    """Cache key marking the bulk DOI registration as queued."""
+    return "tugraz:bulk-doi-registration"
+
+
+def schedule_doi_registration(countdown: int) -> None:
+    """Send the bulk DOI registration task, unless one is already queued."""
+    if current_cache.add(bulk_doi_cache_key(), value=True, timeout=countdown * 2):
+        register_queued_dois.apply_async(countdown=countdown)
+
+
+@shared_task(ignore_result=True)
+def register_queued_dois() -> None:
+    """Register the queued DOIs with DataCite, batch after batch.
+
+    Stops when a batch made no progress, e.g. while DataCite is unavailable,
+    and runs again after ``CONFIG_TUGRAZ_BULK_DOI_RETRY_DELAY`` seconds for
+    the DOIs left in the queue. Those fail after as many runs as
+    ``CONFIG_TUGRAZ_BULK_DOI_MAX_ATTEMPTS``.
+    """
+    current_cache.delete(bulk_doi_cache_key())
+
+    batch_size = current_app.config["CONFIG_TUGRAZ_BULK_DOI_BATCH_SIZE"]
+    while statuses := register_doi_batch(batch_size):
+        current_app.logger.info("bulk DOI registration: %s", dict(statuses))
+        if set(statuses) == {DOIRegistrationStatus.QUEUED}:
+            schedule_doi_registration(
+                current_app.config["CONFIG_TUGRAZ_BULK_DOI_RETRY_DELAY"],
+            )
+            break
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2022-2024 Graz University of Technology.
+# Copyright (C) 2022-2026 Graz University of Technology.
 #
 # invenio-config-tugraz is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
@@ -9,11 +9,19 @@
 """Utils file."""
 
 import warnings
+from collections.abc import Callable, Iterator
+from functools import cache
 
+from flask import current_app
 from flask_principal import Identity
 from invenio_access import any_user
 from invenio_access.utils import get_identity
 from invenio_accounts import current_accounts
+from invenio_db import db
+from invenio_search.engine import dsl
+from redis import StrictRedis
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import Insert
 
 
 def get_identity_from_user_by_email(email: str | None = None) -> Identity:
@@ -71,3 +79,76 @@ def tugraz_account_setup_extension(user, account_info) -> None:  # noqa: ANN001,
     # NOTE: `datastore.commit`ing will be done by acs_handler that calls this func
     # NOTE: this is a No-Op when user_email already has role tugraz_authenticated
     current_accounts.datastore.add_role_to_user(user_email, "tugraz_authenticated")
+
+
+@cache
+def _redis_client(url: str) -> StrictRedis:
+    """Create one client, and thereby one connection pool, per url."""
+    return StrictRedis.from_url(url)
+
+
+def get_redis() -> StrictRedis:
+    """Get the redis client of the configured cache instance."""
+    return _redis_client(current_app.config["CACHE_REDIS_URL"])
+
+
+def search_after_pages(
+    search: dsl.Search,
+    size: int = 500,
+    after: list | None = None,
+) -> Iterator[dict]:
+    """Yield the responses of consecutive pages of a sorted search.
+
+    Unlike scroll, no search context is kept open between pages. The search
+    must be sorted with a unique tiebreaker, e.g. the record's ``uuid``.
+
+    :param after: the sort values of the last hit of the previous page
+    """
+    while True:
+        page = search.extra(size=size)
+        if after:
+            page = page.extra(search_after=after)
+        response = page.execute().to_dict()
+        yield response
+
+        hits = response["hits"]["hits"]
+        if len(hits) < size:
+            return
+        after = hits[-1]["sort"]
+
+
+def with_hits_hook(
+    search: dsl.Search,
+    hook: Callable[[list[dict]], None],
+) -> dsl.Search:
+    """Call the hook with the raw hits of the search's response, once it arrived.
+
+    E.g. to load, in one go, what is looked up for each hit afterwards.
+    """
+    response_cls = search._response_class  # noqa: SLF001
+
+    class HitsHookResponse(response_cls):
+        """Response calling the hook with its hits."""
+
+        def __init__(
+            self,
+            search: dsl.Search,
+            response: dict,
+            doc_class: type | None = None,
+        ) -> None:
+            """Construct."""
+            super().__init__(search, response, doc_class)
+            hook(response.get("hits", {}).get("hits", []))
+
+    return search.response_class(HitsHookResponse)
+
+
+def upsert(model: type[db.Model], rows: list[dict]) -> Insert:
+    """Return the insert of the rows, ready for ``on_conflict_do_*``.
+
+    Production runs on PostgreSQL, tests may run on SQLite; both support
+    ``INSERT ... ON CONFLICT``.
+    """
+    dialect = db.session.get_bind().dialect.name
+    insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+    return insert(model).values(rows)
@@ -8,9 +8,36 @@
 
 """invenio module for TUGRAZ config."""
 
-from flask import Blueprint, Flask, redirect
+from datetime import UTC, datetime
+from hmac import compare_digest
+from uuid import UUID
+
+from flask import (
+    Blueprint,
+    Flask,
+    Response,
+    abort,
+    current_app,
+    g,
+    jsonify,
+    redirect,
+    request,
+)
+from flask_login import current_user
+from flask_principal import Permission, RoleNeed
+from invenio_curations.proxies import current_curations_service
+from invenio_db import db
+from invenio_records_resources.services.errors import PermissionDeniedError
+from sqlalchemy.exc import NoResultFound
 from werkzeug.wrappers import Response as BaseResponse
 
+from .db import pool_metrics
+from .requests.queue import curation_queue
+from .requests.snapshot import timeline_snapshot
+from .requests.timeline import timeline_page
+
+MAX_PAGE_SIZE = 100
+
 
 def ui_blueprint(app: Flask) -> Blueprint:
     """Blueprint for the routes and resources provided by invenio-config-tugraz."""
@@ -30,6 +57,24 @@ def ui_blueprint(app: Flask) -> Blueprint:
     blueprint.add_url_rule(routes["file-formats"], view_func=file_formats)
     blueprint.add_url_rule(routes["curations"], view_func=curations)
 
+    if app.config.get("CONFIG_TUGRAZ_DB_POOL_METRICS"):
+        blueprint.add_url_rule(routes["db-pool-metrics"], view_func=db_pool_metrics)
+
+    return blueprint
+
+
+def api_blueprint(app: Flask) -> Blueprint:  # noqa: ARG001
+    """Blueprint for the REST API endpoints of invenio-config-tugraz."""
+    blueprint = Blueprint("invenio_config_tugraz_api", __name__)
+    blueprint.add_url_rule("/tugraz/curation-queue", view_func=curation_queue_view)
+    blueprint.add_url_rule(
+        "/tugraz/requests/<uuid:request_id>/timeline",
+        view_func=request_timeline_view,
+    )
+    blueprint.add_url_rule(
+        "/tugraz/requests/<uuid:request_id>/timeline/snapshot",
+        view_func=request_timeline_snapshot_view,
+    )
     return blueprint
 
 
@@ -61,3 +106,102 @@ def file_formats() -> BaseResponse:
 def curations() -> BaseResponse:
     """Curation_Workflow."""
     return redirect("https://doi.org/10.3217/h1zfa-4fb59")
+
+
+def db_pool_metrics() -> BaseResponse:
+    """Database connection pool metrics of this process, for Prometheus."""
+    token = current_app.config.get("CONFIG_TUGRAZ_METRICS_TOKEN")
+    authorization = request.headers.get("Authorization", "")
+    if not token or not compare_digest(authorization, f"Bearer {token}"):
+        abort(403)
+
+    return Response(
+        pool_metrics.to_prometheus(db.engine.pool),
+        mimetype="text/plain; version=0.0.4",
+    )
+
+
+def curation_queue_view() -> BaseResponse:
+    """Page of the open curation requests, for curators."""
+    roles = [
+        current_curations_service.moderation_role_name,
+        *current_curations_service.privileged_roles,
+    ]
+    if not Permission(*[RoleNeed(role) for role in roles]).allows(g.identity):
+        abort(403)
+
+    page = request.args.get("page", 1, type=int)
+    size = request.args.get("size", 25, type=int)
+    if page < 1 or not 1 <= size <= MAX_PAGE_SIZE:
+        abort(400)
+
+    assignee = request.args.get("assignee")
+    if assignee == "me":
+        assignee = str(current_user.id)
+
+    total, entries = curation_queue(
+        status=request.args.get("status"),
+        assignee=assignee,
+        page=page,
+        size=size,
+    )
+    now = datetime.now(UTC)
+    return jsonify(
+        {
+            "hits": {
+                "total": total,
+                "hits": [
+                    {
+                        "id": str(entry.request_id),
+                        "number": entry.number,
+                        "status": entry.status,
+                        "topic": entry.topic,
+                        "created_by": entry.created_by,
+                        "assignee": entry.assignee,
+                        "created": entry.created.isoformat(),
+                        "updated": entry.updated.isoformat(),
+                        "age": int((now - entry.created).total_seconds()),
+                    }
+                    for entry in entries
+                ],
+            },
+            "page": page,
+            "size": size,
+        },
+    )
+
+
+def request_timeline_view(request_id: UUID) -> BaseResponse:
+    """Page of a request's timeline, continuing after the `after` cursor."""
+    size = request.args.get("size", 25, type=int)
+    if not 1 <= size <= MAX_PAGE_SIZE:
+        abort(400)
+
+    try:
+        hits, cursor = timeline_page(
+            g.identity,
+            request_id,
+            after=request.args.get("after"),
+            size=size,
+        )
+    except NoResultFound:
+        abort(404)
+    except PermissionDeniedError:
+        abort(403)
+    except ValueError:
+        # a malformed cursor
+        abort(400)
+
+    return jsonify({"hits": {"hits": hits}, "next": cursor})
+
+
+def request_timeline_snapshot_view(request_id: UUID) -> BaseResponse:
+    """Return a request's whole timeline, from its snapshot."""
+    try:
+        hits = timeline_snapshot(g.identity, request_id)
+    except NoResultFound:
+        abort(404)
+    except PermissionDeniedError:
+        abort(403)
+
+    return jsonify({"hits": {"hits": hits, "total": len(hits)}})
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 #
 # Copyright (C) 2020 Mojib Wali.
-# Copyright (C) 2020-2024 Graz University of Technology.
+# Copyright (C) 2020-2026 Graz University of Technology.
 #
 # invenio-config-tugraz is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
@@ -13,12 +13,42 @@ See https://pytest-invenio.readthedocs.io/ for documentation on which test
 fixtures are available.
 """
 
+import json
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
 import pytest
 from flask import Flask
 
 from invenio_config_tugraz import InvenioConfigTugraz
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option running the benchmarks."""
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        help="run the tests marked as benchmark, log their timings",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config,
+    items: list[pytest.Item],
+) -> None:
+    """Skip the benchmarks, unless asked for with ``--benchmarks``."""
+    if config.getoption("--benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark, run with --benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(scope="module")
 def create_app(instance_path: str) -> Flask:
     """Application factory fixture."""
@@ -30,3 +60,104 @@ def create_app(instance_path: str) -> Flask:
         return app
 
     return factory
+
+
+class SMTPRecorder:
+    """Handler of the local SMTP stand-in, recording received envelopes."""
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.envelopes = []
+
+    async def handle_DATA(  # noqa: N802
+        self,
+        server: object,  # noqa: ARG002
+        session: object,  # noqa: ARG002
+        envelope: object,
+    ) -> str:
+        """Record envelope."""
+        self.envelopes.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+@pytest.fixture
+def smtp_server() -> Iterator[SimpleNamespace]:
+    """Local SMTP stand-in, to be configured as `MAIL_SERVER`/`MAIL_PORT`."""
+    controller_module = pytest.importorskip("aiosmtpd.controller")
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    handler = SMTPRecorder()
+    controller = controller_module.Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    try:
+        yield SimpleNamespace(hostname="127.0.0.1", port=port, handler=handler)
+    finally:
+        controller.stop()
+
+
+class DataCiteStandIn(ThreadingHTTPServer):
+    """Local stand-in of the DataCite REST API's ``PUT /dois/<doi>``.
+
+    `failures` maps DOIs to the status codes of their first responses.
+    """
+
+    def __init__(self) -> None:
+        """Construct on a free port."""
+        super().__init__(("127.0.0.1", 0), DataCiteHandler)
+        self.lock = threading.Lock()
+        self.failures = {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.latency = 0.01
+
+    @property
+    def url(self) -> str:
+        """Base URL of the API."""
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+
+class DataCiteHandler(BaseHTTPRequestHandler):
+    """Handler of the DataCite stand-in."""
+
+    server: DataCiteStandIn
+
+    def do_PUT(self) -> None:
+        """Create or update a DOI."""
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        doi = self.path.removeprefix("/dois/")
+
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.requests.append((doi, body))
+            failures = server.failures.get(doi, [])
+            status = failures.pop(0) if failures else 201
+        time.sleep(server.latency)
+        with server.lock:
+            server.in_flight -= 1
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/vnd.api+json")
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode())
+
+    def log_message(self, *args: object) -> None:
+        """Keep the test output clean."""
+
+
+@pytest.fixture
+def datacite_server() -> Iterator[DataCiteStandIn]:
+    """Local DataCite stand-in, to be configured as `CONFIG_TUGRAZ_DATACITE_API_URL`."""
+    server = DataCiteStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
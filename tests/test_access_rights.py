@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the access rights registry."""
+
+from collections.abc import Callable
+
+import pytest
+from flask import Flask, render_template_string
+
+from invenio_config_tugraz.access_rights import (
+    AccessRight,
+    AccessRightsError,
+    access_rights,
+    parse_access_rights,
+)
+
+HEADER = "access_right,access_right_name,icon,notes\n"
+
+
+def test_access_rights() -> None:
+    """The package's files load, including the limit file's short row."""
+    rights = access_rights()
+
+    assert list(rights) == ["open", "embargoed", "restricted", "closed", "singleip"]
+    assert rights.closed == AccessRight("closed", "Private", "lock")
+    assert rights["open"].icon == "lock open"
+    assert rights.limit == (rights.open,)
+    assert "missing" not in rights
+    assert access_rights() is rights
+
+
+def test_access_rights_in_templates(create_app: Callable[..., Flask]) -> None:
+    """Templates look the access rights up in the registry."""
+    app = create_app()
+    with app.app_context():
+        html = render_template_string("{{ tugraz_access_rights.embargoed.name }}")
+    assert html == "Embargoed"
+
+
+@pytest.mark.parametrize(
+    ("text", "error"),
+    [
+        ("access_right,name\nopen,Open\n", "expected the columns"),
+        (HEADER + "open, Open Access, lock, note, extra\n", "more values"),
+        (HEADER + "open, , lock\n", "missing access_right_name"),
+        (HEADER + "open access, Open Access\n", "invalid access right id"),
+        (HEADER + "open, Open\nopen, Open again\n", "duplicate access right"),
+    ],
+)
+def test_access_rights_validation(text: str, error: str) -> None:
+    """Malformed files are rejected with their line."""
+    with pytest.raises(AccessRightsError, match=error):
+        parse_access_rights("test.csv", text)
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the curation queue."""
+
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from flask import Flask, g
+from flask_principal import Identity, RoleNeed
+from invenio_curations.requests.curation import CurationRequest
+from invenio_db import InvenioDB, db
+from invenio_rdm_records.requests import CommunitySubmission
+from sqlalchemy.exc import NoResultFound
+
+from invenio_config_tugraz import views
+from invenio_config_tugraz.models import CurationQueueEntry
+from invenio_config_tugraz.requests import queue
+from invenio_config_tugraz.requests.components import CurationQueueComponent
+from invenio_config_tugraz.requests.queue import curation_queue, refresh_queue_entry
+from invenio_config_tugraz.views import api_blueprint
+
+SUBMITTED = 2
+REQUEST_ID = UUID("3e6c7a52-9d0b-4a8e-8f21-5b1c2d3e4f50")
+CURATOR_ID = 7
+
+
+class RequestStandIn(dict):
+    """Stand-in of a request record."""
+
+    def __init__(self, request_type: type = CurationRequest, **data: object) -> None:
+        """Construct a submitted request of the type."""
+        super().__init__(
+            topic={"record": "abcd-1234"},
+            created_by={"user": "5"},
+            reviewers=[],
+        )
+        self.id = REQUEST_ID
+        self.number = "42"
+        self.type = request_type
+        self.status = "submitted"
+        self.is_open = True
+        self.created = datetime.now(UTC) - timedelta(days=1)
+        self.update(data)
+
+
+class Requests(dict):
+    """Requests in the database, by id."""
+
+
+@pytest.fixture
+def requests_db(
+    create_app: Callable[..., Flask],
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[Requests]:
+    """Queue table, and the requests looked up by `refresh_queue_entry`."""
+    app = create_app(SQLALCHEMY_DATABASE_URI="sqlite://")
+    InvenioDB(app, entry_point_group=False)
+
+    requests = Requests()
+
+    def get_record(request_id: UUID) -> RequestStandIn:
+        if request_id not in requests:
+            raise NoResultFound
+        return requests[request_id]
+
+    monkeypatch.setattr(queue, "Request", SimpleNamespace(get_record=get_record))
+
+    with app.app_context():
+        CurationQueueEntry.__table__.create(db.engine)
+        requests.app = app
+        yield requests
+
+
+def entries() -> list[tuple]:
+    """Return the status and assignee of all entries."""
+    return [
+        (entry.status, entry.assignee)
+        for entry in CurationQueueEntry.query.order_by(CurationQueueEntry.created)
+    ]
+
+
+@pytest.mark.usefixtures("requests_db")
+def test_curation_queue() -> None:
+    """Entries are filtered by status and assignee, and paged oldest first."""
+    now = datetime.now(UTC)
+    for days, status, assignee in [
+        (3, "submitted", None),
+        (1, "review", "7"),
+        (2, "submitted", "7"),
+    ]:
+        db.session.add(
+            CurationQueueEntry(
+                request_id=uuid4(),
+                status=status,
+                assignee=assignee,
+                created=now - timedelta(days=days),
+                updated=now,
+            ),
+        )
+    db.session.commit()
+
+    total, page = curation_queue(status="submitted")
+    assert total == SUBMITTED
+    assert [entry.assignee for entry in page] == [None, "7"]
+
+    total, page = curation_queue(assignee="7", page=2, size=1)
+    assert total == SUBMITTED
+    assert [entry.status for entry in page] == ["review"]
+
+    _total, page = curation_queue(assignee="")
+    assert [entry.status for entry in page] == ["submitted"]
+
+
+def test_refresh_queue_entry(requests_db: Requests) -> None:
+    """Open curation requests are written, closed and deleted ones removed."""
+    requests_db[REQUEST_ID] = RequestStandIn()
+    refresh_queue_entry(REQUEST_ID)
+    assert entries() == [("submitted", None)]
+
+    request = requests_db[REQUEST_ID]
+    request.status = "review"
+    request["reviewers"] = [{"group": "curators"}, {"user": "7"}]
+    refresh_queue_entry(REQUEST_ID)
+    assert entries() == [("review", "7")]
+
+    request.status, request.is_open = "accepted", False
+    refresh_queue_entry(REQUEST_ID)
+    assert entries() == []
+
+    request.status, request.is_open = "submitted", True
+    refresh_queue_entry(REQUEST_ID)
+    del requests_db[REQUEST_ID]
+    refresh_queue_entry(REQUEST_ID)
+    assert entries() == []
+
+
+def test_other_request_types(requests_db: Requests) -> None:
+    """Only curation requests are queued."""
+    requests_db[REQUEST_ID] = RequestStandIn(request_type=CommunitySubmission)
+    refresh_queue_entry(REQUEST_ID)
+    assert entries() == []
+
+
+def test_component(requests_db: Requests) -> None:
+    """Every event refreshes the entry of its request, in a commit of its own."""
+    requests_db[REQUEST_ID] = RequestStandIn()
+
+    operations = []
+    component = CurationQueueComponent(None)
+    component.uow = SimpleNamespace(register=operations.append)
+    component.create(Identity(1), event=SimpleNamespace(request_id=REQUEST_ID))
+    assert entries() == []
+
+    for operation in operations:
+        operation.on_commit(None)
+    db.session.rollback()
+    assert entries() == [("submitted", None)]
+
+
+@pytest.fixture
+def client(requests_db: Requests, monkeypatch: pytest.MonkeyPatch) -> object:
+    """Client of the REST API, acting as the identity in `requests_db.identity`."""
+    app = requests_db.app
+    app.register_blueprint(api_blueprint(app))
+    monkeypatch.setattr(
+        views,
+        "current_curations_service",
+        SimpleNamespace(
+            moderation_role_name="administration-moderation",
+            privileged_roles=["administration"],
+        ),
+    )
+    monkeypatch.setattr(views, "current_user", SimpleNamespace(id=CURATOR_ID))
+
+    requests_db.identity = Identity(CURATOR_ID)
+    app.before_request(lambda: setattr(g, "identity", requests_db.identity))
+
+    requests_db[REQUEST_ID] = RequestStandIn(
+        reviewers=[{"user": str(CURATOR_ID)}],
+    )
+    refresh_queue_entry(REQUEST_ID)
+    db.session.commit()
+    return app.test_client()
+
+
+def test_view(client: object, requests_db: Requests) -> None:
+    """Curators page through the queue, others are denied."""
+    assert client.get("/tugraz/curation-queue").status_code == HTTPStatus.FORBIDDEN
+
+    requests_db.identity.provides.add(RoleNeed("administration-moderation"))
+    response = client.get("/tugraz/curation-queue?assignee=me&status=submitted")
+    assert response.status_code == HTTPStatus.OK
+
+    hits = response.json["hits"]
+    assert hits["total"] == 1
+    assert [hit["id"] for hit in hits["hits"]] == [str(REQUEST_ID)]
+    assert hits["hits"][0]["assignee"] == str(CURATOR_ID)
+    assert hits["hits"][0]["age"] >= timedelta(days=1).total_seconds()
+
+    response = client.get("/tugraz/curation-queue?status=review")
+    assert response.json["hits"] == {"total": 0, "hits": []}
+    assert (
+        client.get("/tugraz/curation-queue?size=0").status_code
+        == HTTPStatus.BAD_REQUEST
+    )
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the request-scoped memo of curation states."""
+
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_principal import Identity, Need
+from invenio_records_permissions.generators import Generator
+
+from invenio_config_tugraz.permissions import curations
+from invenio_config_tugraz.permissions.curations import (
+    CurationState,
+    curation_state,
+    prefetch_curation_states,
+)
+from invenio_config_tugraz.permissions.generators import (
+    TUGrazIfCurationRequestAccepted,
+    TUGrazIfCurationRequestBasedExists,
+)
+from invenio_config_tugraz.requests.components import (
+    ClearPermissionMemosOp,
+    PermissionMemosComponent,
+)
+
+CURATED = {"record": "abcd-1234"}
+UNCURATED = {"record": "efgh-5678"}
+THEN = Need("label", "then")
+ELSE = Need("label", "else")
+
+
+class RequestsStandIn:
+    """Stand-in of the requests service's search, counting the searches."""
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.curation_requests = [
+            {"topic": CURATED, "status": "submitted", "is_open": True},
+        ]
+        self.searches = 0
+
+    def _search(self, *_: object, **__: object) -> "RequestsStandIn":
+        self.searches += 1
+        return self
+
+    def source(self, _: list[str]) -> "RequestsStandIn":
+        """Select the fields of the hits."""
+        return self
+
+    def scan(self) -> Iterator[SimpleNamespace]:
+        """Yield the curation requests."""
+        for source in self.curation_requests:
+            yield SimpleNamespace(to_dict=lambda source=source: dict(source))
+
+
+class Label(Generator):
+    """Generator of a fixed need."""
+
+    def __init__(self, label: str) -> None:
+        """Construct."""
+        self.label = label
+        super().__init__()
+
+    def needs(self, **__: dict) -> list[Need]:
+        """Return the need of the label."""
+        return [Need("label", self.label)]
+
+
+@pytest.fixture
+def requests_service(
+    create_app: Callable[..., Flask],
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[RequestsStandIn]:
+    """Replace the requests search by a stand-in, within a request."""
+    stand_in = RequestsStandIn()
+    monkeypatch.setattr(curations, "current_requests_service", stand_in)
+    with create_app().test_request_context():
+        yield stand_in
+
+
+def request(topic: dict) -> SimpleNamespace:
+    """Return a request of the topic."""
+    return SimpleNamespace(topic=SimpleNamespace(reference_dict=topic))
+
+
+def test_memo(requests_service: RequestsStandIn) -> None:
+    """The states of a result page are loaded in one search, then memoized."""
+    hits = [
+        {"_source": {"topic": CURATED}},
+        {"_source": {"topic": UNCURATED}},
+        {"_source": {"topic": {"user": "1"}}},
+    ]
+    prefetch_curation_states(hits)
+
+    assert curation_state(CURATED) == CurationState(exists=True, accepted=False)
+    assert curation_state(UNCURATED) == CurationState(exists=False, accepted=False)
+    assert requests_service.searches == 1
+
+
+def branch(generator: Generator, **kwargs: object) -> set[Need]:
+    """Return the needs of the generator's branch taken."""
+    return set(generator.needs(**kwargs))
+
+
+def conditional(generator_cls: type) -> Generator:
+    """Return the condition, with a branch labelled each."""
+    return generator_cls(then_=[Label("then")], else_=[Label("else")])
+
+
+@pytest.mark.parametrize(
+    ("status", "accepted"),
+    [("accepted", True), ("declined", False)],
+)
+def test_cleared_after_commit(
+    requests_service: RequestsStandIn,
+    status: str,
+    accepted: bool,  # noqa: FBT001
+) -> None:
+    """An accepted or declined curation request is seen after the commit."""
+    accept = conditional(TUGrazIfCurationRequestAccepted)
+    assert branch(accept, request=request(CURATED)) == {ELSE}
+
+    requests_service.curation_requests[0].update(status=status, is_open=False)
+    assert branch(accept, request=request(CURATED)) == {ELSE}
+
+    ClearPermissionMemosOp().on_post_commit(None)
+
+    assert curation_state(CURATED) == CurationState(exists=True, accepted=accepted)
+    assert branch(accept, request=request(CURATED)) == {THEN if accepted else ELSE}
+
+
+def test_without_curation_request(requests_service: RequestsStandIn) -> None:
+    """Like upstream, a topic without a curation request has none accepted.
+
+    That is, ``get_review`` finds no review and ``accepted_record`` is false.
+    """
+    exists = conditional(TUGrazIfCurationRequestBasedExists)
+    accept = conditional(TUGrazIfCurationRequestAccepted)
+    requests_service.curation_requests = []
+
+    assert curation_state(UNCURATED) == CurationState(exists=False, accepted=False)
+    assert branch(exists, request=request(UNCURATED)) == {ELSE}
+    assert branch(accept, request=request(UNCURATED)) == {ELSE}
+    assert branch(exists, request=None) == {ELSE}
+
+
+def test_component(requests_service: RequestsStandIn) -> None:
+    """New requests and events clear the memos after the commit."""
+    assert curation_state(CURATED) == CurationState(exists=True, accepted=False)
+    requests_service.curation_requests[0].update(status="accepted", is_open=False)
+
+    operations = []
+    component = PermissionMemosComponent(None)
+    component.uow = SimpleNamespace(register=operations.append)
+    component.create(Identity(1), data={}, request=None)
+    assert curation_state(CURATED) == CurationState(exists=True, accepted=False)
+
+    for operation in operations:
+        operation.on_post_commit(None)
+    assert curation_state(CURATED) == CurationState(exists=True, accepted=True)
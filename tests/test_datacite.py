@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the streaming DataCite export."""
+
+import gzip
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from invenio_config_tugraz import datacite
+from invenio_config_tugraz.datacite import (
+    FOOTER,
+    HEADER,
+    Checkpoint,
+    export_datacite,
+    write_member,
+)
+
+
+def resource(id_: str) -> bytes:
+    """Return the DataCite XML stand-in of a record."""
+    return f"<resource>{id_}</resource>\n".encode()
+
+
+def hit(id_: str, sort: list, *, doi: bool = True) -> dict:
+    """Return the search hit of a record, with or without DOI."""
+    pids = {"doi": {"identifier": f"10.3217/{id_}"}} if doi else {}
+    return {"_source": {"id": id_, "pids": pids}, "sort": sort}
+
+
+def test_resume_appends_members(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A resumed export drops the partial page and stays one gzip stream.
+
+    Records without a DOI are skipped and logged.
+    """
+    output = tmp_path / "datacite.xml.gz"
+    with output.open("wb") as stream:
+        write_member(stream, HEADER)
+        write_member(stream, resource("1"))
+        checkpoint = Checkpoint.for_output(output, resume=False)
+        checkpoint.count, checkpoint.search_after = 1, [1, "a"]
+        checkpoint.offset = stream.tell()
+        checkpoint.save()
+        write_member(stream, b"<resource>partial")
+
+    def pages(_search: object, *, after: list | None, **_: int) -> Iterator[dict]:
+        assert after == [1, "a"]
+        yield {"hits": {"hits": [hit("2", [2, "b"]), hit("3", [3, "c"], doi=False)]}}
+        yield {"hits": {"hits": []}}
+
+    monkeypatch.setattr(datacite, "datacite_search", lambda: None)
+    monkeypatch.setattr(datacite, "search_after_pages", pages)
+    monkeypatch.setattr(
+        datacite,
+        "serialize_datacite",
+        lambda source: resource(source["id"]),
+    )
+
+    with Flask("testapp").app_context():
+        checkpoint = export_datacite(output, processes=1, resume=True)
+
+    assert gzip.decompress(output.read_bytes()) == (
+        HEADER + resource("1") + resource("2") + FOOTER
+    )
+    assert (checkpoint.count, checkpoint.skipped, checkpoint.failed) == (2, ["3"], [])
+    assert not checkpoint.path.exists()
+    assert "skipping records without DOI: 3" in caplog.text
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for database pool sizing and metrics."""
+
+import sqlite3
+from collections.abc import Callable
+from http import HTTPStatus
+
+from flask import Flask
+from invenio_db import InvenioDB
+from sqlalchemy.pool import QueuePool
+
+from invenio_config_tugraz.config import CONFIG_TUGRAZ_ROUTES
+from invenio_config_tugraz.db import (
+    PoolMetrics,
+    TimedQueuePool,
+    WorkerTopology,
+    compute_pool_options,
+    pool_metrics,
+)
+from invenio_config_tugraz.views import ui_blueprint
+
+
+def test_compute_pool_options() -> None:
+    """Pools of all processes stay within the connection budget."""
+    threads = 4
+    topology = WorkerTopology(web_processes=8, web_threads=threads, celery_processes=8)
+    options = compute_pool_options(100, reserved_connections=4, topology=topology)
+
+    assert options["pool_size"] == threads
+    assert options["pool_size"] + options["max_overflow"] == (100 - 4) // 16
+
+
+def test_compute_pool_options_small_budget() -> None:
+    """Every process gets at least one connection."""
+    topology = WorkerTopology(web_processes=20, web_threads=8)
+    options = compute_pool_options(10, topology=topology)
+
+    assert options["pool_size"] == 1
+    assert options["max_overflow"] == 0
+
+
+def test_pool_metrics_prometheus() -> None:
+    """Counters and latency quantiles are rendered for Prometheus."""
+    metrics = PoolMetrics(samples=10)
+    for i in range(1, 21):
+        metrics.count("checkouts")
+        metrics.observe("hold", i / 100)
+
+    body = metrics.to_prometheus()
+
+    assert "# TYPE tugraz_db_pool_checkouts_total counter" in body
+    assert 'tugraz_db_pool_checkouts_total{pid="' in body
+    # only the latest 10 samples (0.11 - 0.20) are kept for quantiles
+    assert 'quantile="0.5"} 0.160000' in body
+    assert "tugraz_db_pool_hold_seconds_count" in body
+
+
+def test_pool_overflows() -> None:
+    """Overflows are counted once per transition into the overflow."""
+    pool = TimedQueuePool(
+        lambda: sqlite3.connect(":memory:", check_same_thread=False),
+        pool_size=1,
+        max_overflow=3,
+    )
+    pool_metrics.reset()
+
+    connections = [pool.connect() for _ in range(4)]
+    assert pool_metrics.counts["overflows"] == 1
+
+    for connection in connections:
+        connection.close()
+    pool_metrics.reset()
+
+    connections = [pool.connect() for _ in range(2)]
+    assert pool_metrics.counts["overflows"] == 1
+
+
+def test_pool_metrics_of_untimed_pools() -> None:
+    """Overflows and checkout waits are left out, unless measured."""
+
+    def connect() -> sqlite3.Connection:
+        return sqlite3.connect(":memory:", check_same_thread=False)
+
+    timed = pool_metrics.to_prometheus(TimedQueuePool(connect))
+    assert "tugraz_db_pool_overflows_total" in timed
+    assert "tugraz_db_pool_checkout_wait_seconds" in timed
+
+    untimed = pool_metrics.to_prometheus(QueuePool(connect))
+    assert "tugraz_db_pool_overflows_total" not in untimed
+    assert "tugraz_db_pool_checkout_wait_seconds" not in untimed
+    assert "tugraz_db_pool_checked_out" in untimed
+
+
+def test_pool_metrics_view(create_app: Callable[..., Flask]) -> None:
+    """The metrics are denied unless the configured token is sent."""
+    app = create_app(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        CONFIG_TUGRAZ_ROUTES=CONFIG_TUGRAZ_ROUTES,
+        CONFIG_TUGRAZ_DB_POOL_METRICS=True,
+    )
+    InvenioDB(app, entry_point_group=False)
+    app.register_blueprint(ui_blueprint(app))
+    client = app.test_client()
+    route = CONFIG_TUGRAZ_ROUTES["db-pool-metrics"]
+
+    def status(token: str | None = None) -> int:
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        return client.get(route, headers=headers).status_code
+
+    assert status() == HTTPStatus.FORBIDDEN
+    assert status("None") == HTTPStatus.FORBIDDEN
+
+    app.config["CONFIG_TUGRAZ_METRICS_TOKEN"] = "secret"  # noqa: S105
+    assert status() == HTTPStatus.FORBIDDEN
+    assert status("wrong") == HTTPStatus.FORBIDDEN
+    assert status("secret") == HTTPStatus.OK
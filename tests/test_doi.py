@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the bulk DOI registration against a local DataCite stand-in."""
+
+from collections import Counter
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_principal import Identity
+from invenio_db import InvenioDB, db
+from invenio_rdm_records.services.pids.tasks import register_or_update_pid
+from invenio_records_resources.services.uow import TaskOp
+
+from invenio_config_tugraz import doi, tasks
+from invenio_config_tugraz.components import (
+    BulkDOIRegistrationMixin,
+    BulkDOIRegistrationOp,
+)
+from invenio_config_tugraz.doi import (
+    DataCiteBulkClient,
+    DOIPayload,
+    Outcome,
+    queue_doi_registration,
+    register_doi_batch,
+)
+from invenio_config_tugraz.models import DOIRegistration, DOIRegistrationStatus
+
+DOIS = 40
+CONCURRENCY = 4
+MAX_ATTEMPTS = 3
+RECID = "abcd-1234"
+
+
+def test_bulk_registration(datacite_server: object) -> None:
+    """DOIs are sent concurrently, but never more than `concurrency` at once."""
+    client = DataCiteBulkClient(
+        datacite_server.url,
+        "user",
+        "password",
+        concurrency=CONCURRENCY,
+    )
+    payloads = [
+        DOIPayload(f"10.3217/{n:04}", {"url": f"https://repo/records/{n}"})
+        for n in range(DOIS)
+    ]
+
+    outcomes = client.register_all(payloads)
+
+    assert all(outcome.registered for outcome in outcomes.values())
+    assert len(datacite_server.requests) == DOIS
+    assert datacite_server.max_in_flight == CONCURRENCY
+    doi, body = datacite_server.requests[0]
+    assert body["data"]["id"] == doi
+    assert body["data"]["attributes"]["doi"] == doi
+
+
+def test_bulk_registration_retries(datacite_server: object) -> None:
+    """Transient errors are retried, client errors are not."""
+    datacite_server.failures = {
+        "10.3217/busy": [429, 503],
+        "10.3217/down": [503] * 10,
+        "10.3217/invalid": [422],
+    }
+    client = DataCiteBulkClient(
+        datacite_server.url,
+        "user",
+        "password",
+        retries=2,
+        backoff=0.01,
+    )
+    dois = ["10.3217/ok", "10.3217/busy", "10.3217/down", "10.3217/invalid"]
+
+    outcomes = client.register_all([DOIPayload(doi, {}) for doi in dois])
+
+    assert outcomes["10.3217/ok"].registered
+    assert outcomes["10.3217/busy"].registered
+    assert not outcomes["10.3217/down"].registered
+    assert outcomes["10.3217/down"].retry
+    assert not outcomes["10.3217/invalid"].registered
+    assert not outcomes["10.3217/invalid"].retry
+    assert outcomes["10.3217/invalid"].error.startswith("422")
+
+    attempts = sorted(doi for doi, _ in datacite_server.requests)
+    assert attempts == [
+        "10.3217/busy",  # 429
+        "10.3217/busy",  # 503
+        "10.3217/busy",
+        "10.3217/down",  # 503, then 2 retries
+        "10.3217/down",
+        "10.3217/down",
+        "10.3217/invalid",  # 422, not retried
+        "10.3217/ok",
+    ]
+
+
+@pytest.fixture
+def registrations(create_app: Callable[..., Flask]) -> Iterator[None]:
+    """Queue table of the DOI registrations."""
+    app = create_app(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        CONFIG_TUGRAZ_BULK_DOI_REGISTRATION=True,
+        CONFIG_TUGRAZ_BULK_DOI_MAX_ATTEMPTS=MAX_ATTEMPTS,
+        CONFIG_TUGRAZ_BULK_DOI_RETRY_DELAY=600,
+    )
+    InvenioDB(app, entry_point_group=False)
+
+    with app.app_context():
+        DOIRegistration.__table__.create(db.engine)
+        yield
+
+
+def statuses() -> dict[str, tuple]:
+    """Return the status and attempts of each queued DOI."""
+    return {
+        registration.doi: (registration.status, registration.attempts)
+        for registration in DOIRegistration.query
+    }
+
+
+class RecordStandIn(dict):
+    """Stand-in of a published record and its parent."""
+
+    def __init__(self, pids: dict, parent_pids: dict) -> None:
+        """Construct."""
+        super().__init__(id=RECID)
+        self.pids = pids
+        self.parent = SimpleNamespace(pids=parent_pids)
+
+
+class PIDsComponentStandIn:
+    """Stand-in of the PIDs components, registering a task per PID."""
+
+    parent = False
+
+    def __init__(self, uow: object) -> None:
+        """Construct."""
+        self.uow = uow
+
+    def publish(
+        self,
+        identity: Identity,  # noqa: ARG002
+        record: RecordStandIn | None = None,
+        **kwargs: dict,  # noqa: ARG002
+    ) -> None:
+        """Register the PIDs."""
+        pids = record.parent.pids if self.parent else record.pids
+        for scheme in pids:
+            self.uow.register(
+                TaskOp(
+                    register_or_update_pid,
+                    recid=record["id"],
+                    scheme=scheme,
+                    parent=self.parent,
+                ),
+            )
+
+
+class BulkDOIComponent(BulkDOIRegistrationMixin, PIDsComponentStandIn):
+    """Component queueing the record's DataCite DOI."""
+
+
+class BulkDOIParentComponent(BulkDOIComponent):
+    """Component queueing the parent's DataCite DOI."""
+
+    parent = True
+
+
+@pytest.mark.usefixtures("registrations")
+def test_bulk_doi_components() -> None:
+    """DataCite DOIs are queued, other PIDs keep their registration task."""
+    record = RecordStandIn(
+        pids={
+            "doi": {"identifier": "10.3217/abcd-1234", "provider": "datacite"},
+            "oai": {"identifier": "oai:repository.tugraz.at:abcd-1234"},
+        },
+        parent_pids={
+            "doi": {"identifier": "10.3217/wxyz-9876", "provider": "datacite"},
+        },
+    )
+    operations = []
+    uow = SimpleNamespace(register=operations.append)
+    for component in (BulkDOIComponent(uow), BulkDOIParentComponent(uow)):
+        component.publish(Identity(1), record=record)
+
+    task_ops = [op for op in operations if isinstance(op, TaskOp)]
+    assert [op._kwargs["scheme"] for op in task_ops] == ["oai"]  # noqa: SLF001
+    assert [type(op) for op in operations if op not in task_ops] == [
+        BulkDOIRegistrationOp,
+        BulkDOIRegistrationOp,
+    ]
+
+    db.session.commit()
+    assert statuses() == {
+        "10.3217/abcd-1234": (DOIRegistrationStatus.QUEUED, 0),
+        "10.3217/wxyz-9876": (DOIRegistrationStatus.QUEUED, 0),
+    }
+    assert DOIRegistration.query.filter_by(doi="10.3217/wxyz-9876").one().parent
+
+
+class PIDStandIn:
+    """Stand-in of a new persistent identifier."""
+
+    registered = []
+
+    def __init__(self, doi: str) -> None:
+        """Construct."""
+        self.doi = doi
+
+    @classmethod
+    def get(cls, _scheme: str, doi: str) -> "PIDStandIn":
+        """Return the identifier of the DOI."""
+        return cls(doi)
+
+    def is_new(self) -> bool:
+        """Whether it is new."""
+        return True
+
+    def register(self) -> None:
+        """Record the registration."""
+        self.registered.append(self.doi)
+
+
+@pytest.mark.usefixtures("registrations")
+def test_register_doi_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The outcome of each DOI is recorded in the queue."""
+    outcomes = {
+        "ok": Outcome(registered=True),
+        "invalid": Outcome(registered=False, error="422", retry=False),
+        "busy": Outcome(registered=False, error="503", retry=True),
+        "exhausted": Outcome(registered=False, error="503", retry=True),
+    }
+    for name in [*outcomes, "restricted", "broken"]:
+        queue_doi_registration(RECID, name)
+    DOIRegistration.query.filter_by(doi="exhausted").one().attempts = MAX_ATTEMPTS - 1
+    db.session.commit()
+
+    def doi_payload(registration: DOIRegistration) -> DOIPayload | None:
+        if registration.doi == "broken":
+            msg = "record is being reindexed"
+            raise RuntimeError(msg)
+        if registration.doi == "restricted":
+            return None
+        return DOIPayload(registration.doi, {})
+
+    monkeypatch.setattr(doi, "doi_payload", doi_payload)
+    monkeypatch.setattr(doi, "PersistentIdentifier", PIDStandIn)
+    monkeypatch.setattr(PIDStandIn, "registered", [])
+    client = SimpleNamespace(
+        register_all=lambda payloads: {p.doi: outcomes[p.doi] for p in payloads},
+    )
+
+    counts = register_doi_batch(client=client)
+
+    queued, registered, skipped, failed = (
+        DOIRegistrationStatus.QUEUED,
+        DOIRegistrationStatus.REGISTERED,
+        DOIRegistrationStatus.SKIPPED,
+        DOIRegistrationStatus.FAILED,
+    )
+    assert counts == Counter({queued: 2, failed: 2, registered: 1, skipped: 1})
+    assert statuses() == {
+        "ok": (registered, 1),
+        "invalid": (failed, 1),
+        "busy": (queued, 1),
+        "exhausted": (failed, MAX_ATTEMPTS),
+        "restricted": (skipped, 0),
+        "broken": (queued, 1),
+    }
+    assert PIDStandIn.registered == ["ok"]
+    assert "reindexed" in DOIRegistration.query.filter_by(doi="broken").one().error
+
+
+@pytest.mark.usefixtures("registrations")
+def test_register_queued_dois_retry_later(monkeypatch: pytest.MonkeyPatch) -> None:
+    """DOIs left in the queue without progress are tried again later."""
+    batches = [
+        Counter({DOIRegistrationStatus.REGISTERED: 1, DOIRegistrationStatus.QUEUED: 1}),
+        Counter({DOIRegistrationStatus.QUEUED: 1}),
+    ]
+    scheduled = []
+    monkeypatch.setattr(tasks, "current_cache", SimpleNamespace(delete=lambda _: None))
+    monkeypatch.setattr(tasks, "register_doi_batch", lambda _: batches.pop(0))
+    monkeypatch.setattr(tasks, "schedule_doi_registration", scheduled.append)
+
+    tasks.register_queued_dois()
+
+    assert batches == []
+    assert scheduled == [600]
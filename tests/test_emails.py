@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests and benchmark of the precompiled welcome email."""
+
+import logging
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+
+import pytest
+from flask import Blueprint, Flask, render_template
+from invenio_i18n import InvenioI18N
+
+from invenio_config_tugraz.config import CONFIG_TUGRAZ_ROUTES
+from invenio_config_tugraz.emails import render_welcome_email
+from invenio_config_tugraz.ext import finalize_app
+from invenio_config_tugraz.views import ui_blueprint
+
+REGISTRATIONS = 1000
+
+
+def welcome_email_app(create_app: Callable[..., Flask]) -> Flask:
+    """Return an app with the welcome email precompiled in English and German."""
+    app = create_app(
+        CONFIG_TUGRAZ_ROUTES=CONFIG_TUGRAZ_ROUTES,
+        SITE_UI_URL="https://repository.tugraz.at",
+        I18N_LANGUAGES=[("de", "German")],
+    )
+    InvenioI18N(app)
+    app.register_blueprint(ui_blueprint(app))
+    rdm = Blueprint("invenio_app_rdm", __name__)
+    rdm.add_url_rule("/help/search", "help_search", lambda: "")
+    app.register_blueprint(rdm)
+    finalize_app(app)
+    return app
+
+
+def test_welcome_email_bulk_registration(create_app: Callable[..., Flask]) -> None:
+    """The welcome email is rendered from its parts, precompiled at startup."""
+    app = welcome_email_app(create_app)
+
+    cache = app.extensions["invenio-config-tugraz"].welcome_email_cache
+    assert set(cache) == {"en", "de"}
+
+    security = SimpleNamespace(confirmable=False)
+    with app.test_request_context():
+        mail = render_template("security/email/welcome.txt", security=security)
+        assert cache["en"] == render_welcome_email("en")
+
+    assert mail.startswith("Dear user,")
+    assert "https://repository.tugraz.at/guide" in mail
+    assert mail.rstrip().endswith("TU Graz Repository Team")
+
+
+@pytest.mark.benchmark
+def test_welcome_email_benchmark(create_app: Callable[..., Flask]) -> None:
+    """Log the time of many welcome emails, precompiled and rendered in full."""
+    app = welcome_email_app(create_app)
+
+    security = SimpleNamespace(confirmable=False)
+    with app.test_request_context():
+        start = time.perf_counter()
+        for _ in range(REGISTRATIONS):
+            render_template("security/email/welcome.txt", security=security)
+        precompiled = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(REGISTRATIONS):
+            render_welcome_email("en")
+        rendered = time.perf_counter() - start
+
+    logging.getLogger(__name__).info(
+        "%s welcome emails: %.3fs precompiled, "
+        "%.3fs rendering static parts every time",
+        REGISTRATIONS,
+        precompiled,
+        rendered,
+    )
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests and benchmark of the precomputed security headers."""
+
+import logging
+import time
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask, jsonify
+from flask_talisman import Talisman
+
+from invenio_config_tugraz import config
+from invenio_config_tugraz.headers import SecureHeaders, init_secure_headers
+
+REQUESTS = 2000
+
+
+def talisman_app(**secure_headers: object) -> Flask:
+    """Application with Talisman configured like invenio-app does."""
+    app = Flask("testapp")
+    app.config["CONFIG_TUGRAZ_PRECOMPUTED_SECURE_HEADERS"] = True
+    talisman = Talisman(app, **{**config.APP_DEFAULT_SECURE_HEADERS, **secure_headers})
+    app.extensions["invenio-app"] = SimpleNamespace(talisman=talisman)
+
+    @app.route("/api/records/<id_>")
+    def record(id_: str) -> object:
+        return jsonify(id=id_)
+
+    @app.route("/records/<id_>")
+    def record_page(id_: str) -> str:
+        return f"<script nonce='{app.jinja_env.globals['csp_nonce']()}'>{id_}</script>"
+
+    return app
+
+
+def add_headers(app: Flask, path: str, rounds: int = 1) -> dict:
+    """Run the after request hooks `rounds` times, return the headers."""
+    with app.test_request_context(path, base_url="https://localhost"):
+        app.preprocess_request()
+        response = app.make_response(app.dispatch_request())
+        hooks = app.after_request_funcs[None]
+        for _ in range(rounds):
+            response.headers.clear()
+            for hook in hooks:
+                response = hook(response)
+        return dict(response.headers)
+
+
+def test_precomputed_headers() -> None:
+    """The headers of small JSON responses equal Talisman's."""
+    expected = add_headers(talisman_app(), "/api/records/abcd-1234")
+
+    app = talisman_app()
+    init_secure_headers(app)
+    assert isinstance(app.after_request_funcs[None][0], SecureHeaders)
+    headers = add_headers(app, "/api/records/abcd-1234")
+
+    assert headers == expected
+    assert "ub-support.tugraz.at" in headers["Content-Security-Policy"]
+    assert "includeSubDomains" in headers["Strict-Transport-Security"]
+
+
+def policy_and_nonce(app: Flask) -> tuple[str, str]:
+    """Request a page, return its policy and the nonce of its script."""
+    response = app.test_client().get("/records/abcd-1234", base_url="https://localhost")
+    return (
+        response.headers["Content-Security-Policy"],
+        response.get_data(as_text=True).split("'")[1],
+    )
+
+
+def test_precomputed_headers_nonce() -> None:
+    """Nonces are spliced into the policy of each request."""
+    nonce_in = ["default-src"]
+    talisman_policy, talisman_nonce = policy_and_nonce(
+        talisman_app(content_security_policy_nonce_in=nonce_in),
+    )
+
+    app = talisman_app(content_security_policy_nonce_in=nonce_in)
+    init_secure_headers(app)
+    first_policy, first_nonce = policy_and_nonce(app)
+    second_policy, second_nonce = policy_and_nonce(app)
+
+    assert first_nonce != second_nonce
+    assert first_policy == talisman_policy.replace(talisman_nonce, first_nonce)
+    assert second_policy == talisman_policy.replace(talisman_nonce, second_nonce)
+
+
+@pytest.mark.benchmark
+def test_precomputed_headers_benchmark() -> None:
+    """Log the time of adding the headers, by Talisman and precomputed."""
+    app = talisman_app()
+    precomputed_app = talisman_app()
+    init_secure_headers(precomputed_app)
+
+    def seconds(app: Flask) -> float:
+        start = time.perf_counter()
+        add_headers(app, "/api/records/abcd-1234", rounds=REQUESTS)
+        return (time.perf_counter() - start) / REQUESTS
+
+    logging.getLogger(__name__).info(
+        "%s responses: talisman %.1fµs, precomputed %.1fµs per response",
+        REQUESTS,
+        seconds(app) * 1e6,
+        seconds(precomputed_app) * 1e6,
+    )
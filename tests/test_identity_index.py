@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the memoized parent needs of the records permissions."""
+
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from flask import Flask
+from flask_principal import Identity, RoleNeed, UserNeed
+from invenio_access.permissions import any_user
+from invenio_communities.generators import CommunityRoleNeed
+from invenio_db import InvenioDB, db
+from invenio_rdm_records.records.api import RDMParent
+from invenio_rdm_records.records.models import RDMParentCommunity
+from invenio_search.engine import dsl
+
+from invenio_config_tugraz.components import ParentNeedsPrefetchComponent
+from invenio_config_tugraz.permissions.identities import (
+    IdentitySubjects,
+    checked_parent_needs,
+    grant_subjects,
+    parent_needs,
+)
+from invenio_config_tugraz.permissions.policies import (
+    TUGrazRDMRecordPermissionPolicy,
+)
+from invenio_config_tugraz.sql_tracker import QueryTracker
+
+USER_ID = 5
+OTHER_USER_ID = 6
+PARENT = UUID("7f1c1b2e-2f4b-4d7b-9d4e-0a1b2c3d4e5f")
+OTHER_PARENT = UUID("8e2d2c3f-3a5c-4e8c-8e5f-1b2c3d4e5f60")
+COMMUNITY = "c0ffee00-0000-4000-8000-000000000001"
+
+MANAGE_GRANT = {
+    "subject": {"type": "role", "id": "editors"},
+    "permission": "manage",
+    "origin": None,
+}
+
+
+def identity(user_id: int, *needs: object) -> Identity:
+    """Return the identity of a user, providing the needs."""
+    identity = Identity(user_id)
+    identity.provides |= {UserNeed(user_id), any_user, *needs}
+    return identity
+
+
+def test_grant_subjects() -> None:
+    """The subjects are those `AccessGrant` makes grant tokens of."""
+    assert grant_subjects(identity(USER_ID, RoleNeed("editors"))) == {
+        ("user", str(USER_ID)),
+        ("role", "editors"),
+        ("system_role", "any_user"),
+    }
+
+
+def test_parent_needs() -> None:
+    """Only the needs of the identity which the parent grants are returned."""
+    subjects = IdentitySubjects(
+        user_id=USER_ID,
+        subjects={("user", str(USER_ID)), ("role", "editors")},
+        curator_roles={COMMUNITY: {"curator"}},
+    )
+    access = {
+        "owned_by": {"user": str(USER_ID)},
+        "grants": [
+            MANAGE_GRANT,
+            {"subject": {"type": "role", "id": "other"}, "permission": "edit"},
+        ],
+    }
+
+    needs = parent_needs(subjects, access, {COMMUNITY})
+    assert needs.owners == [UserNeed(USER_ID)]
+    assert needs.grants == {"manage": {RoleNeed("editors")}}
+    assert needs.curators == {CommunityRoleNeed(COMMUNITY, "curator")}
+
+    needs = parent_needs(subjects, {"owned_by": {"user": "7"}}, set())
+    assert needs.owners == []
+    assert needs.grants == {}
+    assert needs.curators == set()
+
+
+def test_unchecked_identity() -> None:
+    """Outside of a permission check, the generators load the parents."""
+    record = SimpleNamespace(model=SimpleNamespace(parent_id=PARENT))
+    assert checked_parent_needs(record) is None
+
+
+@pytest.fixture
+def parent(create_app: Callable[..., Flask]) -> Iterator[object]:
+    """Parent owned by `USER_ID`, in the database."""
+    app = create_app(SQLALCHEMY_DATABASE_URI="sqlite://")
+    InvenioDB(app, entry_point_group=False)
+
+    with app.app_context():
+        RDMParent.model_cls.__table__.create(db.engine)
+        RDMParentCommunity.__table__.create(db.engine)
+        model = RDMParent.model_cls(
+            id=PARENT,
+            json={"access": {"owned_by": {"user": str(USER_ID)}, "grants": []}},
+        )
+        db.session.add(model)
+        db.session.commit()
+        yield model
+
+
+def can_manage(identity: Identity, parent_id: UUID) -> bool:
+    """Check the manage permission on a record of the parent."""
+    record = SimpleNamespace(model=SimpleNamespace(parent_id=parent_id))
+    policy = TUGrazRDMRecordPermissionPolicy(action="manage", record=record)
+    return policy.allows(identity)
+
+
+def test_can_manage(parent: object) -> None:
+    """Permission checks are answered with the needs of the checked identity."""
+    owner = identity(USER_ID)
+    editor = identity(OTHER_USER_ID, RoleNeed("editors"))
+
+    assert can_manage(owner, parent.id)
+    assert not can_manage(editor, parent.id)
+
+    # granted later in the same request
+    parent.json = {
+        "access": {"owned_by": {"user": str(USER_ID)}, "grants": [MANAGE_GRANT]},
+    }
+    db.session.commit()
+
+    assert can_manage(editor, parent.id)
+    assert not can_manage(identity(OTHER_USER_ID), parent.id)
+
+
+def test_prefetch_component(parent: object) -> None:
+    """The parents of a page of hits are loaded at once, not per checked hit."""
+    db.session.add(
+        RDMParent.model_cls(
+            id=OTHER_PARENT,
+            json={"access": {"owned_by": {"user": str(OTHER_USER_ID)}}},
+        ),
+    )
+    db.session.commit()
+    owner = identity(USER_ID)
+
+    search = ParentNeedsPrefetchComponent(None).search(owner, dsl.Search(), {})
+    hits = [
+        {"_source": {"parent": {"id": str(parent_id)}}}
+        for parent_id in (parent.id, OTHER_PARENT)
+    ]
+    with QueryTracker() as tracker:
+        search._response_class(search, {"hits": {"hits": hits}})  # noqa: SLF001
+    assert tracker.count == 1
+
+    with QueryTracker() as tracker:
+        assert can_manage(owner, parent.id)
+        assert not can_manage(owner, OTHER_PARENT)
+    assert tracker.count == 0
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2020-2025 Graz University of Technology.
+# Copyright (C) 2020-2026 Graz University of Technology.
 #
 # invenio-config-tugraz is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
@@ -8,9 +8,15 @@
 
 """Module tests."""
 
+import logging
+from collections.abc import Callable
+
+import pytest
 from flask import Flask
+from invenio_i18n import InvenioI18N
 
 from invenio_config_tugraz import InvenioConfigTugraz, __version__
+from invenio_config_tugraz.i18n import lookup_seconds, preload_translations
 
 
 def test_version() -> None:
@@ -29,3 +35,37 @@ def test_init() -> None:
     assert "invenio-config-tugraz" not in app.extensions
     ext.init_app(app)
     assert "invenio-config-tugraz" in app.extensions
+
+
+def test_preload_translations(
+    create_app: Callable[..., Flask],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test catalogs of all languages are loaded at startup."""
+    app = create_app(
+        CONFIG_TUGRAZ_PRELOAD_TRANSLATIONS=True,
+        I18N_LANGUAGES=[("de", "German")],
+    )
+    InvenioI18N(app)
+
+    with caplog.at_level(logging.INFO):
+        preload_translations(app)
+
+    assert "preloaded translations of en, de" in caplog.text
+
+
+@pytest.mark.benchmark
+def test_translation_lookup_benchmark(create_app: Callable[..., Flask]) -> None:
+    """Log the lookup latency of the first request, and once catalogs are cached."""
+    app = create_app(I18N_LANGUAGES=[("de", "German")])
+    InvenioI18N(app)
+
+    first, steady = lookup_seconds(app), lookup_seconds(app)
+
+    logging.getLogger(__name__).info(
+        "translation lookup: %s",
+        ", ".join(
+            f"{locale} first {first[locale]:.6f}s, then {steady[locale]:.6f}s"
+            for locale in first
+        ),
+    )
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the tiered rate limits."""
+
+import pytest
+from flask import Flask, g
+from flask_login import LoginManager, UserMixin, login_user
+from flask_principal import Identity
+from limits import RateLimitItemPerMinute
+from limits.strategies import SlidingWindowCounterRateLimiter
+from werkzeug.utils import import_string
+
+from invenio_config_tugraz import config
+from invenio_config_tugraz.limiter import (
+    LeasingRedisStorage,
+    tiered_rate_limit,
+    tiered_rate_limit_key,
+)
+from invenio_config_tugraz.permissions.roles import tugraz_authenticated_user
+
+
+class User(UserMixin):
+    """Signed in user."""
+
+    id = 1
+
+
+@pytest.fixture
+def app() -> Flask:
+    """Application with the default limits."""
+    app = Flask("testapp")
+    app.config.update(
+        {k: getattr(config, k) for k in dir(config) if k.startswith("RATELIMIT_")},
+        SECRET_KEY="test",  # noqa: S106
+        CONFIG_TUGRAZ_IP_NETWORK="10.0.0.0/8",
+        CONFIG_TUGRAZ_RATELIMIT_CAMPUS_GUEST=config.CONFIG_TUGRAZ_RATELIMIT_CAMPUS_GUEST,
+        CONFIG_TUGRAZ_RATELIMIT_TUGRAZ_AUTHENTICATED_USER=(
+            config.CONFIG_TUGRAZ_RATELIMIT_TUGRAZ_AUTHENTICATED_USER
+        ),
+    )
+    login_manager = LoginManager(app)
+    login_manager.user_loader(lambda _: None)
+    return app
+
+
+@pytest.mark.parametrize(
+    ("remote_addr", "limit"),
+    [
+        ("10.1.2.3", config.CONFIG_TUGRAZ_RATELIMIT_CAMPUS_GUEST),
+        ("192.168.1.1", config.RATELIMIT_GUEST_USER),
+        ("not-an-ip", config.RATELIMIT_GUEST_USER),
+    ],
+)
+def test_guest_tiers(app: Flask, remote_addr: str, limit: str) -> None:
+    """Guests on campus get their own limit and bucket."""
+    with app.test_request_context(environ_base={"REMOTE_ADDR": remote_addr}):
+        assert tiered_rate_limit() == limit
+        assert tiered_rate_limit_key().endswith(remote_addr)
+
+
+def test_authenticated_tiers(app: Flask) -> None:
+    """tugraz_authenticated users get a higher limit than other users."""
+    with app.test_request_context():
+        login_user(User())
+        g.identity = Identity(User.id)
+        assert tiered_rate_limit() == config.RATELIMIT_AUTHENTICATED_USER
+        assert tiered_rate_limit_key() == "authenticated:1"
+
+    with app.test_request_context():
+        login_user(User())
+        g.identity = Identity(User.id)
+        g.identity.provides.add(tugraz_authenticated_user)
+        assert tiered_rate_limit() == (
+            config.CONFIG_TUGRAZ_RATELIMIT_TUGRAZ_AUTHENTICATED_USER
+        )
+        assert tiered_rate_limit_key() == "tugraz:1"
+
+
+def test_config_references(app: Flask) -> None:
+    """The config refers to the tiers without importing the limiter."""
+    assert import_string(config.RATELIMIT_KEY_FUNC) is tiered_rate_limit_key
+    with app.test_request_context(environ_base={"REMOTE_ADDR": "10.1.2.3"}):
+        assert config.RATELIMIT_APPLICATION() == tiered_rate_limit()
+
+
+@pytest.fixture
+def leasing_storage() -> object:
+    """Create leasing storages ("processes") sharing one fake Redis server."""
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = pytest.importorskip("redis")
+    server = fakeredis.FakeServer()
+
+    def factory(**options: float) -> LeasingRedisStorage:
+        pool = redis.ConnectionPool(
+            connection_class=fakeredis.FakeRedisConnection,
+            server=server,
+        )
+        storage = LeasingRedisStorage(
+            "tugraz+redis://localhost",
+            connection_pool=pool,
+            **options,
+        )
+        calls = {"lease": 0}
+        script = storage.lua_lease_sliding_window
+
+        def counted(*args: object, **kwargs: object) -> object:
+            calls["lease"] += 1
+            return script(*args, **kwargs)
+
+        storage.lua_lease_sliding_window = counted
+        storage.calls = calls
+        return storage
+
+    return factory
+
+
+def test_leasing_storage_round_trips(leasing_storage: object) -> None:
+    """Most hits are served from the lease, without a Redis round trip."""
+    hits, lease_size = 500, 20
+    storage = leasing_storage(lease_size=lease_size, lease_seconds=60)
+    limiter = SlidingWindowCounterRateLimiter(storage)
+    item = RateLimitItemPerMinute(5000)
+
+    assert all(limiter.hit(item, "user") for _ in range(hits))
+    assert storage.calls["lease"] == hits // lease_size
+
+    stats = limiter.get_window_stats(item, "user")
+    assert stats.remaining == item.amount - hits
+    assert storage.calls["lease"] == hits // lease_size
+
+
+def test_leasing_storage_budget(leasing_storage: object) -> None:
+    """Processes leasing tokens together stay within the limit."""
+    processes = [leasing_storage(lease_size=7, lease_share=0.2) for _ in range(3)]
+    limiters = [SlidingWindowCounterRateLimiter(storage) for storage in processes]
+    item = RateLimitItemPerMinute(50)
+
+    allowed = sum(limiters[i % 3].hit(item, "guest") for i in range(200))
+
+    assert allowed <= item.amount
+    assert not any(limiter.hit(item, "guest") for limiter in limiters)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests and benchmark of the pooled SMTP delivery."""
+
+import logging
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_mail import Mail, Message
+
+from invenio_config_tugraz.mail import PooledMail, init_mail_pool
+
+MESSAGES = 50
+
+
+def send_all(app: Flask) -> None:
+    """Send `MESSAGES` messages one by one."""
+    with app.app_context():
+        for i in range(MESSAGES):
+            app.extensions["mail"].send(
+                Message(
+                    subject=f"Welcome {i}",
+                    recipients=[f"user{i}@tugraz.at"],
+                    body="Welcome to the Repository of TU Graz!",
+                ),
+            )
+
+
+def mail_apps(
+    create_app: Callable[..., Flask],
+    smtp_server: SimpleNamespace,
+) -> tuple[Flask, Flask]:
+    """Return apps delivering to the SMTP stand-in plainly and pooled."""
+    config = {
+        "MAIL_SERVER": smtp_server.hostname,
+        "MAIL_PORT": smtp_server.port,
+        "MAIL_SUPPRESS_SEND": False,
+        "MAIL_DEFAULT_SENDER": "info@tugraz.at",
+    }
+
+    plain_app = create_app(**config, CONFIG_TUGRAZ_MAIL_POOL_SIZE=0)
+    Mail(plain_app)
+    init_mail_pool(plain_app)
+
+    pooled_app = create_app(**config, CONFIG_TUGRAZ_MAIL_POOL_SIZE=2)
+    Mail(pooled_app)
+    init_mail_pool(pooled_app)
+    return plain_app, pooled_app
+
+
+def test_pooled_delivery(
+    create_app: Callable[..., Flask],
+    smtp_server: SimpleNamespace,
+) -> None:
+    """Pooled delivery sends all messages over one connection, unlike plain delivery."""
+    plain_app, pooled_app = mail_apps(create_app, smtp_server)
+    assert not isinstance(plain_app.extensions["mail"], PooledMail)
+
+    send_all(plain_app)
+    send_all(pooled_app)
+
+    mail = pooled_app.extensions["mail"]
+    assert isinstance(mail, PooledMail)
+    assert len(smtp_server.handler.envelopes) == 2 * MESSAGES
+    metrics = mail.pool.metrics
+    assert metrics["messages_sent"] == MESSAGES
+    assert metrics["connections_opened"] == 1
+    assert metrics["throughput"] > 0
+    mail.pool.clear()
+
+
+@pytest.mark.benchmark
+def test_pooled_delivery_benchmark(
+    create_app: Callable[..., Flask],
+    smtp_server: SimpleNamespace,
+) -> None:
+    """Log the messages per second of plain and pooled delivery."""
+    plain_app, pooled_app = mail_apps(create_app, smtp_server)
+
+    def throughput(app: Flask) -> float:
+        start = time.perf_counter()
+        send_all(app)
+        return MESSAGES / (time.perf_counter() - start)
+
+    plain, pooled = throughput(plain_app), throughput(pooled_app)
+
+    mail = pooled_app.extensions["mail"]
+    logging.getLogger(__name__).info(
+        "plain: %.0f msg/s, pooled: %.0f msg/s (%.0f msg/s sending time)",
+        plain,
+        pooled,
+        mail.pool.metrics["throughput"],
+    )
+    mail.pool.clear()
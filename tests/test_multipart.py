@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the checksums of multipart uploads."""
+
+import hashlib
+import io
+import uuid
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_principal import Identity
+from invenio_db import InvenioDB, db
+from invenio_db.uow import ModelCommitOp
+from invenio_records_resources.services.files.components import (
+    FileMultipartContentComponent,
+)
+from invenio_records_resources.services.files.transfer import MULTIPART_TRANSFER_TYPE
+from invenio_records_resources.services.uow import TaskOp
+
+from invenio_config_tugraz.components import MultipartChecksumComponent
+from invenio_config_tugraz.models import MultipartChecksum
+from invenio_config_tugraz.multipart import (
+    HashingStream,
+    combined_checksum,
+    store_part_checksum,
+)
+
+PART_SIZE = 1024
+
+
+def test_combined_checksum(create_app: Callable[..., Flask]) -> None:
+    """The parts' checksums combine into the S3 style multipart checksum."""
+    app = create_app(SQLALCHEMY_DATABASE_URI="sqlite://")
+    InvenioDB(app, entry_point_group=False)
+    data = bytes(range(256)) * 10
+    parts = [data[i : i + PART_SIZE] for i in range(0, len(data), PART_SIZE)]
+    file_id = uuid.uuid4()
+
+    with app.app_context():
+        MultipartChecksum.__table__.create(db.engine)
+
+        # parts arrive in any order, a part may be uploaded twice
+        for number in [3, 1, 1]:
+            stream = HashingStream(io.BytesIO(parts[number - 1]))
+            while stream.read(100):
+                pass
+            store_part_checksum(file_id, number, stream.md5.hexdigest())
+        assert combined_checksum(file_id, len(parts), PART_SIZE) is None
+
+        store_part_checksum(file_id, 2, hashlib.md5(parts[1]).hexdigest())  # noqa: S324
+        digests = b"".join(hashlib.md5(part).digest() for part in parts)  # noqa: S324
+        assert combined_checksum(file_id, len(parts), PART_SIZE) == (
+            f"multipart:{hashlib.md5(digests).hexdigest()}-{len(parts)}-{PART_SIZE}"  # noqa: S324
+        )
+
+        # a single part's checksum is the file's
+        single_id = uuid.uuid4()
+        store_part_checksum(single_id, 1, hashlib.md5(data).hexdigest())  # noqa: S324
+        assert combined_checksum(single_id, 1, len(data)) == (
+            f"md5:{hashlib.md5(data).hexdigest()}"  # noqa: S324
+        )
+
+
+class TransferStandIn(dict):
+    """Stand-in of a file's transfer, with its metadata as items."""
+
+    transfer_type = MULTIPART_TRANSFER_TYPE
+
+
+@pytest.fixture
+def upload(
+    create_app: Callable[..., Flask],
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[SimpleNamespace]:
+    """Draft with a multipart upload of three parts, and its data."""
+    app = create_app(SQLALCHEMY_DATABASE_URI="sqlite://")
+    InvenioDB(app, entry_point_group=False)
+
+    # the parts are only read, instead of written to the storage
+    monkeypatch.setattr(
+        FileMultipartContentComponent,
+        "set_multipart_file_content",
+        lambda *args: args[5].read(),
+    )
+
+    data = bytes(range(256)) * 10
+    file_instance = SimpleNamespace(id=uuid.uuid4(), checksum=None)
+    file_record = SimpleNamespace(
+        transfer=TransferStandIn(
+            multipart_metadata={"parts": "3", "part_size": PART_SIZE},
+        ),
+        object_version=SimpleNamespace(file=file_instance),
+    )
+    with app.app_context():
+        MultipartChecksum.__table__.create(db.engine)
+        yield SimpleNamespace(
+            app=app,
+            data=data,
+            file=file_instance,
+            record=SimpleNamespace(files={"data.bin": file_record}),
+        )
+
+
+@pytest.mark.parametrize("full_checksum", [False, True])
+def test_component(
+    upload: SimpleNamespace,
+    full_checksum: bool,  # noqa: FBT001
+) -> None:
+    """The parts are hashed as they arrive, and combined at commit."""
+    upload.app.config["CONFIG_TUGRAZ_MULTIPART_FULL_CHECKSUM"] = full_checksum
+    operations = []
+    component = MultipartChecksumComponent(None)
+    component.uow = SimpleNamespace(register=operations.append)
+
+    parts = [
+        upload.data[i : i + PART_SIZE] for i in range(0, len(upload.data), PART_SIZE)
+    ]
+    for number, part in enumerate(parts, start=1):
+        component.set_multipart_file_content(
+            Identity(1),
+            "abcd-1234",
+            "data.bin",
+            number,
+            io.BytesIO(part),
+            len(part),
+            upload.record,
+        )
+    expected = combined_checksum(upload.file.id, len(parts), PART_SIZE)
+    assert expected.startswith("multipart:")
+
+    component.commit_file(Identity(1), "abcd-1234", "data.bin", upload.record)
+
+    assert upload.file.checksum == expected
+    assert combined_checksum(upload.file.id, len(parts), PART_SIZE) is None
+    assert [type(op) for op in operations] == (
+        [ModelCommitOp, TaskOp] if full_checksum else [ModelCommitOp]
+    )
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for notification digests."""
+
+from collections.abc import Callable
+from smtplib import SMTPDataError, SMTPRecipientsRefused
+from types import SimpleNamespace
+from typing import Self
+
+import pytest
+from flask import Flask
+from flask_mail import Mail
+
+from invenio_config_tugraz.notifications import tasks
+from invenio_config_tugraz.notifications.tasks import send_digests
+
+
+def entry(subject: str) -> dict:
+    """Build a rendered digest entry."""
+    return {
+        "subject": subject,
+        "plain_body": f"{subject} body",
+        "html_body": f"<p>{subject} body</p>",
+    }
+
+
+def test_send_digests(
+    create_app: Callable[..., Flask],
+    smtp_server: SimpleNamespace,
+) -> None:
+    """Digests are sent as one mail per recipient over one connection."""
+    app = create_app(
+        MAIL_SERVER=smtp_server.hostname,
+        MAIL_PORT=smtp_server.port,
+        MAIL_SUPPRESS_SEND=False,
+        MAIL_DEFAULT_SENDER="info@tugraz.at",
+        CONFIG_TUGRAZ_NOTIFICATIONS_DIGEST_SUBJECT="Summary",
+    )
+    Mail(app)
+
+    digests = {
+        "curator@tugraz.at": [entry("Review requested"), entry("Resubmitted")],
+        "owner@tugraz.at": [entry("Accepted")],
+    }
+    with app.app_context():
+        failed = send_digests(digests)
+
+    assert failed == {}
+    envelopes = {
+        e.rcpt_tos[0]: e.content.decode() for e in smtp_server.handler.envelopes
+    }
+    assert envelopes.keys() == digests.keys()
+    assert "Subject: Summary" in envelopes["curator@tugraz.at"]
+    assert "Resubmitted body" in envelopes["curator@tugraz.at"]
+    assert "Subject: Accepted" in envelopes["owner@tugraz.at"]
+
+
+def test_requeue_on_connection_failure(
+    create_app: Callable[..., Flask],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Popped digests are queued again if the SMTP connection can't be opened."""
+    app = create_app(MAIL_DEFAULT_SENDER="info@tugraz.at")
+    Mail(app)
+
+    def refuse() -> None:
+        raise ConnectionRefusedError
+
+    digests = {"owner@tugraz.at": [entry("Accepted")]}
+    requeued = []
+    monkeypatch.setattr(app.extensions["mail"], "connect", refuse)
+    monkeypatch.setattr(tasks, "pop_digests", lambda: digests)
+    monkeypatch.setattr(tasks, "requeue_digests", requeued.append)
+    with app.app_context():
+        tasks.send_notification_digests()
+
+    assert requeued == [digests]
+
+
+class ConnectionStandIn:
+    """Stand-in of an SMTP connection, raising the errors of recipients."""
+
+    def __init__(self, errors: dict[str, Exception]) -> None:
+        """Construct."""
+        self.errors = errors
+        self.sent = []
+
+    def __enter__(self) -> Self:
+        """Open."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close."""
+
+    def send(self, message: object) -> None:
+        """Send the message, or raise the error of its recipient."""
+        email = message.recipients[0]
+        if email in self.errors:
+            raise self.errors[email]
+        self.sent.append(email)
+
+
+def test_drop_permanent_failures(
+    create_app: Callable[..., Flask],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Digests refused with a 5xx reply are dropped, the others are retried."""
+    app = create_app(MAIL_DEFAULT_SENDER="info@tugraz.at")
+    Mail(app)
+
+    errors = {
+        "gone@tugraz.at": SMTPRecipientsRefused(
+            {"gone@tugraz.at": (550, b"no such user")},
+        ),
+        "spam@tugraz.at": SMTPDataError(554, b"rejected"),
+        "full@tugraz.at": SMTPRecipientsRefused(
+            {"full@tugraz.at": (452, b"mailbox full")},
+        ),
+        "busy@tugraz.at": SMTPDataError(421, b"try again later"),
+    }
+    connection = ConnectionStandIn(errors)
+    monkeypatch.setattr(app.extensions["mail"], "connect", lambda: connection)
+
+    digests = {email: [entry("Accepted")] for email in [*errors, "owner@tugraz.at"]}
+    with app.app_context():
+        failed = send_digests(digests)
+
+    assert failed.keys() == {"full@tugraz.at", "busy@tugraz.at"}
+    assert connection.sent == ["owner@tugraz.at"]
+
+
+def test_drop_after_max_attempts(
+    create_app: Callable[..., Flask],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A digest failing again and again is dropped, a delivered one forgiven."""
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = fakeredis.FakeStrictRedis()
+    monkeypatch.setattr(tasks, "get_redis", lambda: redis)
+    monkeypatch.setattr(tasks, "schedule_digests", lambda: None)
+
+    app = create_app(
+        MAIL_DEFAULT_SENDER="info@tugraz.at",
+        CONFIG_TUGRAZ_NOTIFICATIONS_DIGEST_MAX_ATTEMPTS=2,
+    )
+    Mail(app)
+    errors = {"busy@tugraz.at": SMTPDataError(421, b"try again later")}
+    connection = ConnectionStandIn(errors)
+    monkeypatch.setattr(app.extensions["mail"], "connect", lambda: connection)
+
+    with app.app_context():
+        for email in ["busy@tugraz.at", "owner@tugraz.at"]:
+            tasks.queue_digest_entry(email, entry("Accepted"))
+
+        errors["owner@tugraz.at"] = errors["busy@tugraz.at"]
+        tasks.send_notification_digests()
+        assert redis.hgetall(tasks.DIGEST_ATTEMPTS_KEY) == {
+            b"busy@tugraz.at": b"1",
+            b"owner@tugraz.at": b"1",
+        }
+
+        del errors["owner@tugraz.at"]
+        tasks.send_notification_digests()
+        assert connection.sent == ["owner@tugraz.at"]
+        assert redis.hgetall(tasks.DIGEST_ATTEMPTS_KEY) == {}
+        assert tasks.pop_digests() == {}
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the OAI-PMH fast path."""
+
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from invenio_oaiserver import InvenioOAIServer
+from invenio_oaiserver.response import NS_OAIPMH
+from invenio_oaiserver.views.server import blueprint
+from invenio_search.engine import dsl
+from lxml import etree
+
+from invenio_config_tugraz import oai
+from invenio_config_tugraz.oai import (
+    cache_metadata_formats,
+    init_oai_fast_path,
+    revision_key,
+)
+
+RECORDS = 5
+PAGE_SIZE = 2
+TOTAL_HITS_LIMIT = 10000
+"""Hits the search engine counts, unless told to track the total."""
+NAMESPACES = {"oai": NS_OAIPMH}
+
+FORMATS = {
+    "oai_dc": {
+        "serializer": "invenio_rdm_records.oai:dublincore_etree",
+        "namespace": "http://www.openarchives.org/OAI/2.0/oai_dc/",
+    },
+    "oai_datacite": {
+        "serializer": ("invenio_rdm_records.oai:oai_datacite_etree", {"a": 1}),
+        "namespace": "http://schema.datacite.org/oai/oai-1.1/",
+    },
+    "marcxml": {
+        "serializer": "invenio_rdm_records.oai:marcxml_etree",
+        "namespace": "https://www.loc.gov/standards/marcxml/",
+    },
+}
+
+
+def test_cache_metadata_formats() -> None:
+    """Only the given formats are cached, keeping their serializers' options."""
+    formats = cache_metadata_formats(FORMATS, ["oai_dc", "oai_datacite", "missing"])
+
+    assert formats["oai_dc"]["serializer"] == (
+        "invenio_config_tugraz.oai:cached_serializer",
+        {
+            "serializer": "invenio_rdm_records.oai:dublincore_etree",
+            "metadata_prefix": "oai_dc",
+        },
+    )
+    assert formats["oai_datacite"]["serializer"][1] == {
+        "a": 1,
+        "serializer": "invenio_rdm_records.oai:oai_datacite_etree",
+        "metadata_prefix": "oai_datacite",
+    }
+    assert formats["marcxml"] == FORMATS["marcxml"]
+    assert FORMATS["oai_dc"]["serializer"] == "invenio_rdm_records.oai:dublincore_etree"
+
+    assert cache_metadata_formats(formats, ["oai_dc"]) == formats
+
+
+def test_revision_key() -> None:
+    """Payloads are cached per record revision."""
+    assert revision_key({"uuid": "abcd", "version_id": 3}) == "abcd:3"
+    assert revision_key({"id": "abcd-1234"}) is None
+
+
+class HarvestStandIn:
+    """Stand-in of the search cluster, recording the searches of the pages."""
+
+    def __init__(self, total_hits_limit: int = TOTAL_HITS_LIMIT) -> None:
+        """Construct."""
+        self.total_hits_limit = total_hits_limit
+        self.searches = []
+        self.hits = [
+            {
+                "_id": f"id-{n}",
+                "_source": {"updated": f"2026-01-0{n + 1}T00:00:00"},
+                "sort": [n],
+            }
+            for n in range(RECORDS)
+        ]
+
+    def search_after_pages(
+        self,
+        search: dsl.Search,
+        size: int,
+        after: list | None = None,
+    ) -> Iterator[dict]:
+        """Yield the page after the cursor, counting the total like OpenSearch.
+
+        Without ``track_total_hits``, the total is capped at the limit.
+        """
+        self.searches.append((search.to_dict(), after))
+        start = after[0] + 1 if after else 0
+        hits = {"hits": self.hits[start : start + size]}
+        track_total_hits = search.to_dict().get("track_total_hits")
+        if track_total_hits is True:
+            hits["total"] = {"value": len(self.hits), "relation": "eq"}
+        elif track_total_hits is None:
+            total = min(len(self.hits), self.total_hits_limit)
+            relation = "eq" if total == len(self.hits) else "gte"
+            hits["total"] = {"value": total, "relation": relation}
+        yield {"hits": hits}
+
+
+@pytest.fixture
+def harvest(
+    create_app: Callable[..., Flask],
+    monkeypatch: pytest.MonkeyPatch,
+) -> tuple[Flask, HarvestStandIn]:
+    """App answering OAI-PMH harvests from the search stand-in."""
+    app = create_app(
+        SECRET_KEY="test-key",  # noqa: S106
+        SERVER_NAME="localhost",
+        OAISERVER_PAGE_SIZE=PAGE_SIZE,
+    )
+    InvenioOAIServer(app)
+    app.register_blueprint(blueprint)
+    init_oai_fast_path(app)
+
+    stand_in = HarvestStandIn()
+    monkeypatch.setattr(oai, "search_after_pages", stand_in.search_after_pages)
+    monkeypatch.setattr(oai, "oai_search", lambda: dsl.Search(index="records"))
+    monkeypatch.setattr(oai, "record_sets", lambda sources: [[] for _ in sources])
+    monkeypatch.setattr(
+        oai,
+        "current_oaiserver",
+        SimpleNamespace(
+            last_update_key="updated",
+            set_records_query_fetcher=lambda spec: dsl.Q("term", sets=spec),
+            oaiid_fetcher=lambda id_, _: SimpleNamespace(pid_value=f"oai:{id_}"),
+        ),
+    )
+    return app, stand_in
+
+
+def test_resumed_harvest(harvest: tuple[Flask, HarvestStandIn]) -> None:
+    """All pages of a harvest are filtered by its set and dates.
+
+    The harvest goes on past the search engine's limit of counted hits.
+    """
+    app, stand_in = harvest
+    stand_in.total_hits_limit = PAGE_SIZE + 1
+    identifiers = []
+    sizes = set()
+    params = {
+        "verb": "ListIdentifiers",
+        "metadataPrefix": "oai_dc",
+        "set": "openaire",
+        "from": "2026-01-01",
+    }
+
+    with app.test_client() as client:
+        while params:
+            response = client.get("/oai2d", query_string=params)
+            tree = etree.fromstring(response.data)
+            identifiers += tree.xpath("//oai:identifier/text()", namespaces=NAMESPACES)
+            sizes.update(
+                tree.xpath(
+                    "//oai:resumptionToken/@completeListSize",
+                    namespaces=NAMESPACES,
+                ),
+            )
+            token = tree.xpath("//oai:resumptionToken/text()", namespaces=NAMESPACES)
+            params = token and {"verb": "ListIdentifiers", "resumptionToken": token[0]}
+
+    assert identifiers == [f"oai:id-{n}" for n in range(RECORDS)]
+    assert sizes == {str(RECORDS)}
+    assert [after for _, after in stand_in.searches] == [None, [1], [3]]
+    for search, _ in stand_in.searches:
+        assert {"term": {"sets": "openaire"}} in search["query"]["bool"]["must"]
+        (date_range,) = search["query"]["bool"]["filter"]
+        assert "gte" in date_range["range"]["updated"]
@@ -11,9 +11,19 @@
 from collections.abc import Iterable
 
 from invenio_communities.permissions import CommunityPermissionPolicy
+from invenio_rdm_records.services.generators import (
+    AccessGrant,
+    RecordCommunitiesAction,
+    RecordOwners,
+)
 from invenio_rdm_records.services.permissions import RDMRecordPermissionPolicy
 from invenio_records_permissions.policies import BasePermissionPolicy
 
+from invenio_config_tugraz.permissions.generators import (
+    TUGrazAccessGrant,
+    TUGrazRecordCommunitiesAction,
+    TUGrazRecordOwners,
+)
 from invenio_config_tugraz.permissions.policies import (
     TUGrazCommunityPermissionPolicy,
     TUGrazRDMRecordPermissionPolicy,
@@ -39,6 +49,19 @@ ALLOWED_DIFFERENCES_RDM = {
 }
 
 
+UPSTREAM_TYPES = {
+    TUGrazAccessGrant: AccessGrant,
+    TUGrazRecordCommunitiesAction: RecordCommunitiesAction,
+    TUGrazRecordOwners: RecordOwners,
+}
+"""TU Graz's generators which only change how the needs are computed."""
+
+
+def upstream_type(generator: object) -> type:
+    """Return the generator's type, or the upstream one it specializes."""
+    return UPSTREAM_TYPES.get(type(generator), type(generator))
+
+
 def ensure_need_labels_synced(
     tugraz_policy: type[BasePermissionPolicy],
     invenio_policy: type[BasePermissionPolicy],
@@ -121,7 +144,9 @@ def ensure_policies_synced(
 
         # permission-Generators don't implement equality checks for their instances
         # we can however compare which types (classes) of Generators are used...
-        if {type(gen) for gen in tugraz_can} != {type(gen) for gen in invenio_can}:
+        if {upstream_type(gen) for gen in tugraz_can} != {
+            upstream_type(gen) for gen in invenio_can
+        }:
             msg = f"""
             permission-policy for `{can_name}` differs between TU-Graz and invenio
             if this is intentional, add to corresponding ALLOWED_DIFFERENCES_... in test-file
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the side effects run after the commit of records."""
+
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_principal import Identity
+from invenio_db import InvenioDB, db
+from invenio_records_resources.services.uow import Operation, UnitOfWork
+
+from invenio_config_tugraz import components, tasks
+from invenio_config_tugraz.components import PostCommitSideEffectsComponent
+
+RECID = "abcd-1234"
+DRAFT = SimpleNamespace(pid=SimpleNamespace(pid_value=RECID))
+
+
+class CacheStandIn(dict):
+    """Stand-in of the cache's `add` and `delete`."""
+
+    def add(self, key: str, value: object, timeout: int) -> bool:  # noqa: ARG002
+        """Set the key, unless it exists."""
+        if key in self:
+            return False
+        self[key] = value
+        return True
+
+    def delete(self, key: str) -> None:
+        """Delete the key."""
+        self.pop(key, None)
+
+
+class FailingCommitOp(Operation):
+    """Operation failing the commit."""
+
+    def on_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Fail."""
+        msg = "commit failed"
+        raise RuntimeError(msg)
+
+
+@pytest.fixture
+def side_effects(
+    create_app: Callable[..., Flask],
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[SimpleNamespace]:
+    """Queued tasks and run side effects, with a database session."""
+    recorded = SimpleNamespace(queued=[], ran=[])
+    app = create_app(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        CONFIG_TUGRAZ_POST_COMMIT_SIDE_EFFECTS=[recorded.ran.append],
+        CONFIG_TUGRAZ_POST_COMMIT_WINDOW=10,
+    )
+    InvenioDB(app, entry_point_group=False)
+
+    cache = CacheStandIn()
+    monkeypatch.setattr(components, "current_cache", cache)
+    monkeypatch.setattr(tasks, "current_cache", cache)
+    monkeypatch.setattr(
+        components,
+        "run_post_commit_side_effects",
+        SimpleNamespace(
+            apply_async=lambda args, **_: recorded.queued.append(args),
+        ),
+    )
+
+    with app.app_context():
+        yield recorded
+
+
+def update_draft(uow: UnitOfWork) -> None:
+    """Run the component on a draft update."""
+    component = PostCommitSideEffectsComponent(None)
+    component.uow = uow
+    component.update_draft(Identity(1), record=DRAFT)
+
+
+def test_queued_after_commit(side_effects: SimpleNamespace) -> None:
+    """The task is queued once the transaction has been committed."""
+    with UnitOfWork(db.session) as uow:
+        update_draft(uow)
+        assert side_effects.queued == []
+        uow.commit()
+
+    assert side_effects.queued == [[RECID]]
+
+
+def test_deduplicated(side_effects: SimpleNamespace) -> None:
+    """Commits don't queue another task while one is waiting."""
+    for _ in range(3):
+        with UnitOfWork(db.session) as uow:
+            update_draft(uow)
+            uow.commit()
+    assert side_effects.queued == [[RECID]]
+
+    tasks.run_post_commit_side_effects(RECID)
+    assert side_effects.ran == [RECID]
+
+    with UnitOfWork(db.session) as uow:
+        update_draft(uow)
+        uow.commit()
+    assert side_effects.queued == [[RECID], [RECID]]
+
+
+def test_not_queued_on_rollback(side_effects: SimpleNamespace) -> None:
+    """Nothing is queued when the transaction is rolled back."""
+    msg = "publish failed"
+
+    def fail() -> None:
+        with UnitOfWork(db.session) as uow:
+            update_draft(uow)
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match=msg):
+        fail()
+
+    with UnitOfWork(db.session) as uow:
+        update_draft(uow)
+        uow.rollback()
+
+    assert side_effects.queued == []
+
+
+def test_not_queued_on_failed_commit(side_effects: SimpleNamespace) -> None:
+    """Nothing is queued when the commit fails."""
+
+    def commit() -> None:
+        with UnitOfWork(db.session) as uow:
+            update_draft(uow)
+            uow.register(FailingCommitOp())
+            uow.commit()
+
+    with pytest.raises(RuntimeError, match="commit failed"):
+        commit()
+
+    assert side_effects.queued == []
+    assert side_effects.ran == []
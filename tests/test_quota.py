@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the upload usage counters."""
+
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_principal import Identity
+from invenio_db import InvenioDB, db
+from invenio_files_rest.errors import FileSizeError
+from invenio_records_resources.services.errors import FilesCountExceededException
+
+from invenio_config_tugraz import quota
+from invenio_config_tugraz.components import (
+    UploadUsageComponent,
+    UploadUsageRecordComponent,
+)
+from invenio_config_tugraz.models import UploadUsage
+from invenio_config_tugraz.quota import (
+    DRAFT,
+    USER,
+    Usage,
+    check_quota,
+    get_usage,
+    increment_usage,
+    reconcile_usage,
+)
+
+GB = 10**9
+
+
+def test_usage_counters(create_app: Callable[..., Flask]) -> None:
+    """Commits and deletes are added up, per draft and per user."""
+    app = create_app(SQLALCHEMY_DATABASE_URI="sqlite://")
+    InvenioDB(app, entry_point_group=False)
+
+    with app.app_context():
+        UploadUsage.__table__.create(db.engine)
+        owners = [(DRAFT, "abcd"), (USER, "1")]
+
+        increment_usage(owners, 1, 2 * GB)
+        increment_usage(owners, 1, 3 * GB)
+        increment_usage([(DRAFT, "efgh"), (USER, "1")], 1, GB)
+        increment_usage(owners, -1, -2 * GB)
+
+        assert get_usage(DRAFT, "abcd") == Usage(files=1, bytes=3 * GB)
+        assert get_usage(USER, "1") == Usage(files=2, bytes=4 * GB)
+        assert get_usage(USER, "2") == Usage()
+
+
+@pytest.fixture
+def usage_db(create_app: Callable[..., Flask]) -> Iterator[Flask]:
+    """Usage table, with a draft quota of 3 files and 10 GB."""
+    app = create_app(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        APP_RDM_DEPOSIT_FORM_QUOTA={"maxFiles": 3, "maxStorage": 10 * GB},
+        CONFIG_TUGRAZ_UPLOAD_USER_QUOTA=15 * GB,
+    )
+    InvenioDB(app, entry_point_group=False)
+
+    with app.app_context():
+        UploadUsage.__table__.create(db.engine)
+        yield app
+
+
+def file_record(size: int, *, has_content: bool = True) -> SimpleNamespace:
+    """Return a stand-in of a draft's file."""
+    return SimpleNamespace(
+        key=f"{size}.bin",
+        has_content=has_content,
+        object_version=SimpleNamespace(file=SimpleNamespace(size=size)),
+    )
+
+
+def draft(id_: str, owner: int | None = 1, **files: SimpleNamespace) -> object:
+    """Return a stand-in of a draft of the owner."""
+    owned_by = SimpleNamespace(owner_id=owner) if owner is not None else None
+    return SimpleNamespace(
+        id=id_,
+        parent=SimpleNamespace(access=SimpleNamespace(owned_by=owned_by)),
+        files=files,
+    )
+
+
+@pytest.mark.usefixtures("usage_db")
+def test_check_quota() -> None:
+    """The files and bytes of the draft, and the bytes of its owner are limited."""
+    increment_usage([(DRAFT, "abcd"), (USER, "1")], 2, 6 * GB)
+    increment_usage([(DRAFT, "efgh"), (USER, "1")], 1, 6 * GB)
+
+    check_quota(draft("abcd"), 1, 3 * GB)
+    check_quota(draft("ijkl", owner=None), 3, 10 * GB)
+
+    with pytest.raises(FilesCountExceededException):
+        check_quota(draft("abcd"), 2, GB)
+    with pytest.raises(FileSizeError, match="Draft quota"):
+        check_quota(draft("abcd"), 1, 5 * GB)
+    with pytest.raises(FileSizeError, match="User quota"):
+        check_quota(draft("abcd"), 1, 4 * GB)
+
+
+@pytest.mark.usefixtures("usage_db")
+def test_usage_component() -> None:
+    """Committed files are added, deleted ones subtracted, beyond the quota is denied."""
+    component = UploadUsageComponent(None)
+    identity = Identity(1)
+    files = {"a": file_record(GB), "b": file_record(2 * GB), "c": file_record(4 * GB)}
+    record = draft("abcd", **files, pending=file_record(0, has_content=False))
+
+    for key in [*files, "pending"]:
+        component.commit_file(identity, "abcd", key, record)
+    assert get_usage(DRAFT, "abcd") == Usage(files=3, bytes=7 * GB)
+    assert get_usage(USER, "1") == Usage(files=3, bytes=7 * GB)
+
+    with pytest.raises(FilesCountExceededException):
+        component.init_files(identity, "abcd", record, [{"key": "d", "size": GB}])
+
+    component.delete_file(identity, "abcd", "a", record, files["a"])
+    component.delete_all_files(identity, "abcd", record, [files["b"], files["c"]])
+    assert get_usage(DRAFT, "abcd") == Usage()
+    assert get_usage(USER, "1") == Usage()
+
+
+@pytest.mark.parametrize("method", ["publish", "delete_draft"])
+@pytest.mark.usefixtures("usage_db")
+def test_release_usage(method: str) -> None:
+    """Published and discarded drafts no longer count for their owner."""
+    increment_usage([(DRAFT, "abcd"), (USER, "1")], 2, 3 * GB)
+    increment_usage([(DRAFT, "efgh"), (USER, "1")], 1, GB)
+
+    component = UploadUsageRecordComponent(None)
+    getattr(component, method)(Identity(1), draft=draft("abcd"), record=None)
+
+    assert db.session.get(UploadUsage, (DRAFT, "abcd")) is None
+    assert get_usage(DRAFT, "efgh") == Usage(files=1, bytes=GB)
+    assert get_usage(USER, "1") == Usage(files=1, bytes=GB)
+
+
+@pytest.mark.usefixtures("usage_db")
+def test_reconcile_usage(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Drifted counters are reported, and with `fix` set to the actual usage."""
+    increment_usage([(DRAFT, "abcd"), (USER, "1")], 2, 3 * GB)
+    increment_usage([(DRAFT, "gone")], 1, GB)
+    actual = {
+        (DRAFT, "abcd"): Usage(2, 3 * GB),
+        (USER, "1"): Usage(3, 5 * GB),
+        (DRAFT, "new"): Usage(1, 2 * GB),
+    }
+    monkeypatch.setattr(quota, "actual_usage", lambda: actual)
+
+    drifts = {
+        (USER, "1"): (Usage(2, 3 * GB), Usage(3, 5 * GB)),
+        (DRAFT, "gone"): (Usage(1, GB), Usage()),
+        (DRAFT, "new"): (Usage(), Usage(1, 2 * GB)),
+    }
+    assert reconcile_usage() == drifts
+    assert get_usage(USER, "1") == Usage(2, 3 * GB)
+
+    assert reconcile_usage(fix=True) == drifts
+    assert {
+        (row.owner_type, row.owner_id): Usage(row.files, row.bytes)
+        for row in UploadUsage.query
+    } == actual
+    assert reconcile_usage() == {}
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests and benchmark of the request type dispatch of permissions."""
+
+import logging
+import time
+from types import SimpleNamespace
+
+import pytest
+from flask_principal import Need
+from invenio_curations.requests.curation import CurationRequest
+from invenio_curations.services.generators import IfRequestTypes
+from invenio_rdm_records.requests import (
+    CommunityInclusion,
+    CommunitySubmission,
+    GuestAccessRequest,
+)
+from invenio_rdm_records.services.generators import IfRequestType
+from invenio_rdm_records.services.permissions import RDMRequestsPermissionPolicy
+from invenio_records_permissions.generators import Generator
+from invenio_requests.services.generators import Creator, Receiver
+
+from invenio_config_tugraz.permissions.generators import (
+    RequestTypeDispatch,
+    TUGrazIfCurationRequestBasedExists,
+    TUGrazTopicPermission,
+    flatten_request_type_conditions,
+)
+from invenio_config_tugraz.permissions.policies import (
+    TUGrazRDMRequestsPermissionPolicy,
+)
+
+HITS = 500
+ROUNDS = 20
+REQUEST_TYPES = [CurationRequest, CommunitySubmission, CommunityInclusion]
+
+
+class LabelNeed(Generator):
+    """Generator of a fixed need."""
+
+    def __init__(self, label: str) -> None:
+        """Construct."""
+        self.label = label
+        super().__init__()
+
+    def needs(self, **__: dict) -> list[Need]:
+        """Return the need of the label."""
+        return [Need("label", self.label)]
+
+
+def dispatched(generators: list[Generator], request_type: type) -> list[Generator]:
+    """Return the dispatched generators of a policy action."""
+    (dispatch,) = generators
+    assert isinstance(dispatch, RequestTypeDispatch)
+    return dispatch.generators_for(request_type)
+
+
+def test_policy_dispatch() -> None:
+    """The request type conditions of the policy are resolved per type."""
+    policy = TUGrazRDMRequestsPermissionPolicy
+
+    read = dispatched(policy.can_read, CurationRequest)
+    assert [type(g) for g in read[:3]] == [Creator, Receiver, TUGrazTopicPermission]
+    assert dispatched(policy.can_read, CommunitySubmission) == (
+        flatten_request_type_conditions(
+            RDMRequestsPermissionPolicy.can_read,
+            CommunitySubmission,
+        )
+    )
+
+    accept = dispatched(policy.can_action_accept, CommunitySubmission)
+    assert [type(g) for g in accept] == [TUGrazIfCurationRequestBasedExists]
+
+    submit = dispatched(policy.can_action_submit, CurationRequest)
+    assert isinstance(submit[-1], TUGrazTopicPermission)
+    assert not any(
+        isinstance(g, TUGrazTopicPermission)
+        for g in dispatched(policy.can_action_submit, CommunityInclusion)
+    )
+
+    for action in (policy.can_read, policy.can_action_accept, policy.can_action_submit):
+        for request_type in [*REQUEST_TYPES, GuestAccessRequest, None]:
+            assert not any(
+                isinstance(g, IfRequestTypes | IfRequestType)
+                for g in dispatched(action, request_type)
+            )
+
+
+def evaluate(generators: list[Generator], hits: list) -> list[set[Need]]:
+    """Return the needs of each hit."""
+    return [
+        set().union(*(g.needs(request=hit, record=None) for g in generators))
+        for hit in hits
+    ]
+
+
+def mixed_generators() -> list[Generator]:
+    """Return nested request type conditions, as in the policies."""
+    base = [LabelNeed(f"base-{i}") for i in range(4)] + [
+        IfRequestType(GuestAccessRequest, then_=[LabelNeed("guest")], else_=[]),
+    ]
+    return [
+        IfRequestTypes(
+            [CurationRequest],
+            then_=[LabelNeed("creator"), LabelNeed("receiver"), LabelNeed("topic")],
+            else_=[
+                IfRequestTypes(
+                    [CommunitySubmission],
+                    then_=[
+                        IfRequestTypes(
+                            [CommunityInclusion],
+                            then_=[],
+                            else_=[LabelNeed("curation"), *base],
+                        ),
+                    ],
+                    else_=base,
+                ),
+            ],
+        ),
+        IfRequestTypes([CurationRequest], then_=[LabelNeed("review")], else_=[]),
+    ]
+
+
+def mixed_hits() -> list[SimpleNamespace]:
+    """Return a search result of mixed request types."""
+    return [
+        SimpleNamespace(type=REQUEST_TYPES[i % len(REQUEST_TYPES)]())
+        for i in range(HITS)
+    ]
+
+
+def test_dispatch() -> None:
+    """A search result of mixed request types gets the same needs."""
+    generators, hits = mixed_generators(), mixed_hits()
+
+    expected = evaluate(generators, hits)
+    needs = evaluate([RequestTypeDispatch(generators)], hits)
+
+    assert needs == expected
+    assert Need("label", "review") in needs[0]
+    assert Need("label", "curation") in needs[1]
+
+
+@pytest.mark.benchmark
+def test_dispatch_benchmark() -> None:
+    """Log the time of evaluating a page of hits, with and without dispatch."""
+    generators, hits = mixed_generators(), mixed_hits()
+
+    def seconds(generators: list[Generator]) -> float:
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            evaluate(generators, hits)
+        return (time.perf_counter() - start) / ROUNDS
+
+    conditions = seconds(generators)
+    dispatch = seconds([RequestTypeDispatch(generators)])
+
+    logging.getLogger(__name__).info(
+        "%s hits: conditions %.0fµs, dispatch %.0fµs per page",
+        HITS,
+        conditions * 1e6,
+        dispatch * 1e6,
+    )
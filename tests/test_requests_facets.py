@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the cache of the requests facets."""
+
+from collections.abc import Callable
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_principal import Identity
+from invenio_cache import InvenioCache
+from invenio_requests.customizations import CommentEventType, LogEventType
+from invenio_search.engine import dsl
+
+from invenio_config_tugraz.requests.components import (
+    RequestFacetsInvalidationComponent,
+)
+from invenio_config_tugraz.requests.facets import (
+    cached_facets_response_cls,
+    facets_cache_key,
+    invalidate_facets,
+    with_cached_facets,
+)
+
+SUBMITTED = 3
+AGGREGATIONS = {
+    "status": {"buckets": [{"key": "submitted", "doc_count": SUBMITTED}]},
+}
+
+
+def search() -> dsl.Search:
+    """Return a requests search of one user."""
+    search = dsl.Search().filter("term", **{"created_by.user": "1"})
+    search.aggs.bucket("status", "terms", field="status")
+    return search
+
+
+def test_facets_cache_key(create_app: Callable[..., Flask]) -> None:
+    """Only the query and the aggregations make up the key."""
+    app = create_app(CACHE_TYPE="SimpleCache")
+    InvenioCache(app)
+
+    with app.app_context():
+        key = facets_cache_key(search().to_dict())
+        paged = search().post_filter("term", type="x").sort("-created")[10:20]
+
+        assert facets_cache_key(paged.to_dict()) == key
+        assert facets_cache_key(search().query("match", title="x").to_dict()) != key
+        assert facets_cache_key(dsl.Search().to_dict()) is None
+
+        invalidate_facets()
+        assert facets_cache_key(search().to_dict()) != key
+
+
+def test_with_cached_facets(create_app: Callable[..., Flask]) -> None:
+    """Repeat searches go without aggregations, and get the cached ones."""
+    app = create_app(CACHE_TYPE="SimpleCache")
+    InvenioCache(app)
+
+    with app.app_context():
+        key = facets_cache_key(search().to_dict())
+        first = with_cached_facets(search())
+        assert "aggs" in first.to_dict()
+
+        response_cls = cached_facets_response_cls(search(), key, None)
+        response_cls(first, {"hits": {"hits": []}, "aggregations": AGGREGATIONS})
+
+        repeat = with_cached_facets(search())
+        assert "aggs" not in repeat.to_dict()
+
+        response_cls = cached_facets_response_cls(search(), key, AGGREGATIONS)
+        response = response_cls(repeat, {"hits": {"hits": []}})
+        assert response.aggregations.status.buckets[0].doc_count == SUBMITTED
+
+
+@pytest.mark.parametrize(
+    ("event_type", "invalidated"),
+    [(LogEventType, True), (CommentEventType, False)],
+)
+def test_invalidation_component(
+    create_app: Callable[..., Flask],
+    event_type: type,
+    invalidated: bool,  # noqa: FBT001
+) -> None:
+    """Events logging a transition invalidate the facets after the commit."""
+    app = create_app(CACHE_TYPE="SimpleCache")
+    InvenioCache(app)
+
+    with app.app_context():
+        key = facets_cache_key(search().to_dict())
+
+        operations = []
+        component = RequestFacetsInvalidationComponent(None)
+        component.uow = SimpleNamespace(register=operations.append)
+        component.create(Identity(1), event=SimpleNamespace(type=event_type))
+        for operation in operations:
+            operation.on_post_commit(None)
+
+        assert (facets_cache_key(search().to_dict()) != key) is invalidated
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the request scoped SQL query tracker."""
+
+import logging
+
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from invenio_config_tugraz.sql_tracker import QueryTracker, init_sql_tracker
+
+
+@pytest.fixture
+def engine() -> object:
+    """In-memory database."""
+    return create_engine("sqlite://")
+
+
+def test_query_tracker_repeated(engine: object) -> None:
+    """Repeated statements are reported as N+1 suspects."""
+    repeats = 5
+    with QueryTracker() as tracker, engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        for i in range(repeats):
+            connection.execute(text("SELECT :i"), {"i": i})
+
+    assert tracker.count == repeats + 1
+    assert tracker.repeated(repeats - 1) == {"SELECT ?": repeats}
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    assert tracker.count == repeats + 1
+
+
+def test_failed_statements(engine: object) -> None:
+    """Failed statements don't leave their start time behind."""
+    with QueryTracker() as tracker, engine.connect() as connection:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing"))
+        connection.execute(text("SELECT 1"))
+
+        assert connection.info["tugraz_query_start"] == []
+    assert tracker.count == 1
+
+
+def test_request_tracker(engine: object, caplog: pytest.LogCaptureFixture) -> None:
+    """Responses carry the db time and offending requests are logged."""
+    app = Flask("testapp")
+    app.config.update(
+        CONFIG_TUGRAZ_SQL_TRACKER=True,
+        CONFIG_TUGRAZ_SQL_TRACKER_QUERY_BUDGET=3,
+        CONFIG_TUGRAZ_SQL_TRACKER_REPEAT_THRESHOLD=2,
+    )
+    init_sql_tracker(app)
+
+    @app.route("/records")
+    def records() -> str:
+        with engine.connect() as connection:
+            for i in range(4):
+                connection.execute(text("SELECT :i"), {"i": i})
+        return "ok"
+
+    with caplog.at_level(logging.WARNING):
+        response = app.test_client().get("/records")
+
+    assert 'desc="4 queries"' in response.headers["Server-Timing"]
+    assert "records ran 4 queries (budget 3)" in caplog.text
+    assert "records repeated a statement 4 times" in caplog.text
+
+
+def test_query_budget(engine: object, query_budget: object) -> None:
+    """The pytest fixture fails tests exceeding their budget."""
+    with query_budget(max_queries=2), engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    def exceed_budget() -> None:
+        with query_budget(max_queries=2), engine.connect() as connection:
+            for _ in range(3):
+                connection.execute(text("SELECT 1"))
+
+    with pytest.raises(pytest.fail.Exception, match="3 queries, budget is 2"):
+        exceed_budget()
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the compaction and pagination of request timelines."""
+
+from types import SimpleNamespace
+from typing import Self
+
+import pytest
+from flask_principal import Identity
+from invenio_curations.services.events import CurationCommentEventType
+from invenio_requests.customizations import LogEventType
+
+from invenio_config_tugraz.requests import timeline
+from invenio_config_tugraz.requests.components import (
+    CompactTimelineOp,
+    CurationTimelineComponent,
+)
+from invenio_config_tugraz.requests.timeline import (
+    SEPARATOR,
+    SYSTEM_CREATOR,
+    automatic_comment_runs,
+    compact_timeline,
+    decode_cursor,
+    encode_cursor,
+)
+
+REQUEST_ID = "0f6c3a1e-5b7d-4e2a-9c8f-1d2e3f4a5b6c"
+
+
+def event(
+    id_: str,
+    *,
+    type_: str = "C",
+    creator: dict = SYSTEM_CREATOR,
+    **kwargs: dict,
+) -> dict:
+    """Return the summary of an event."""
+    return {
+        "id": id_,
+        "type": type_,
+        "created_by": creator,
+        "payload": kwargs.get("payload", {"content": id_}),
+        "replied": kwargs.get("replied", False),
+    }
+
+
+def test_automatic_comment_runs() -> None:
+    """Only runs of consecutive automatic comments are folded."""
+    events = [
+        event("a"),
+        event("b"),
+        event("accepted", type_="L"),
+        event("c"),
+        event("user", creator={"user": "7"}),
+        event("d"),
+        event("e", payload={"content": "e", "reference_draft": "{}"}),
+        event("f", replied=True),
+        event("g"),
+        event("h"),
+        event("i"),
+    ]
+
+    runs = automatic_comment_runs(events)
+
+    assert [[e["id"] for e in run] for run in runs] == [["a", "b"], ["g", "h", "i"]]
+
+
+def test_cursor() -> None:
+    """Cursors carry the sort values of the last hit."""
+    sort = [1767225600000, "5f3e0b9a-0d7e-4b1c-9a52-3c8e2f1d6a70"]
+    assert decode_cursor(encode_cursor(sort)) == sort
+
+
+class EventStandIn(dict):
+    """Stand-in of a request event in the database."""
+
+    def __init__(
+        self,
+        id_: str,
+        *,
+        type_: type = CurationCommentEventType,
+        creator: dict = SYSTEM_CREATOR,
+        parent_id: str | None = None,
+    ) -> None:
+        """Construct, with its id as content."""
+        super().__init__(created_by=creator, payload={"content": id_})
+        self.id = id_
+        self.type = type_
+        self.parent_id = parent_id
+        self.request_id = REQUEST_ID
+
+
+class UnitOfWorkStandIn:
+    """Stand-in of the unit of work, recording the operations."""
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.operations = []
+        self.committed = False
+
+    def __enter__(self) -> Self:
+        """Start."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """End."""
+
+    def register(self, op: tuple) -> None:
+        """Record the operation."""
+        self.operations.append(op)
+
+    def commit(self) -> None:
+        """Commit."""
+        self.committed = True
+
+
+@pytest.fixture
+def uow(monkeypatch: pytest.MonkeyPatch) -> UnitOfWorkStandIn:
+    """Record the operations of the compaction as tuples."""
+    uow = UnitOfWorkStandIn()
+    monkeypatch.setattr(timeline, "UnitOfWork", lambda: uow)
+    monkeypatch.setattr(
+        timeline,
+        "RecordCommitOp",
+        lambda record, **_: ("commit", record.id, record["payload"]["content"]),
+    )
+    monkeypatch.setattr(
+        timeline,
+        "RecordDeleteOp",
+        lambda record, *_, **__: ("delete", record.id),
+    )
+    monkeypatch.setattr(
+        timeline,
+        "RecordIndexOp",
+        lambda request, **_: ("index", request),
+    )
+    monkeypatch.setattr(
+        timeline,
+        "Request",
+        SimpleNamespace(get_record=lambda id_: f"request {id_}"),
+    )
+    for service in ("current_events_service", "current_requests_service"):
+        monkeypatch.setattr(timeline, service, SimpleNamespace(indexer=None))
+    return uow
+
+
+def test_compact_timeline(
+    uow: UnitOfWorkStandIn,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Runs are folded into their first comment, the others deleted."""
+    events = [
+        EventStandIn("a"),
+        EventStandIn("b"),
+        EventStandIn("c"),
+        EventStandIn("accepted", type_=LogEventType),
+        EventStandIn("d"),
+        EventStandIn("reply", creator={"user": "7"}, parent_id="d"),
+        EventStandIn("e"),
+    ]
+    monkeypatch.setattr(timeline, "timeline_events", lambda _: events)
+
+    folded = compact_timeline(REQUEST_ID)
+
+    assert uow.operations == [
+        ("commit", "a", SEPARATOR.join(["a", "b", "c"])),
+        ("delete", "b"),
+        ("delete", "c"),
+        ("index", f"request {REQUEST_ID}"),
+    ]
+    assert uow.committed
+    assert folded == len([op for op in uow.operations if op[0] == "delete"])
+
+
+def test_compact_timeline_nothing_to_fold(
+    uow: UnitOfWorkStandIn,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without runs, nothing is written."""
+    events = [EventStandIn("a"), EventStandIn("user", creator={"user": "7"})]
+    monkeypatch.setattr(timeline, "timeline_events", lambda _: events)
+
+    assert compact_timeline(REQUEST_ID) == 0
+    assert uow.operations == []
+    assert not uow.committed
+
+
+@pytest.mark.parametrize(
+    ("creator", "queued"),
+    [(SYSTEM_CREATOR, True), ({"user": "7"}, False)],
+)
+def test_component(creator: dict, queued: bool) -> None:  # noqa: FBT001
+    """Automatic comments queue the compaction of their timeline."""
+    operations = []
+    component = CurationTimelineComponent(None)
+    component.uow = SimpleNamespace(register=operations.append)
+    component.create(Identity(1), event=EventStandIn("a", creator=creator))
+
+    assert [type(op) for op in operations] == ([CompactTimelineOp] if queued else [])
+    assert [op.request_id for op in operations] == ([REQUEST_ID] if queued else [])
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-config-tugraz is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Tests for the Redis snapshots of request timelines."""
+
+import json
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_principal import Identity, RoleNeed
+
+from invenio_config_tugraz.requests import snapshot
+from invenio_config_tugraz.requests.components import TimelineSnapshotComponent
+from invenio_config_tugraz.requests.snapshot import (
+    load_snapshot,
+    snapshot_keys,
+    timeline_snapshot,
+)
+from invenio_config_tugraz.requests.timeline import SYSTEM_CREATOR
+
+REQUEST = SimpleNamespace(id="0f6c3a1e-5b7d-4e2a-9c8f-1d2e3f4a5b6c")
+TOP_LEVEL = ["a", "b", "system"]
+
+
+class Timeline:
+    """Stand-in of a request's events in the database, counting serializations."""
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.events = {}
+        self.serialized = []
+
+    def add(
+        self,
+        id_: str,
+        creator: dict,
+        parent_id: str | None = None,
+    ) -> SimpleNamespace:
+        """Add an event to the database."""
+        event = SimpleNamespace(
+            id=id_,
+            request_id=REQUEST.id,
+            parent_id=parent_id,
+            type="C",
+            created_by=creator,
+        )
+        self.events[id_] = event
+        return event
+
+    def serialize(self, event: SimpleNamespace, _: object) -> str:
+        """Serialize the event."""
+        self.serialized.append(event.id)
+        return json.dumps(
+            {"id": event.id, "type": event.type, "created_by": event.created_by},
+        )
+
+
+def user(user_id: int, *needs: object) -> Identity:
+    """Return the identity of a user, providing the needs."""
+    identity = Identity(user_id)
+    identity.provides |= set(needs)
+    return identity
+
+
+def ids(entries: list[dict]) -> list[str]:
+    """Return the ids of the entries."""
+    return [entry["id"] for entry in entries]
+
+
+@pytest.fixture
+def timeline(
+    create_app: Callable[..., Flask],
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[Timeline]:
+    """Timeline of events by users 1 and 2, with a reply and a system comment."""
+    fakeredis = pytest.importorskip("fakeredis")
+    app = create_app(CONFIG_TUGRAZ_REQUESTS_TIMELINE_SNAPSHOT_TIMEOUT=60)
+
+    timeline = Timeline()
+    timeline.add("a", {"user": "1"})
+    timeline.add("b", {"user": "2"})
+    timeline.add("reply", {"user": "1"}, parent_id="b")
+    timeline.add("system", SYSTEM_CREATOR)
+
+    redis = fakeredis.FakeStrictRedis()
+    monkeypatch.setattr(snapshot, "get_redis", lambda: redis)
+    monkeypatch.setattr(snapshot, "serialize_event", timeline.serialize)
+    monkeypatch.setattr(snapshot, "_event_count", lambda _: len(timeline.events))
+    monkeypatch.setattr(
+        snapshot,
+        "timeline_events",
+        lambda _: list(timeline.events.values()),
+    )
+    monkeypatch.setattr(
+        snapshot,
+        "Request",
+        SimpleNamespace(get_record=lambda _: REQUEST),
+    )
+    monkeypatch.setattr(
+        snapshot,
+        "RequestEvent",
+        SimpleNamespace(get_record=timeline.events.__getitem__),
+    )
+    monkeypatch.setattr(
+        snapshot,
+        "current_events_service",
+        SimpleNamespace(require_permission=lambda *_, **__: None),
+    )
+    monkeypatch.setattr(
+        snapshot,
+        "current_curations_service",
+        SimpleNamespace(privileged_roles=["curator"]),
+    )
+    monkeypatch.setattr(
+        snapshot,
+        "is_identity_privileged",
+        lambda roles, identity: any(RoleNeed(r) in identity.provides for r in roles),
+    )
+    monkeypatch.setattr(
+        snapshot,
+        "event_permissions",
+        lambda identity, _, event: {
+            "can_update_comment": event.created_by == {"user": str(identity.id)},
+        },
+    )
+
+    with app.app_context():
+        timeline.redis = redis
+        yield timeline
+
+
+def run_component(method: str, event: SimpleNamespace) -> None:
+    """Run a method of the component, then commit its operations."""
+    operations = []
+    component = TimelineSnapshotComponent(None)
+    component.uow = SimpleNamespace(register=operations.append)
+    getattr(component, method)(user(1), event=event)
+    for operation in operations:
+        operation.on_post_commit(None)
+
+
+def test_cold_rebuild(timeline: Timeline) -> None:
+    """The top-level events are serialized once, then read from Redis."""
+    assert ids(load_snapshot(REQUEST)) == TOP_LEVEL
+    assert ids(load_snapshot(REQUEST)) == TOP_LEVEL
+    assert timeline.serialized == TOP_LEVEL
+
+
+def test_append_on_create_comment(timeline: Timeline) -> None:
+    """New comments are appended to the snapshot, serializing only them."""
+    load_snapshot(REQUEST)
+
+    run_component("create", timeline.add("c", {"user": "2"}))
+
+    assert ids(load_snapshot(REQUEST)) == [*TOP_LEVEL, "c"]
+    assert timeline.serialized == [*TOP_LEVEL, "c"]
+
+
+def test_append_without_snapshot(timeline: Timeline) -> None:
+    """Without a snapshot, new comments don't start one."""
+    run_component("create", timeline.add("c", {"user": "2"}))
+
+    assert not timeline.redis.exists(*snapshot_keys(REQUEST.id))
+    assert timeline.serialized == []
+
+
+@pytest.mark.parametrize("method", ["update_comment", "delete_comment"])
+def test_invalidation(timeline: Timeline, method: str) -> None:
+    """Updated and deleted comments drop the snapshot."""
+    load_snapshot(REQUEST)
+
+    run_component(method, timeline.events["a"])
+
+    assert not timeline.redis.exists(*snapshot_keys(REQUEST.id))
+    assert ids(load_snapshot(REQUEST)) == TOP_LEVEL
+    assert timeline.serialized == TOP_LEVEL + TOP_LEVEL
+
+
+def test_self_healing(timeline: Timeline) -> None:
+    """A snapshot whose number of events differs from the database is rebuilt."""
+    load_snapshot(REQUEST)
+
+    # e.g. the append was lost
+    timeline.add("c", {"user": "2"})
+
+    assert ids(load_snapshot(REQUEST)) == [*TOP_LEVEL, "c"]
+    assert timeline.serialized == [*TOP_LEVEL, *TOP_LEVEL, "c"]
+
+
+def test_viewer_overlay(timeline: Timeline) -> None:
+    """Each viewer gets their own permissions, and only curators the system's comments."""
+    first = timeline_snapshot(user(1), REQUEST.id)
+    second = timeline_snapshot(user(2), REQUEST.id)
+    curator = timeline_snapshot(user(3, RoleNeed("curator")), REQUEST.id)
+
+    assert ids(first) == ids(second) == ["a", "b"]
+    assert ids(curator) == TOP_LEVEL
+    assert [e["permissions"]["can_update_comment"] for e in first] == [True, False]
+    assert [e["permissions"]["can_update_comment"] for e in second] == [False, True]
+    assert not any(e["permissions"]["can_update_comment"] for e in curator)
+    assert timeline.serialized == TOP_LEVEL